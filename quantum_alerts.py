@@ -0,0 +1,148 @@
+# Quantum Alert Broker
+# In-process pub/sub for real-time alerts (critical attrition risk, top-tier candidates) served over SSE
+
+import os
+import json
+import asyncio
+import itertools
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from quantum_analysis_store import TOP_TIER_DECISIONS
+
+ALERT_CRITICAL_RISK = 'CRITICAL_RISK'
+ALERT_TOP_TIER_CANDIDATE = 'TOP_TIER_CANDIDATE'
+
+
+class QuantumAlertSubscription:
+    """One client's bounded buffer; when it is full the oldest alert is dropped, never the publisher blocked"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_buffer: int):
+        self._loop = loop
+        self._buffer = deque()
+        self._max_buffer = max_buffer
+        self._ready = asyncio.Event()
+        self.dropped = 0
+
+    def _offer(self, event: Dict):
+        # Runs on the subscriber's event loop
+        if len(self._buffer) >= self._max_buffer:
+            self._buffer.popleft()
+            self.dropped += 1
+        self._buffer.append(event)
+        self._ready.set()
+
+    async def next_event(self, timeout: float) -> Optional[Dict]:
+        """Next alert, or None after timeout seconds without one"""
+        if not self._buffer:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._buffer.popleft()
+
+
+class QuantumAlertBroker:
+    """
+    Fan-out of alerts to SSE subscribers
+    publish() is safe from any thread (inference workers, job threads); each subscriber has its own bounded
+    buffer, so one slow dashboard only loses its own oldest alerts. Recent alerts are kept for Last-Event-ID replay
+    """
+
+    def __init__(self, max_buffer: int = None, replay_size: int = None):
+        self.max_buffer = max_buffer or int(os.getenv('QUANTUM_ALERT_BUFFER', '256'))
+        self._replay = deque(maxlen=replay_size or int(os.getenv('QUANTUM_ALERT_REPLAY', '500')))
+        self._subscribers: List[QuantumAlertSubscription] = []
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+        self.stats = {'published': 0, 'delivered': 0, 'dropped': 0}
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> QuantumAlertSubscription:
+        subscription = QuantumAlertSubscription(asyncio.get_running_loop(), self.max_buffer)
+        with self._lock:
+            if last_event_id is not None:
+                for event in self._replay:
+                    if event['id'] > last_event_id:
+                        subscription._offer(event)
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: QuantumAlertSubscription):
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+                self.stats['dropped'] += subscription.dropped
+
+    def publish(self, alert_type: str, payload: Dict) -> Dict:
+        with self._lock:
+            event = {
+                'id': next(self._sequence),
+                'type': alert_type,
+                'timestamp': datetime.now().isoformat(),
+                **payload
+            }
+            self._replay.append(event)
+            subscribers = list(self._subscribers)
+            self.stats['published'] += 1
+            self.stats['delivered'] += len(subscribers)
+
+        for subscription in subscribers:
+            try:
+                subscription._loop.call_soon_threadsafe(subscription._offer, event)
+            except RuntimeError:
+                self.unsubscribe(subscription)  # its event loop is gone
+        return event
+
+    def publish_employee_alerts(self, employees: List[Dict], records: List[Dict], source: str):
+        """CRITICAL attrition risk detections from batch records (build_batch_record output)"""
+        for employee, record in zip(employees, records):
+            if 'error' not in record and record.get('risk_level') == 'CRITICAL':
+                self.publish(ALERT_CRITICAL_RISK, {
+                    'employee_id': record.get('employee_id', 'unknown'),
+                    'name': record.get('name'),
+                    'department': employee.get('department'),
+                    '3_month_risk': record.get('temporal_risk', {}).get('3_month_risk'),
+                    'source': source
+                })
+
+    def publish_candidate_alerts(self, candidates: List[Dict], analyses: List[Dict], source: str):
+        """Top-tier hiring recommendations from candidate analyses"""
+        for candidate, analysis in zip(candidates, analyses):
+            if 'error' in analysis:
+                continue
+            recommendation = analysis['hiring_recommendation']
+            if recommendation['decision'] in TOP_TIER_DECISIONS:
+                self.publish(ALERT_TOP_TIER_CANDIDATE, {
+                    'candidate_id': candidate.get('candidate_id'),
+                    'name': candidate.get('name'),
+                    'decision': recommendation['decision'],
+                    'quantum_final_score': analysis['quantum_scores']['quantum_final_score'],
+                    'source': source
+                })
+
+    def on_analyses_recorded(self, kind: str, items: List[Dict], results: List[Dict], source: str):
+        """QuantumAnalysisStore listener, so every write path (API, jobs, bulk ingestion) raises its alerts"""
+        if kind == 'employee':
+            self.publish_employee_alerts(items, results, source)
+        elif kind == 'candidate':
+            self.publish_candidate_alerts(items, results, source)
+
+    def recent(self, limit: int = 20) -> List[Dict]:
+        with self._lock:
+            return list(self._replay)[-limit:][::-1]
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                **self.stats,
+                'subscribers': len(self._subscribers),
+                'dropped': self.stats['dropped'] + sum(subscription.dropped for subscription in self._subscribers),
+                'max_buffer': self.max_buffer
+            }
+
+
+def format_sse(event: Dict) -> str:
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
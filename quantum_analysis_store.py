@@ -0,0 +1,533 @@
+# Quantum Analysis Store
+# Embedded SQLite store of every employee and candidate analysis, with per-day rollup tables for the dashboard
+
+import os
+import json
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+DEFAULT_ANALYSIS_DB = os.path.join('.quantum_cache', 'analyses.sqlite3')
+
+# Engagement quantum level counted as a highly engaged employee
+HIGH_ENGAGEMENT_THRESHOLD = 75
+
+# Hiring decisions counted as top-tier candidates / hire recommendations
+TOP_TIER_DECISIONS = ('IMMEDIATE HIRE', 'STRONG HIRE')
+HIRE_DECISIONS = ('IMMEDIATE HIRE', 'STRONG HIRE', 'HIRE')
+
+logger = logging.getLogger("QuantumHR-AnalysisStore")
+
+_EMPLOYEE_ROLLUP_COLUMNS = (
+    'analyses', 'critical', 'high_risk', 'high_engagement',
+    'engagement_sum', 'attrition_1m_sum', 'attrition_3m_sum', 'success_sum'
+)
+_CANDIDATE_ROLLUP_COLUMNS = ('candidates', 'top_tier', 'hire_recommendations', 'score_sum')
+# Distinct employees per department, judged by each employee's latest analysis
+_DISTINCT_COLUMNS = ('employees', 'critical', 'high_engagement')
+
+# employee_id stored for records without one; each such analysis counts as its own employee
+ANONYMOUS_EMPLOYEE_ID = 'unknown'
+
+
+def _rollup_upsert(table: str, keys: tuple, columns: tuple) -> str:
+    """INSERT ... ON CONFLICT that adds the new row's counters onto the existing bucket"""
+    all_columns = keys + columns
+    return (
+        f"INSERT INTO {table} ({', '.join(all_columns)}) VALUES ({', '.join('?' * len(all_columns))}) "
+        f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET "
+        + ', '.join(f"{column} = {column} + excluded.{column}" for column in columns)
+    )
+
+
+class QuantumAnalysisStore:
+    """
+    Append-only analysis history plus rollup tables maintained in the same transaction as each write
+    The rollups are mirrored in memory as day x department buckets with running totals, updated on every
+    write, so dashboard reads only ask SQLite whether another process has committed since (PRAGMA data_version
+    on the store's own connection) and reload the rollup tables if so; the assembled dashboard is cached until
+    the next write, from any process. Employee counts (as opposed to analysis counts) come from
+    employee_latest, one row per employee_id
+    """
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or os.getenv('QUANTUM_ANALYSIS_DB', DEFAULT_ANALYSIS_DB)
+        # Guards the store connection; held while a write's deltas are mirrored so a reload can't double count
+        self._write_lock = threading.Lock()
+        self._aggregate_lock = threading.Lock()
+        self._reset_aggregates()
+        self._data_version = None
+        self._listeners = []
+        self.stats = {'dashboard_cache_hits': 0, 'dashboard_rebuilds': 0, 'invalidations': 0, 'external_reloads': 0}
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # All writes go through this one connection: its data_version only moves for other connections' commits
+        self._db = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._write_lock, self._db as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript("""
+                CREATE TABLE IF NOT EXISTS employee_analyses (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    employee_id TEXT,
+                    name TEXT,
+                    department TEXT NOT NULL,
+                    risk_level TEXT NOT NULL,
+                    engagement REAL,
+                    attrition_1m REAL,
+                    attrition_3m REAL,
+                    success_probability REAL,
+                    source TEXT NOT NULL,
+                    analyzed_at TEXT NOT NULL,
+                    payload TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_employee_department ON employee_analyses(department, analyzed_at);
+                CREATE INDEX IF NOT EXISTS idx_employee_risk ON employee_analyses(risk_level, analyzed_at);
+                CREATE INDEX IF NOT EXISTS idx_employee_analyzed_at ON employee_analyses(analyzed_at);
+
+                CREATE TABLE IF NOT EXISTS candidate_analyses (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    candidate_id TEXT,
+                    name TEXT,
+                    final_score REAL,
+                    decision TEXT,
+                    source TEXT NOT NULL,
+                    analyzed_at TEXT NOT NULL,
+                    payload TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_candidate_decision ON candidate_analyses(decision, analyzed_at);
+                CREATE INDEX IF NOT EXISTS idx_candidate_analyzed_at ON candidate_analyses(analyzed_at);
+
+                CREATE TABLE IF NOT EXISTS employee_rollup (
+                    day TEXT NOT NULL,
+                    department TEXT NOT NULL,
+                    analyses INTEGER NOT NULL DEFAULT 0,
+                    critical INTEGER NOT NULL DEFAULT 0,
+                    high_risk INTEGER NOT NULL DEFAULT 0,
+                    high_engagement INTEGER NOT NULL DEFAULT 0,
+                    engagement_sum REAL NOT NULL DEFAULT 0,
+                    attrition_1m_sum REAL NOT NULL DEFAULT 0,
+                    attrition_3m_sum REAL NOT NULL DEFAULT 0,
+                    success_sum REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, department)
+                );
+                CREATE TABLE IF NOT EXISTS candidate_rollup (
+                    day TEXT PRIMARY KEY,
+                    candidates INTEGER NOT NULL DEFAULT 0,
+                    top_tier INTEGER NOT NULL DEFAULT 0,
+                    hire_recommendations INTEGER NOT NULL DEFAULT 0,
+                    score_sum REAL NOT NULL DEFAULT 0
+                );
+
+                CREATE TABLE IF NOT EXISTS employee_latest (
+                    employee_id TEXT PRIMARY KEY,
+                    department TEXT NOT NULL,
+                    critical INTEGER NOT NULL,
+                    high_engagement INTEGER NOT NULL,
+                    analyzed_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS employee_distinct (
+                    department TEXT PRIMARY KEY,
+                    employees INTEGER NOT NULL DEFAULT 0,
+                    critical INTEGER NOT NULL DEFAULT 0,
+                    high_engagement INTEGER NOT NULL DEFAULT 0
+                );
+            """)
+            self._backfill_distinct(db)
+        with self._write_lock:
+            self._load_aggregates()
+
+    def _reset_aggregates(self):
+        self._employee_buckets: Dict[tuple, List] = {}
+        self._candidate_buckets: Dict[str, List] = {}
+        self._employee_total = [0] * len(_EMPLOYEE_ROLLUP_COLUMNS)
+        self._department_totals: Dict[str, List] = {}
+        self._candidate_total = [0] * len(_CANDIDATE_ROLLUP_COLUMNS)
+        self._distinct_departments: Dict[str, List] = {}
+        self._distinct_total = [0] * len(_DISTINCT_COLUMNS)
+        self._dashboard_cache = None
+
+    def _load_aggregates(self):
+        """Replace the in-memory aggregates with the rollup tables; call with _write_lock held"""
+        # Version first: a commit landing during the reads moves it again, so it is reloaded next time
+        self._data_version = self._db.execute("PRAGMA data_version").fetchone()[0]
+        with self._db as db:
+            db.execute("BEGIN")
+            employee_rollups = db.execute("SELECT * FROM employee_rollup").fetchall()
+            candidate_rollups = db.execute("SELECT * FROM candidate_rollup").fetchall()
+            distinct_rollups = db.execute("SELECT * FROM employee_distinct").fetchall()
+
+        with self._aggregate_lock:
+            self._reset_aggregates()
+            for row in employee_rollups:
+                self._apply_employee_bucket(row['day'], row['department'], [row[c] for c in _EMPLOYEE_ROLLUP_COLUMNS])
+            for row in candidate_rollups:
+                self._apply_candidate_bucket(row['day'], [row[c] for c in _CANDIDATE_ROLLUP_COLUMNS])
+            for row in distinct_rollups:
+                self._apply_distinct(row['department'], [row[c] for c in _DISTINCT_COLUMNS])
+
+    def _catch_up(self):
+        """Reload the aggregates if another connection (another worker process) has committed since the last load"""
+        with self._write_lock:
+            if self._db.execute("PRAGMA data_version").fetchone()[0] != self._data_version:
+                self._load_aggregates()
+                self.stats['external_reloads'] += 1
+
+    @staticmethod
+    def _backfill_distinct(db):
+        """Build employee_latest / employee_distinct from the history of a database created before they existed"""
+        db.execute("BEGIN IMMEDIATE")
+        if db.execute("SELECT 1 FROM employee_distinct LIMIT 1").fetchone() is not None:
+            return
+        db.execute(
+            "INSERT INTO employee_latest (employee_id, department, critical, high_engagement, analyzed_at) "
+            "SELECT employee_id, department, risk_level = 'CRITICAL', engagement >= ?, analyzed_at "
+            "FROM employee_analyses WHERE id IN ("
+            "SELECT MAX(id) FROM employee_analyses WHERE employee_id != ? GROUP BY employee_id)",
+            (HIGH_ENGAGEMENT_THRESHOLD, ANONYMOUS_EMPLOYEE_ID)
+        )
+        db.execute(
+            "INSERT INTO employee_distinct (department, employees, critical, high_engagement) "
+            "SELECT department, COUNT(*), SUM(critical), SUM(high_engagement) FROM ("
+            "SELECT department, critical, high_engagement FROM employee_latest UNION ALL "
+            "SELECT department, risk_level = 'CRITICAL', engagement >= ? FROM employee_analyses WHERE employee_id = ?"
+            ") GROUP BY department",
+            (HIGH_ENGAGEMENT_THRESHOLD, ANONYMOUS_EMPLOYEE_ID)
+        )
+
+    @staticmethod
+    def _add_into(target: List, values: List):
+        for i, value in enumerate(values):
+            target[i] += value
+
+    def _apply_employee_bucket(self, day: str, department: str, values: List):
+        self._add_into(self._employee_buckets.setdefault((day, department), [0] * len(values)), values)
+        self._add_into(self._department_totals.setdefault(department, [0] * len(values)), values)
+        self._add_into(self._employee_total, values)
+
+    def _apply_candidate_bucket(self, day: str, values: List):
+        self._add_into(self._candidate_buckets.setdefault(day, [0] * len(values)), values)
+        self._add_into(self._candidate_total, values)
+
+    def _apply_distinct(self, department: str, values: List):
+        self._add_into(self._distinct_departments.setdefault(department, [0] * len(values)), values)
+        self._add_into(self._distinct_total, values)
+
+    @staticmethod
+    def _distinct_deltas(db, latest: Dict[str, tuple], anonymous: List[tuple]) -> Dict[str, List]:
+        """
+        Per-department change in distinct employees when `latest` (employee_id -> (department, critical,
+        high_engagement)) replaces each employee's previous state; call inside the write transaction
+        """
+        deltas: Dict[str, List] = {}
+        previous = {}
+        employee_ids = list(latest)
+        for start in range(0, len(employee_ids), 500):
+            chunk = employee_ids[start:start + 500]
+            for row in db.execute(
+                "SELECT employee_id, department, critical, high_engagement FROM employee_latest "
+                f"WHERE employee_id IN ({', '.join('?' * len(chunk))})", chunk
+            ):
+                previous[row['employee_id']] = (row['department'], row['critical'], row['high_engagement'])
+        for employee_id, (department, critical, high_engagement) in latest.items():
+            if employee_id in previous:
+                old_department, old_critical, old_high_engagement = previous[employee_id]
+                QuantumAnalysisStore._add_into(
+                    deltas.setdefault(old_department, [0, 0, 0]), (-1, -old_critical, -old_high_engagement)
+                )
+            QuantumAnalysisStore._add_into(deltas.setdefault(department, [0, 0, 0]), (1, critical, high_engagement))
+        for department, critical, high_engagement in anonymous:
+            QuantumAnalysisStore._add_into(deltas.setdefault(department, [0, 0, 0]), (1, critical, high_engagement))
+        return deltas
+
+    def add_listener(self, listener):
+        """Call listener(kind, items, results, source) after each committed write; kind is 'employee' or 'candidate'"""
+        self._listeners.append(listener)
+
+    def _notify(self, kind: str, items: List[Dict], results: List[Dict], source: str):
+        for listener in self._listeners:
+            try:
+                listener(kind, items, results, source)
+            except Exception as e:
+                # A listener must never fail a write that has already committed
+                logger.warning(f"Analysis store listener failed: {str(e)}")
+
+    def _invalidate(self):
+        self._dashboard_cache = None
+        self.stats['invalidations'] += 1
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=30)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def record_employee_analyses(self, employees: List[Dict], records: List[Dict], source: str) -> int:
+        """
+        Store batch records (build_batch_record output) with their employees; error records are skipped
+        Returns the number of analyses written
+        """
+        now = datetime.now()
+        analyzed_at, day = now.isoformat(), now.date().isoformat()
+        rows, rollups = [], {}
+        latest, anonymous = {}, []
+        for employee, record in zip(employees, records):
+            if 'error' in record:
+                continue
+            department = str(employee.get('department') or 'Unknown')
+            temporal_risk = record.get('temporal_risk', {})
+            engagement = float(record.get('engagement_score', 0))
+            risk_level = record.get('risk_level', 'UNKNOWN')
+            attrition_1m = float(temporal_risk.get('1_month_risk', 0))
+            attrition_3m = float(temporal_risk.get('3_month_risk', 0))
+            success = float(record.get('intervention_blueprint', {}).get('success_probability', 0))
+
+            employee_id = str(record.get('employee_id', ANONYMOUS_EMPLOYEE_ID))
+            rows.append((
+                employee_id, record.get('name'), department, risk_level, engagement,
+                attrition_1m, attrition_3m, success, source, analyzed_at, json.dumps(record, default=str)
+            ))
+            state = (department, int(risk_level == 'CRITICAL'), int(engagement >= HIGH_ENGAGEMENT_THRESHOLD))
+            if employee_id == ANONYMOUS_EMPLOYEE_ID:
+                anonymous.append(state)
+            else:
+                latest[employee_id] = state  # the last record of a repeated employee wins
+            bucket = rollups.setdefault(department, [0, 0, 0, 0, 0.0, 0.0, 0.0, 0.0])
+            for i, value in enumerate((
+                1, risk_level == 'CRITICAL', risk_level in ('CRITICAL', 'HIGH'),
+                engagement >= HIGH_ENGAGEMENT_THRESHOLD, engagement, attrition_1m, attrition_3m, success
+            )):
+                bucket[i] += value
+
+        if not rows:
+            return 0
+        with self._write_lock:
+            with self._db as db:
+                # Write lock up front: the previous-state reads must not race another process's write
+                db.execute("BEGIN IMMEDIATE")
+                distinct = self._distinct_deltas(db, latest, anonymous)
+                db.executemany(
+                    "INSERT INTO employee_analyses (employee_id, name, department, risk_level, engagement, attrition_1m, "
+                    "attrition_3m, success_probability, source, analyzed_at, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                db.executemany(
+                    _rollup_upsert('employee_rollup', ('day', 'department'), _EMPLOYEE_ROLLUP_COLUMNS),
+                    [(day, department, *bucket) for department, bucket in rollups.items()]
+                )
+                db.executemany(
+                    "INSERT INTO employee_latest (employee_id, department, critical, high_engagement, analyzed_at) "
+                    "VALUES (?, ?, ?, ?, ?) ON CONFLICT (employee_id) DO UPDATE SET department = excluded.department, "
+                    "critical = excluded.critical, high_engagement = excluded.high_engagement, "
+                    "analyzed_at = excluded.analyzed_at",
+                    [(employee_id, *state, analyzed_at) for employee_id, state in latest.items()]
+                )
+                db.executemany(
+                    _rollup_upsert('employee_distinct', ('department',), _DISTINCT_COLUMNS),
+                    [(department, *delta) for department, delta in distinct.items()]
+                )
+
+            # Mirror the committed deltas in memory before releasing the connection
+            with self._aggregate_lock:
+                for department, bucket in rollups.items():
+                    self._apply_employee_bucket(day, department, bucket)
+                for department, delta in distinct.items():
+                    self._apply_distinct(department, delta)
+                self._invalidate()
+        self._notify('employee', employees, records, source)
+        return len(rows)
+
+    def record_candidate_analyses(self, candidates: List[Dict], analyses: List[Dict], source: str) -> int:
+        """Store analyze_candidate_neural_profile results; error results are skipped"""
+        now = datetime.now()
+        analyzed_at, day = now.isoformat(), now.date().isoformat()
+        rows, bucket = [], [0, 0, 0, 0.0]
+        for candidate, analysis in zip(candidates, analyses):
+            if 'error' in analysis:
+                continue
+            final_score = float(analysis['quantum_scores']['quantum_final_score'])
+            decision = analysis['hiring_recommendation']['decision']
+            rows.append((
+                str(candidate.get('candidate_id', 'unknown')), candidate.get('name'), final_score, decision,
+                source, analyzed_at, json.dumps(analysis, default=str)
+            ))
+            for i, value in enumerate((1, decision in TOP_TIER_DECISIONS, decision in HIRE_DECISIONS, final_score)):
+                bucket[i] += value
+
+        if not rows:
+            return 0
+        with self._write_lock:
+            with self._db as db:
+                db.executemany(
+                    "INSERT INTO candidate_analyses (candidate_id, name, final_score, decision, source, analyzed_at, "
+                    "payload) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                db.execute(_rollup_upsert('candidate_rollup', ('day',), _CANDIDATE_ROLLUP_COLUMNS), (day, *bucket))
+
+            with self._aggregate_lock:
+                self._apply_candidate_bucket(day, bucket)
+                self._invalidate()
+        self._notify('candidate', candidates, analyses, source)
+        return len(rows)
+
+    def _employee_window(self, since: date, until: date) -> Dict:
+        """Summed buckets for a day range: at most (days in range x departments) lookups, independent of history"""
+        totals = [0] * len(_EMPLOYEE_ROLLUP_COLUMNS)
+        departments = list(self._department_totals)
+        day = since
+        while day <= until:
+            for department in departments:
+                bucket = self._employee_buckets.get((day.isoformat(), department))
+                if bucket is not None:
+                    self._add_into(totals, bucket)
+            day += timedelta(days=1)
+        return dict(zip(_EMPLOYEE_ROLLUP_COLUMNS, totals))
+
+    def dashboard_metrics(self) -> Dict:
+        """CEO dashboard metrics from the in-memory aggregates, cached until the next write (or day change)"""
+        self._catch_up()
+        today = date.today()
+        with self._aggregate_lock:
+            cache = self._dashboard_cache
+            if cache is not None and cache[0] == today:
+                self.stats['dashboard_cache_hits'] += 1
+                return cache[1]
+
+            metrics = build_dashboard_metrics(
+                employees=dict(zip(_EMPLOYEE_ROLLUP_COLUMNS, self._employee_total)),
+                departments={
+                    department: dict(zip(_EMPLOYEE_ROLLUP_COLUMNS, totals))
+                    for department, totals in self._department_totals.items()
+                },
+                distinct=dict(zip(_DISTINCT_COLUMNS, self._distinct_total)),
+                distinct_departments={
+                    department: dict(zip(_DISTINCT_COLUMNS, totals))
+                    for department, totals in self._distinct_departments.items()
+                },
+                candidates=dict(zip(_CANDIDATE_ROLLUP_COLUMNS, self._candidate_total)),
+                last_30=self._employee_window(today - timedelta(days=29), today),
+                prior_60=self._employee_window(today - timedelta(days=89), today - timedelta(days=30)),
+                employees_today=self._employee_window(today, today),
+                candidates_today=dict(zip(
+                    _CANDIDATE_ROLLUP_COLUMNS,
+                    self._candidate_buckets.get(today.isoformat(), [0] * len(_CANDIDATE_ROLLUP_COLUMNS))
+                ))
+            )
+            self._dashboard_cache = (today, metrics)
+            self.stats['dashboard_rebuilds'] += 1
+            return metrics
+
+    def get_stats(self) -> Dict:
+        with self._aggregate_lock:
+            return {
+                'db_path': self.db_path,
+                'employee_analyses': self._employee_total[0],
+                'distinct_employees': self._distinct_total[0],
+                'candidate_analyses': self._candidate_total[0],
+                'rollup_buckets': len(self._employee_buckets) + len(self._candidate_buckets),
+                **self.stats
+            }
+
+    def query_employee_analyses(self, department: Optional[str] = None, risk_level: Optional[str] = None,
+                                since: Optional[str] = None, limit: int = 100) -> List[Dict]:
+        """Most recent stored employee analyses, filtered on the indexed columns"""
+        where, params = [], []
+        for column, value in (('department', department), ('risk_level', risk_level)):
+            if value:
+                where.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            where.append("analyzed_at >= ?")
+            params.append(since)
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT id, department, analyzed_at, source, payload FROM employee_analyses"
+                + (f" WHERE {' AND '.join(where)}" if where else '')
+                + " ORDER BY analyzed_at DESC LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [
+            {'analysis_id': row['id'], 'department': row['department'], 'analyzed_at': row['analyzed_at'],
+             'source': row['source'], **json.loads(row['payload'])}
+            for row in rows
+        ]
+
+
+def _mean(total: float, count: int) -> float:
+    return round(total / count, 2) if count else 0.0
+
+
+def _engagement_trend(recent: Dict, prior: Dict) -> str:
+    if not recent['analyses'] or not prior['analyses']:
+        return 'insufficient data'
+    change = _mean(recent['engagement_sum'], recent['analyses']) - _mean(prior['engagement_sum'], prior['analyses'])
+    if change > 2:
+        return 'improving'
+    if change < -2:
+        return 'declining'
+    return 'stable'
+
+
+def build_dashboard_metrics(employees: Dict, departments: Dict, candidates: Dict, last_30: Dict, prior_60: Dict,
+                            employees_today: Dict, candidates_today: Dict, distinct: Dict,
+                            distinct_departments: Dict) -> Dict:
+    """
+    Shape rolled-up counters into the /ceo-dashboard metric sections
+    Employee counts are distinct employees by their latest analysis; rates and averages are over all analyses
+    """
+    analyses = employees['analyses']
+    screened = candidates['candidates']
+    no_employees = dict.fromkeys(_DISTINCT_COLUMNS, 0)
+    return {
+        'quantum_metrics': {
+            'total_employees_analyzed': distinct['employees'],
+            'total_analyses': analyses,
+            'critical_risk_employees': distinct['critical'],
+            'high_engagement_employees': distinct['high_engagement'],
+            'intervention_success_rate': _mean(employees['success_sum'], analyses),
+            'quantum_engagement_index': _mean(employees['engagement_sum'], analyses)
+        },
+        'neural_talent_metrics': {
+            'candidates_screened': screened,
+            'top_tier_candidates': candidates['top_tier'],
+            'average_neural_score': _mean(candidates['score_sum'], screened),
+            'hire_recommendation_rate': _mean(candidates['hire_recommendations'] * 100, screened)
+        },
+        'temporal_predictions': {
+            'next_month_attrition_risk': _mean(employees['attrition_1m_sum'], analyses),
+            'three_month_attrition_risk': _mean(employees['attrition_3m_sum'], analyses),
+            'quarterly_engagement_trend': _engagement_trend(last_30, prior_60)
+        },
+        'department_breakdown': {
+            department: {
+                'employees_analyzed': distinct_departments.get(department, no_employees)['employees'],
+                'analyses': totals['analyses'],
+                'critical_risk_employees': distinct_departments.get(department, no_employees)['critical'],
+                'quantum_engagement_index': _mean(totals['engagement_sum'], totals['analyses']),
+                'next_month_attrition_risk': _mean(totals['attrition_1m_sum'], totals['analyses'])
+            }
+            for department, totals in sorted(departments.items())
+        },
+        'real_time_alerts': [
+            alert for alert in (
+                {
+                    'type': 'CRITICAL_RISK',
+                    'message': f"{employees_today['critical']} employees analyzed today require immediate intervention"
+                } if employees_today['critical'] else None,
+                {
+                    'type': 'QUANTUM_OPPORTUNITY',
+                    'message': f"{candidates_today['top_tier']} top-tier candidates detected in today's pipeline"
+                } if candidates_today['top_tier'] else None
+            ) if alert is not None
+        ]
+    }
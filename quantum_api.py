@@ -1,27 +1,81 @@
 # Quantum HR Intelligence API - Revolutionary Deployment
 # FastAPI-based REST API for Neural Workforce Analytics
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, APIRouter
+from fastapi import FastAPI, HTTPException, UploadFile, File, APIRouter, Request, Header
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
 import uvicorn
+import os
 import json
 import io
+import asyncio
+import secrets
+import itertools
+import time
 from datetime import datetime
 import logging
 
 # Import our quantum neural architecture
 from quantum_neural_architecture import QuantumWorkforceIntelligence, NeuralTalentAcquisitionSystem
+from quantum_model_registry import model_registry
+from quantum_llm_client import llm_client
+from quantum_embedding_store import embedding_store, text_hash as embedding_text_hash
+from quantum_batch_insights import QuantumBatchAggregator, build_batch_record
+from quantum_jobs import QuantumJobManager
+from quantum_executor import QuantumInferenceExecutor
+from quantum_microbatch import QuantumMicroBatcher
+from quantum_skill_taxonomy import skill_taxonomy
+from quantum_candidate_index import QuantumCandidateIndex, SEARCH_AUTO
+from quantum_analysis_store import QuantumAnalysisStore
+from quantum_resume_ingestion import QuantumBulkResumeIngestor, QuantumResumeStore
+from quantum_alerts import QuantumAlertBroker, format_sse
+from quantum_metrics import metrics, request_spans, server_timing_header
+from quantum_profiler import DEFAULT_FOCUS, QuantumProfilerBusy, profiler
+from quantum_document_extraction import (
+    DocumentExtractionError, DocumentTooLargeError, UnsupportedDocumentError, spool_upload, upload_limits
+)
 
 # Configure revolutionary logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("QuantumHR-API")
 
-# Initialize Quantum AI Systems
+# Initialize Quantum AI Systems (embedding models load lazily from the shared registry)
 quantum_workforce = QuantumWorkforceIntelligence()
 neural_talent_system = NeuralTalentAcquisitionSystem()
 
+# CPU-bound inference runs on a thread or process pool, never on the event loop
+inference_executor = QuantumInferenceExecutor(quantum_workforce, neural_talent_system)
+
+# Concurrent /psychology-analysis requests share one batched embedding + forward pass
+MICRO_BATCHING_ENABLED = os.getenv('QUANTUM_MICROBATCH_ENABLED', 'true').lower() == 'true'
+psychology_batcher = QuantumMicroBatcher(
+    lambda feedback_texts: inference_executor.run('psychological_outputs', feedback_texts)
+)
+
+# Every analysis is recorded here; the dashboard reads its rollups
+analysis_store = QuantumAnalysisStore()
+
+# CRITICAL-risk and top-tier candidate alerts are pushed to SSE subscribers as analyses are recorded
+alert_broker = QuantumAlertBroker()
+analysis_store.add_listener(alert_broker.on_analyses_recorded)
+ALERT_KEEPALIVE_SECONDS = float(os.getenv('QUANTUM_ALERT_KEEPALIVE_SECONDS', '15'))
+
+# Upper bound on candidate-search results per request
+MAX_SEARCH_TOP_K = int(os.getenv('QUANTUM_SEARCH_MAX_TOP_K', '1000'))
+
+# Durable job queue for bulk analyses
+job_manager = QuantumJobManager(quantum_workforce, analysis_store=analysis_store)
+
+# Embeddings of analyzed resumes for semantic candidate search
+candidate_index = QuantumCandidateIndex()
+
+# Bulk resume ingestion into the resume store and candidate index
+resume_store = QuantumResumeStore()
+resume_ingestor = QuantumBulkResumeIngestor(inference_executor, resume_store, candidate_index, analysis_store)
+
 # Revolutionary FastAPI App
 app = FastAPI(
     title="Quantum HR Intelligence API",
@@ -40,9 +94,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request stage breakdown in a Server-Timing header: always, or only for requests sending X-Quantum-Server-Timing: 1
+SERVER_TIMING_ENABLED = os.getenv('QUANTUM_SERVER_TIMING', 'false').lower() == 'true'
+
+@app.middleware("http")
+async def quantum_request_metrics(request: Request, call_next):
+    """Request latency by route template, and the optional Server-Timing header from the request's stage spans"""
+    started = time.perf_counter()
+    with request_spans() as spans:
+        response = await call_next(request)
+    elapsed = time.perf_counter() - started
+    route = request.scope.get('route')
+    metrics.observe(
+        'quantum_http_request_seconds', elapsed,
+        method=request.method, route=route.path if route is not None else 'unmatched', status=str(response.status_code)
+    )
+    if SERVER_TIMING_ENABLED or request.headers.get('x-quantum-server-timing') == '1':
+        response.headers['Server-Timing'] = server_timing_header(spans, elapsed)
+    return response
+
+# Upper bound on employees per batch request
+MAX_BATCH_SIZE = 5000
+
+# Employees scored per vectorized pass when streaming batch results
+STREAM_CHUNK_SIZE = 64
+
 # Create Quantum API Router with versioned prefix
 quantum_router = APIRouter(prefix="/api/quantum/v1", tags=["Quantum Intelligence APIs"])
 
+# Bulk analysis job API alongside the quantum router
+job_router = APIRouter(prefix="/api/quantum/v1/jobs", tags=["Quantum Jobs"])
+
 # Revolutionary Pydantic Models
 class EmployeeFeedbackRequest(BaseModel):
     employee_data: Dict
@@ -71,6 +153,20 @@ class NeuralCandidateResponse(BaseModel):
     processing_timestamp: str
 
 class BatchAnalysisRequest(BaseModel):
+    employees: List[Dict]
+    analysis_type: str = "comprehensive"  # "rapid" skips Gemini insights for large batches
+
+class MicroBatchingConfig(BaseModel):
+    max_batch_size: Optional[int] = None
+    max_wait_ms: Optional[float] = None
+
+class CandidateSearchRequest(BaseModel):
+    job_description: str
+    top_k: int = Field(10, ge=1, le=MAX_SEARCH_TOP_K)
+    mode: str = SEARCH_AUTO  # "exact" (brute force), "ivf" (approximate) or "auto" by index size
+    nprobe: Optional[int] = Field(None, ge=1)
+
+class JobRequest(BaseModel):
     employees: List[Dict]
     analysis_type: str = "comprehensive"
 
@@ -104,27 +200,29 @@ async def analyze_employee_quantum_psychology(request: EmployeeFeedbackRequest):
     try:
         logger.info(f"Processing quantum analysis for employee: {request.employee_data.get('name', 'Anonymous')}")
         
-        # Quantum psychological state analysis
-        quantum_matrix = quantum_workforce.analyze_quantum_psychological_state(
+        # Embedding + neural forward pass, coalesced with concurrent requests
+        psychological_output = None
+        if MICRO_BATCHING_ENABLED:
+            with metrics.stage('batched_psychology_inference'):
+                psychological_output = await psychology_batcher.submit(request.feedback_text)
+        
+        # Psychological state, temporal attrition risk and interventions, run on the inference executor
+        analysis = await inference_executor.run(
+            'psychology_analysis',
             request.feedback_text,
             request.employee_data,
             request.include_neurological_patterns,
-            request.behavioral_prediction_horizon
-        )
-        
-        # Temporal attrition risk prediction
-        temporal_risk = quantum_workforce.predict_temporal_attrition_risk(
-            quantum_matrix,
-            request.employee_data,
-            [1, 3, 6, 12]
-        )
-        
-        # AI-engineered intervention strategies
-        intervention_blueprint = quantum_workforce.engineer_personalized_interventions(
-            quantum_matrix,
-            request.employee_data,
-            0.85
+            request.behavioral_prediction_horizon,
+            psychological_output
         )
+        quantum_matrix = analysis['quantum_matrix']
+        temporal_risk = analysis['temporal_risk']
+        intervention_blueprint = analysis['intervention_blueprint']
+        await record_employee_analyses([request.employee_data], [build_batch_record(request.employee_data, {
+            'quantum_analysis': quantum_matrix,
+            'temporal_risk': temporal_risk,
+            'intervention_blueprint': intervention_blueprint
+        })], 'psychology_analysis')
         
         # Compile predictive analytics
         predictive_analytics = {
@@ -158,10 +256,13 @@ async def analyze_candidate_neural_profile(request: CandidateResumeRequest):
         logger.info(f"Processing neural candidate analysis for: {request.candidate_data.get('name', 'Anonymous')}")
         
         # Neural candidate profile analysis
-        neural_analysis = neural_talent_system.analyze_candidate_neural_profile(
+        neural_analysis = await inference_executor.run(
+            'candidate_analysis',
             request.resume_text,
             request.candidate_data
         )
+        await index_analyzed_candidate(request.resume_text, request.candidate_data, neural_analysis)
+        await record_candidate_analyses([request.candidate_data], [neural_analysis], 'neural_talent_analysis')
         
         return NeuralCandidateResponse(
             neural_profile=neural_analysis['neural_profile'],
@@ -176,6 +277,65 @@ async def analyze_candidate_neural_profile(request: CandidateResumeRequest):
         logger.error(f"Neural candidate analysis error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Neural analysis failed: {str(e)}")
 
+async def record_employee_analyses(employees: List[Dict], records: List[Dict], source: str):
+    """Persist employee batch records to the analysis store; storage failures never fail the analysis"""
+    try:
+        await run_in_threadpool(analysis_store.record_employee_analyses, employees, records, source)
+    except Exception as e:
+        logger.warning(f"Recording employee analyses failed: {str(e)}")
+
+async def record_candidate_analyses(candidates: List[Dict], analyses: List[Dict], source: str):
+    """Persist candidate analyses to the analysis store; storage failures never fail the analysis"""
+    try:
+        await run_in_threadpool(analysis_store.record_candidate_analyses, candidates, analyses, source)
+    except Exception as e:
+        logger.warning(f"Recording candidate analyses failed: {str(e)}")
+
+async def index_analyzed_candidate(resume_text: str, candidate_data: Dict, neural_analysis: Dict):
+    """Embed an analyzed resume into the candidate index; indexing failures never fail the analysis"""
+    try:
+        candidate_id = candidate_data.get('candidate_id') or embedding_text_hash(resume_text)[:16]
+        vectors = await inference_executor.run('resume_embeddings', [resume_text])
+        await run_in_threadpool(candidate_index.add, [candidate_id], vectors, [{
+            'name': candidate_data.get('name', 'Anonymous'),
+            'skills': neural_analysis['neural_profile'].get('skills', [])
+        }])
+    except Exception as e:
+        logger.warning(f"Candidate indexing failed: {str(e)}")
+
+@quantum_router.post("/candidate-search", tags=["Neural Talent Acquisition"])
+async def search_candidates(request: CandidateSearchRequest):
+    """
+    Semantic Candidate Search
+    Top-k indexed candidates most similar to a job description
+    """
+    try:
+        query = await inference_executor.run('resume_embeddings', [request.job_description])
+        started = time.perf_counter()
+        matches = await run_in_threadpool(candidate_index.search, query[0], request.top_k, request.mode, request.nprobe)
+        return {
+            'matches': matches,
+            'indexed_candidates': len(candidate_index),
+            'search_mode': request.mode,
+            'search_ms': round((time.perf_counter() - started) * 1000, 3)
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Candidate search error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Candidate search failed: {str(e)}")
+
+@quantum_router.get("/micro-batching", tags=["Quantum Psychology"])
+async def get_micro_batching_stats():
+    """Micro-batching settings with p50/p99 latency per setting"""
+    return {'enabled': MICRO_BATCHING_ENABLED, **psychology_batcher.get_stats()}
+
+@quantum_router.put("/micro-batching", tags=["Quantum Psychology"])
+async def configure_micro_batching(config: MicroBatchingConfig):
+    """Retune max batch size / max wait; latency is reported separately for each setting"""
+    psychology_batcher.configure(config.max_batch_size, config.max_wait_ms)
+    return {'enabled': MICRO_BATCHING_ENABLED, **psychology_batcher.get_stats()}
+
 @quantum_router.post("/batch-psychology-analysis", tags=["Quantum Batch Processing"])
 async def quantum_batch_employee_analysis(request: BatchAnalysisRequest):
     """
@@ -183,61 +343,32 @@ async def quantum_batch_employee_analysis(request: BatchAnalysisRequest):
     Processes multiple employees simultaneously with neural optimization
     Optimized for faster processing with timeout management
     """
+    # Limit batch size to keep a single request within memory bounds (checked outside the try: a 400, not a 500)
+    if len(request.employees) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Batch size limited to {MAX_BATCH_SIZE} employees for optimal performance"
+        )
+    
     try:
         logger.info(f"Processing quantum batch analysis for {len(request.employees)} employees")
-          # Limit batch size to prevent timeouts
-        max_batch_size = 10
-        if len(request.employees) > max_batch_size:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Batch size limited to {max_batch_size} employees for optimal performance"
-            )
+        
+        # Vectorized quantum analysis: one embedding call and one forward pass per network
+        employees = [employee for employee in request.employees if 'feedback' in employee]
+        analyses = await inference_executor.run(
+            'workforce_batch',
+            employees,
+            include_ai_insights=request.analysis_type == "comprehensive"
+        )
         
         batch_results = []
         
-        for i, employee in enumerate(request.employees):
-            try:
-                if 'feedback' in employee:
-                    # Quantum employee analysis with timeout protection
-                    quantum_matrix = quantum_workforce.analyze_quantum_psychological_state(
-                        employee['feedback'],
-                        employee,
-                        True,
-                        12
-                    )
-                    
-                    temporal_risk = quantum_workforce.predict_temporal_attrition_risk(
-                        quantum_matrix,
-                        employee,
-                        [1, 3, 6, 12]
-                    )
-                    
-                    intervention_blueprint = quantum_workforce.engineer_personalized_interventions(
-                        quantum_matrix,
-                        employee,
-                        0.85
-                    )
-                    
-                    batch_results.append({
-                        'employee_id': employee.get('employee_id', 'unknown'),
-                        'name': employee.get('name', 'Anonymous'),
-                        'quantum_analysis': quantum_matrix,
-                        'temporal_risk': temporal_risk,
-                        'intervention_blueprint': intervention_blueprint,
-                        'risk_level': temporal_risk.get('overall_risk_level', 'UNKNOWN'),
-                        'engagement_score': quantum_matrix.get('engagement_metrics', {}).get('quantum_level', 0)
-                    })
-                    
-            except Exception as employee_error:
-                logger.warning(f"Error processing employee {i+1}: {str(employee_error)}")
+        for i, (employee, analysis) in enumerate(zip(employees, analyses)):
+            if 'error' in analysis:
                 # Continue processing other employees even if one fails
-                batch_results.append({
-                    'employee_id': employee.get('employee_id', 'unknown'),
-                    'name': employee.get('name', 'Anonymous'),
-                    'error': f"Processing failed: {str(employee_error)}",
-                    'risk_level': 'ERROR',
-                    'engagement_score': 0
-                })
+                logger.warning(f"Error processing employee {i+1}: {analysis['error']}")
+            batch_results.append(build_batch_record(employee, analysis))
+        await record_employee_analyses(employees, batch_results, 'batch_psychology_analysis')
         
         # Generate batch analytics summary
         summary = {
@@ -261,52 +392,189 @@ async def quantum_batch_employee_analysis(request: BatchAnalysisRequest):
         logger.error(f"Quantum batch analysis error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Quantum batch analysis failed: {str(e)}")
 
+@quantum_router.post("/batch-psychology-analysis/stream", tags=["Quantum Batch Processing"])
+async def quantum_batch_employee_analysis_stream(request: BatchAnalysisRequest):
+    """
+    Streaming Quantum Batch Analysis
+    Emits one NDJSON record per employee as soon as it is scored, then a summary record
+    built from running aggregates, so memory stays flat for any batch size
+    """
+    logger.info(f"Streaming quantum batch analysis for {len(request.employees)} employees")
+    include_ai_insights = request.analysis_type == "comprehensive"
+    
+    async def stream_records():
+        aggregator = QuantumBatchAggregator()
+        employees = (employee for employee in request.employees if 'feedback' in employee)
+        
+        while True:
+            chunk = list(itertools.islice(employees, STREAM_CHUNK_SIZE))
+            if not chunk:
+                break
+            
+            try:
+                analyses = await inference_executor.run(
+                    'workforce_batch',
+                    chunk,
+                    include_ai_insights=include_ai_insights
+                )
+            except Exception as chunk_error:
+                logger.warning(f"Error processing batch chunk: {str(chunk_error)}")
+                analyses = [{'error': f"Processing failed: {str(chunk_error)}"} for _ in chunk]
+            
+            records = [build_batch_record(employee, analysis) for employee, analysis in zip(chunk, analyses)]
+            await record_employee_analyses(chunk, records, 'batch_psychology_stream')
+            for record in records:
+                aggregator.add(record)
+                yield json.dumps({'type': 'employee', **record}) + "\n"
+        
+        yield json.dumps({
+            'type': 'summary',
+            'batch_summary': aggregator.summary(),
+            'quantum_insights': aggregator.insights()
+        }) + "\n"
+    
+    return StreamingResponse(stream_records(), media_type="application/x-ndjson")
+
+@job_router.post("", status_code=202)
+async def submit_quantum_job(request: JobRequest):
+    """
+    Submit a bulk workforce analysis job
+    Returns immediately; poll GET /jobs/{job_id} for progress
+    """
+    try:
+        job = await run_in_threadpool(job_manager.submit, request.employees, request.analysis_type)
+        logger.info(f"Queued quantum job {job['job_id']} for {job['total']} employees")
+        return job
+    except Exception as e:
+        logger.error(f"Job submission error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Job submission failed: {str(e)}")
+
+@job_router.get("/{job_id}")
+async def get_quantum_job(job_id: str):
+    """Job status and progress"""
+    job = await run_in_threadpool(job_manager.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+@job_router.get("/{job_id}/results")
+async def get_quantum_job_results(job_id: str, offset: int = 0, limit: int = 500):
+    """Per-employee results stored so far (partial while the job is running)"""
+    job = await run_in_threadpool(job_manager.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    results = await run_in_threadpool(job_manager.results, job_id, offset, min(limit, 5000))
+    return {
+        'job_id': job_id,
+        'status': job['status'],
+        'offset': offset,
+        'count': len(results),
+        'results': results
+    }
+
+@job_router.post("/{job_id}/cancel")
+async def cancel_quantum_job(job_id: str):
+    """Cancel a job; a running job stops after its current chunk"""
+    job = await run_in_threadpool(job_manager.cancel, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+@app.on_event("startup")
+async def resume_quantum_jobs():
+    """Pick up jobs interrupted by a restart"""
+    await run_in_threadpool(job_manager.resume_incomplete)
+
+@app.on_event("shutdown")
+async def shutdown_quantum_workers():
+    """Stop the inference and job worker pools"""
+    inference_executor.shutdown(wait=False)
+    job_manager.shutdown(wait=False)
+
 @app.post("/upload-resume", tags=["Document Processing"])
 async def upload_resume_analysis(file: UploadFile = File(...), candidate_name: str = "Anonymous"):
     """
     Revolutionary Resume Upload and Neural Analysis
     Processes uploaded resume files with quantum intelligence
     """
+    spooled = None
     try:
         logger.info(f"Processing uploaded resume for: {candidate_name}")
+        limits = upload_limits()
         
-        # Read uploaded file
-        contents = await file.read()
-        
-        # Basic text extraction (in production, use advanced document parsers)
-        if file.filename.endswith('.txt'):
-            resume_text = contents.decode('utf-8')
-        else:
-            # For PDF/DOCX, you'd use pdfplumber/python-docx
-            resume_text = "Resume content extraction would be implemented here for PDF/DOCX files"
+        # Spool the upload to disk in chunks, then extract PDF/DOCX/TXT text on the worker pool
+        spooled = await spool_upload(file, limits['max_bytes'])
+        extraction = await inference_executor.run(
+            'document_extraction', spooled['path'], file.filename, limits['max_pages'], limits['max_chars']
+        )
+        resume_text = extraction['text']
         
         # Prepare candidate data
         candidate_data = {
             'name': candidate_name,
             'filename': file.filename,
-            'file_size': len(contents),
+            'file_size': spooled['size_bytes'],
             'upload_timestamp': datetime.now().isoformat()
         }
         
         # Neural analysis
-        neural_analysis = neural_talent_system.analyze_candidate_neural_profile(
+        neural_analysis = await inference_executor.run(
+            'candidate_analysis',
             resume_text,
             candidate_data
         )
+        await index_analyzed_candidate(resume_text, candidate_data, neural_analysis)
+        await record_candidate_analyses([candidate_data], [neural_analysis], 'upload_resume')
         
         return {
             'upload_info': {
                 'filename': file.filename,
-                'size_bytes': len(contents),
+                'size_bytes': spooled['size_bytes'],
+                'format': extraction['format'],
+                'pages': extraction['pages'],
+                'pages_extracted': extraction['pages_extracted'],
+                'text_truncated': extraction['truncated'],
                 'candidate_name': candidate_name,
                 'processing_timestamp': datetime.now().isoformat()
             },
             'neural_analysis': neural_analysis
         }
         
+    except DocumentTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UnsupportedDocumentError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except DocumentExtractionError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
         logger.error(f"Resume upload analysis error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Resume analysis failed: {str(e)}")
+    finally:
+        if spooled is not None:
+            os.remove(spooled['path'])
+
+@app.post("/bulk-resume-ingestion", tags=["Document Processing"])
+async def bulk_resume_ingestion(files: List[UploadFile] = File(...), include_ai_assessment: bool = False,
+                                top_n: int = 100):
+    """
+    Bulk Resume Ingestion
+    Accepts many PDF/DOCX/TXT files and/or ZIP archives; returns candidates ranked by quantum final score
+    Gemini assessments are skipped unless include_ai_assessment is set
+    """
+    try:
+        logger.info(f"Bulk resume ingestion of {len(files)} uploads")
+        return await resume_ingestor.ingest(files, include_ai_assessment, top_n)
+    except Exception as e:
+        logger.error(f"Bulk resume ingestion error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Bulk resume ingestion failed: {str(e)}")
+
+@app.get("/bulk-resume-ingestion/{content_hash}", tags=["Document Processing"])
+async def get_ingested_resume(content_hash: str):
+    """Full stored analysis of one ingested resume"""
+    record = await run_in_threadpool(resume_store.get, content_hash)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return record
 
 @quantum_router.get("/ceo-dashboard", tags=["Quantum Analytics"])
 async def get_quantum_dashboard_data():
@@ -315,41 +583,15 @@ async def get_quantum_dashboard_data():
     Provides key metrics for executive and HR dashboards
     """
     try:
-        # Simulate dashboard metrics (in production, would pull from database)
+        # Metrics are incrementally maintained aggregates, cached until the next analysis is recorded; the
+        # check for other workers' writes can wait behind a write, so it stays off the event loop
+        dashboard_metrics = await run_in_threadpool(analysis_store.dashboard_metrics)
+        now = datetime.now().isoformat()
         dashboard_data = {
-            'quantum_metrics': {
-                'total_employees_analyzed': 250,
-                'critical_risk_employees': 15,
-                'high_engagement_employees': 180,
-                'intervention_success_rate': 87.5,
-                'quantum_engagement_index': 82.3
-            },
-            'neural_talent_metrics': {
-                'candidates_screened': 125,
-                'top_tier_candidates': 23,
-                'average_neural_score': 76.8,
-                'hiring_success_rate': 91.2,
-                'time_to_hire_reduction': '45%'
-            },
-            'temporal_predictions': {
-                'next_month_attrition_risk': 8.5,
-                'quarterly_engagement_trend': 'improving',
-                'intervention_roi': 340,
-                'predicted_savings': 125000
-            },
-            'real_time_alerts': [
-                {
-                    'type': 'CRITICAL_RISK',
-                    'message': '3 employees require immediate intervention',
-                    'timestamp': datetime.now().isoformat()
-                },
-                {
-                    'type': 'QUANTUM_OPPORTUNITY',
-                    'message': 'Exceptional candidate detected in pipeline',
-                    'timestamp': datetime.now().isoformat()
-                }
-            ],
-            'last_updated': datetime.now().isoformat()
+            **dashboard_metrics,
+            'real_time_alerts': [{**alert, 'timestamp': now} for alert in dashboard_metrics['real_time_alerts']],
+            'recent_alerts': alert_broker.recent(10),
+            'last_updated': now
         }
         
         return dashboard_data
@@ -358,6 +600,45 @@ async def get_quantum_dashboard_data():
         logger.error(f"Dashboard data error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Dashboard data retrieval failed: {str(e)}")
 
+@quantum_router.get("/alerts/stream", tags=["Quantum Analytics"])
+async def stream_alerts(request: Request, types: Optional[str] = None,
+                        last_event_id: Optional[int] = Header(None, alias="Last-Event-ID")):
+    """
+    Server-sent events feed of CRITICAL_RISK and TOP_TIER_CANDIDATE alerts as analyses are recorded
+    Optional comma-separated `types` filter; reconnecting clients resume after their Last-Event-ID
+    """
+    wanted = {t.strip() for t in types.split(',') if t.strip()} if types else None
+    subscription = alert_broker.subscribe(last_event_id)
+
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                event = await subscription.next_event(ALERT_KEEPALIVE_SECONDS)
+                if event is None:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keep-alive\n\n"
+                elif wanted is None or event['type'] in wanted:
+                    yield format_sse(event)
+        finally:
+            alert_broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(), media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@quantum_router.get("/analyses/employees", tags=["Quantum Analytics"])
+async def list_employee_analyses(department: Optional[str] = None, risk_level: Optional[str] = None,
+                                 since: Optional[str] = None, limit: int = 100):
+    """Stored employee analyses, newest first, filtered by department, risk level and time"""
+    return {
+        'analyses': await run_in_threadpool(
+            analysis_store.query_employee_analyses, department, risk_level, since, min(limit, 1000)
+        )
+    }
+
 @app.get("/health", tags=["System Health"])
 async def quantum_health_check():
     """Quantum System Health Check"""
@@ -367,9 +648,94 @@ async def quantum_health_check():
         "ai_models": "READY",
         "timestamp": datetime.now().isoformat(),
         "uptime": "99.9%",
-        "quantum_state": "STABLE"
+        "quantum_state": "STABLE",
+        "model_registry": model_registry.stats(),
+        "llm_client": llm_client.get_stats(),
+        "embedding_store": embedding_store.get_stats(),
+        "llm_modes": quantum_workforce.get_llm_mode_stats(),
+        "inference_executor": inference_executor.get_stats(),
+        "micro_batching": psychology_batcher.get_stats(),
+        "skill_taxonomy": skill_taxonomy.get_stats(),
+        "candidate_index": candidate_index.get_stats(),
+        "analysis_store": analysis_store.get_stats(),
+        "alerts": alert_broker.get_stats(),
+        "profiler": profiler.get_stats()
     }
 
+def _component_metrics() -> List[tuple]:
+    """Counters and gauges that already live in the components' stats, read at scrape time"""
+    llm_stats = llm_client.stats
+    cache_stats = llm_client.cache.get_stats()
+    executor_stats = inference_executor.get_stats()
+    return [
+        ('quantum_llm_requests_total', 'counter', 'Gemini calls by outcome',
+         [({'outcome': outcome}, llm_stats[outcome])
+          for outcome in ('successes', 'timeouts', 'errors', 'retries', 'fallbacks', 'unconfigured')]),
+        ('quantum_llm_cache_lookups_total', 'counter', 'LLM response cache lookups by result',
+         [({'result': result}, cache_stats[result]) for result in ('memory_hits', 'disk_hits', 'misses')]),
+        ('quantum_embedding_cache_lookups_total', 'counter', 'Embedding store lookups by result',
+         [({'result': result}, embedding_store.stats[result]) for result in ('hits', 'misses')]),
+        ('quantum_dashboard_cache_hits_total', 'counter', 'Dashboard requests served from the cached rollup',
+         [({}, analysis_store.stats['dashboard_cache_hits'])]),
+        ('quantum_executor_tasks_total', 'counter', 'Inference executor tasks by state',
+         [({'state': state}, executor_stats[state]) for state in ('completed', 'failed')]),
+        ('quantum_executor_in_flight', 'gauge', 'Inference executor tasks submitted and not yet finished',
+         [({}, executor_stats['in_flight'])]),
+        ('quantum_executor_queue_depth', 'gauge', 'Inference executor tasks waiting for a free worker',
+         [({}, executor_stats['queue_depth'])]),
+        ('quantum_microbatch_queued', 'gauge', 'Psychology requests waiting for the next micro-batch',
+         [({}, psychology_batcher.get_stats()['queued'])]),
+        ('quantum_alert_subscribers', 'gauge', 'Connected alert stream clients',
+         [({}, alert_broker.get_stats()['subscribers'])])
+    ]
+
+metrics.add_collector(_component_metrics)
+
+@app.get("/metrics", tags=["System Health"])
+async def quantum_metrics_export():
+    """Prometheus scrape endpoint: stage spans, request latency, batch sizes, LLM fallbacks and component counters"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+# Admin endpoints are disabled unless QUANTUM_ADMIN_TOKEN is set; callers send it as X-Quantum-Admin-Token
+ADMIN_TOKEN = os.getenv('QUANTUM_ADMIN_TOKEN')
+
+def require_admin(token: Optional[str]):
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled (set QUANTUM_ADMIN_TOKEN)")
+    if not token or not secrets.compare_digest(token, ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+@app.get("/admin/profile", tags=["System Health"])
+async def quantum_sampling_profile(request: Request, seconds: float = 30, interval_ms: Optional[float] = None,
+                                   focus: str = DEFAULT_FOCUS,
+                                   admin_token: Optional[str] = Header(None, alias="X-Quantum-Admin-Token")):
+    """
+    Sample every thread of this API process for `seconds` and return flamegraph-ready collapsed stacks
+    Only stacks passing through the `focus` module are kept (empty focus keeps everything)
+    """
+    require_admin(admin_token)
+    try:
+        session = profiler.start(seconds, interval_ms, focus)
+    except QuantumProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    try:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline and not await request.is_disconnected():
+            await asyncio.sleep(min(1.0, deadline - time.monotonic()))
+    finally:
+        collapsed = await run_in_threadpool(profiler.stop, session)
+
+    summary = profiler.last_summary
+    logger.info(f"Sampling profile finished: {summary}")
+    return PlainTextResponse(collapsed, headers={
+        "Content-Disposition": f'attachment; filename="quantum-profile-{datetime.now():%Y%m%dT%H%M%S}.collapsed"',
+        "X-Quantum-Profile-Samples": str(summary['samples']),
+        "X-Quantum-Profile-Overhead-Percent": str(summary['overhead_percent'])
+    })
+
 # Revolutionary API Documentation
 @app.get("/api-info", tags=["Documentation"])
 async def quantum_api_information():
@@ -392,8 +758,12 @@ async def quantum_api_information():
             "/neural-candidate-analysis": "Advanced candidate assessment with market intelligence",
             "/quantum-batch-analysis": "Batch processing for multiple employees",
             "/upload-resume": "Resume upload and neural analysis",
+            "/bulk-resume-ingestion": "Bulk resume ingestion (multiple files or ZIP archives)",
             "/quantum-dashboard-data": "Real-time dashboard metrics",
-            "/health": "System health monitoring"
+            "/api/quantum/v1/alerts/stream": "Server-sent events feed of critical-risk and top-tier candidate alerts",
+            "/health": "System health monitoring",
+            "/metrics": "Prometheus metrics (stage timings, request latency, batch sizes, cache hits, LLM fallbacks)",
+            "/admin/profile": "Time-boxed sampling profile of the API process as collapsed stacks (admin token required)"
         },
         "neural_technologies": [
             "Google Gemini Pro AI",
@@ -409,8 +779,9 @@ async def quantum_api_information():
             "candidate_assessment": "94%+"
         }    }
 
-# Include the quantum router in the main app
+# Include the quantum routers in the main app
 app.include_router(quantum_router)
+app.include_router(job_router)
 
 # Revolutionary Main Application Runner
 if __name__ == "__main__":
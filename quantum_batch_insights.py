@@ -0,0 +1,98 @@
+# Quantum Batch Insights
+# Per-employee batch records and constant-memory running aggregates for streamed batches
+
+import heapq
+import itertools
+from datetime import datetime
+from typing import Dict, List
+
+
+def build_batch_record(employee: Dict, analysis: Dict) -> Dict:
+    """Shape one analyze_workforce_batch result into a batch result record"""
+    if 'error' in analysis:
+        return {
+            'employee_id': employee.get('employee_id', 'unknown'),
+            'name': employee.get('name', 'Anonymous'),
+            'error': analysis['error'],
+            'risk_level': 'ERROR',
+            'engagement_score': 0
+        }
+
+    quantum_matrix = analysis['quantum_analysis']
+    temporal_risk = analysis['temporal_risk']
+    return {
+        'employee_id': employee.get('employee_id', 'unknown'),
+        'name': employee.get('name', 'Anonymous'),
+        'quantum_analysis': quantum_matrix,
+        'temporal_risk': temporal_risk,
+        'intervention_blueprint': analysis['intervention_blueprint'],
+        'risk_level': temporal_risk.get('overall_risk_level', 'UNKNOWN'),
+        'engagement_score': quantum_matrix.get('engagement_metrics', {}).get('quantum_level', 0)
+    }
+
+
+class _TopK:
+    """Bounded min-heap keeping the k records with the largest score"""
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap = []
+        self._sequence = itertools.count()
+
+    def push(self, score: float, record: Dict):
+        # The sequence number breaks ties in arrival order and keeps dicts out of comparisons
+        item = (score, -next(self._sequence), record)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        elif item > self._heap[0]:
+            heapq.heapreplace(self._heap, item)
+
+    def items(self) -> List[Dict]:
+        return [record for _, _, record in sorted(self._heap, reverse=True)]
+
+
+class QuantumBatchAggregator:
+    """
+    Running batch summary with O(k) memory regardless of batch size
+    Mirrors the batch endpoint's summary and quantum_insights without keeping every record
+    """
+
+    def __init__(self, top_k: int = 3, priority_k: int = 25):
+        self.total_employees = 0
+        self.high_risk_employees = 0
+        self.intervention_priority_count = 0
+        self.engagement_sum = 0.0
+        self._most_at_risk = _TopK(top_k)
+        self._highest_engagement = _TopK(top_k)
+        self._intervention_priorities = _TopK(priority_k)
+
+    def add(self, record: Dict):
+        self.total_employees += 1
+        self.engagement_sum += record.get('engagement_score', 0)
+
+        risk_level = record.get('risk_level')
+        three_month_risk = record.get('temporal_risk', {}).get('3_month_risk', 0)
+        if risk_level == 'CRITICAL':
+            self.high_risk_employees += 1
+        if risk_level in ['CRITICAL', 'HIGH']:
+            self.intervention_priority_count += 1
+            self._intervention_priorities.push(three_month_risk, record)
+
+        self._most_at_risk.push(three_month_risk, record)
+        self._highest_engagement.push(record.get('engagement_score', 0), record)
+
+    def summary(self) -> Dict:
+        return {
+            'total_employees': self.total_employees,
+            'high_risk_employees': self.high_risk_employees,
+            'average_engagement': self.engagement_sum / self.total_employees if self.total_employees else 0,
+            'processing_timestamp': datetime.now().isoformat()
+        }
+
+    def insights(self) -> Dict:
+        return {
+            'most_at_risk': self._most_at_risk.items(),
+            'highest_engagement': self._highest_engagement.items(),
+            'intervention_priorities': self._intervention_priorities.items(),
+            'intervention_priority_count': self.intervention_priority_count
+        }
@@ -0,0 +1,266 @@
+# Quantum Batch Scorer
+# Offline CLI that streams employee / candidate CSV or Parquet files through the columnar scorer in chunks
+#
+# Usage:
+#   python quantum_batch_scorer.py employees sample_data/quantum_employees.csv scored_employees.csv
+#   python quantum_batch_scorer.py candidates candidates.parquet scored_candidates.parquet --workers 4
+#
+# Output is written chunk by chunk next to a checkpoint file; rerunning the same command resumes after
+# the last completed chunk (--restart starts over). Memory is bounded by chunk size x in-flight chunks
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator
+
+import pandas as pd
+
+from quantum_columnar_scoring import CANDIDATE_LIST_COLUMNS, EMPLOYEE_LIST_COLUMNS, QuantumColumnarScorer
+from quantum_executor import _initialize_process_worker, _worker_systems
+
+KIND_EMPLOYEES = 'employees'
+KIND_CANDIDATES = 'candidates'
+
+DEFAULT_TEXT_COLUMNS = {KIND_EMPLOYEES: 'feedback_text', KIND_CANDIDATES: 'resume_summary'}
+# Scorer columns written to CSV as JSON; fixed per kind so the encoding never depends on a chunk's values
+JSON_COLUMNS = {KIND_EMPLOYEES: EMPLOYEE_LIST_COLUMNS, KIND_CANDIDATES: CANDIDATE_LIST_COLUMNS}
+DEFAULT_CHUNK_ROWS = 5000
+
+CHECKPOINT_VERSION = 1
+
+# Parquet part files (and their in-progress .tmp) written by _ParquetOutput
+_PART_FILE_PATTERN = re.compile(r'part-(\d{6})\.parquet(\.tmp)?')
+
+
+def _is_parquet(path: str) -> bool:
+    return path.lower().rstrip(os.sep).endswith('.parquet')
+
+
+def iter_input_chunks(path: str, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """Yield the input table chunk_rows rows at a time; never reads the whole file"""
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_rows)
+
+
+def score_chunk(kind: str, frame: pd.DataFrame, text_column: str) -> pd.DataFrame:
+    """Score one chunk with this process's systems (see quantum_executor._initialize_process_worker)"""
+    scorer = QuantumColumnarScorer(_worker_systems['workforce'], _worker_systems['talent'])
+    if kind == KIND_EMPLOYEES:
+        return scorer.score_employees(frame, text_column)
+    return scorer.score_candidates(frame, text_column)
+
+
+class _CsvOutput:
+    """One CSV file; list columns are written as JSON. Resuming truncates anything past the checkpoint"""
+
+    def __init__(self, path: str, resume_bytes: int, json_columns=()):
+        mode = 'r+b' if resume_bytes and os.path.exists(path) else 'wb'
+        self.path = path
+        self.json_columns = json_columns
+        self._file = open(path, mode)
+        self._file.truncate(resume_bytes if mode == 'r+b' else 0)
+        self._file.seek(0, os.SEEK_END)
+
+    def write(self, index: int, frame: pd.DataFrame) -> int:
+        frame = frame.copy()
+        for column in self.json_columns:
+            frame[column] = frame[column].map(json.dumps)
+        self._file.write(frame.to_csv(index=False, header=self._file.tell() == 0).encode('utf-8'))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetOutput:
+    """A directory of part files, one per chunk, readable with pd.read_parquet(path)"""
+
+    def __init__(self, path: str, resume_chunks: int):
+        import pyarrow  # noqa: F401  (fail before scoring starts when pyarrow is missing)
+
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        # Only part files this tool writes are touched; anything else in the directory is left alone
+        for name in os.listdir(path):
+            match = _PART_FILE_PATTERN.fullmatch(name)
+            if match and (match.group(2) or int(match.group(1)) >= resume_chunks):
+                os.remove(os.path.join(path, name))
+
+    def write(self, index: int, frame: pd.DataFrame) -> int:
+        part = os.path.join(self.path, f'part-{index:06d}.parquet')
+        frame.to_parquet(part + '.tmp', index=False)
+        os.replace(part + '.tmp', part)
+        return 0
+
+    def close(self):
+        pass
+
+
+class QuantumBatchScorer:
+    """
+    Chunked offline scoring of one input file into one output
+    With workers > 1 chunks are scored in a spawn process pool (each worker loads its own copy of the models,
+    with this process's network weights); at most 2 x workers chunks are in flight and results are written
+    in input order
+    """
+
+    def __init__(self, kind: str, input_path: str, output_path: str, text_column: str = None,
+                 chunk_rows: int = DEFAULT_CHUNK_ROWS, workers: int = 1):
+        if kind not in DEFAULT_TEXT_COLUMNS:
+            raise ValueError(f"Unknown input kind: {kind}")
+        self.kind = kind
+        self.input_path = input_path
+        self.output_path = output_path
+        self.text_column = text_column or DEFAULT_TEXT_COLUMNS[kind]
+        self.chunk_rows = chunk_rows
+        self.workers = max(1, workers)
+        self.checkpoint_path = output_path.rstrip(os.sep) + '.checkpoint.json'
+
+    def _input_signature(self) -> Dict:
+        stat = os.stat(self.input_path)
+        return {
+            'version': CHECKPOINT_VERSION,
+            'kind': self.kind,
+            'input': os.path.abspath(self.input_path),
+            'input_size': stat.st_size,
+            'input_mtime_ns': stat.st_mtime_ns,
+            'text_column': self.text_column,
+            'chunk_rows': self.chunk_rows
+        }
+
+    def load_checkpoint(self, restart: bool = False) -> Dict:
+        """Progress to resume from; a checkpoint for a different input or chunk size is refused"""
+        signature = self._input_signature()
+        fresh = {**signature, 'chunks_done': 0, 'rows_done': 0, 'output_bytes': 0, 'complete': False}
+        if restart or not os.path.exists(self.checkpoint_path):
+            return fresh
+        with open(self.checkpoint_path) as f:
+            checkpoint = json.load(f)
+        if any(checkpoint.get(key) != value for key, value in signature.items()):
+            raise ValueError(
+                f"{self.checkpoint_path} was written for a different input or settings; rerun with --restart"
+            )
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint: Dict):
+        temporary = self.checkpoint_path + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(checkpoint, f, indent=2)
+        os.replace(temporary, self.checkpoint_path)
+
+    def run(self, restart: bool = False, progress=None) -> Dict:
+        checkpoint = self.load_checkpoint(restart)
+        resumed_from = checkpoint['rows_done']
+        if checkpoint['complete']:
+            return {'status': 'already complete', 'rows': checkpoint['rows_done'], 'chunks': checkpoint['chunks_done']}
+
+        if _is_parquet(self.output_path):
+            output = _ParquetOutput(self.output_path, checkpoint['chunks_done'])
+        else:
+            output = _CsvOutput(self.output_path, checkpoint['output_bytes'], JSON_COLUMNS[self.kind])
+
+        pool = None
+        if self.workers > 1:
+            # Every worker loads this process's network weights, so results do not depend on --workers
+            from quantum_neural_architecture import QuantumWorkforceIntelligence
+
+            workforce = _worker_systems.get('workforce') or QuantumWorkforceIntelligence()
+            torch_threads = max(1, (os.cpu_count() or 1) // self.workers)
+            pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_initialize_process_worker,
+                initargs=(torch_threads, workforce.model_state())
+            )
+        elif not _worker_systems:
+            _initialize_process_worker(os.cpu_count() or 1)
+
+        started = time.perf_counter()
+        in_flight = deque()
+
+        def commit(index: int, rows: int, scored: pd.DataFrame):
+            checkpoint['output_bytes'] = output.write(index, scored)
+            checkpoint['chunks_done'] = index + 1
+            checkpoint['rows_done'] += rows
+            self._save_checkpoint(checkpoint)
+            if progress:
+                progress(checkpoint)
+
+        try:
+            for index, frame in enumerate(iter_input_chunks(self.input_path, self.chunk_rows)):
+                if self.text_column not in frame.columns:
+                    raise ValueError(f"{self.input_path} has no '{self.text_column}' column; set --text-column")
+                if index < checkpoint['chunks_done']:
+                    continue  # scored in an earlier run
+                if pool is None:
+                    commit(index, len(frame), score_chunk(self.kind, frame, self.text_column))
+                    continue
+                in_flight.append((index, len(frame), pool.submit(score_chunk, self.kind, frame, self.text_column)))
+                while len(in_flight) >= 2 * self.workers or (in_flight and in_flight[0][2].done()):
+                    done_index, rows, future = in_flight.popleft()
+                    commit(done_index, rows, future.result())
+            while in_flight:
+                done_index, rows, future = in_flight.popleft()
+                commit(done_index, rows, future.result())
+        finally:
+            output.close()
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        checkpoint['complete'] = True
+        self._save_checkpoint(checkpoint)
+        elapsed = time.perf_counter() - started
+        scored_rows = checkpoint['rows_done'] - resumed_from
+        return {
+            'status': 'complete',
+            'rows': checkpoint['rows_done'],
+            'chunks': checkpoint['chunks_done'],
+            'resumed_from_row': resumed_from,
+            'seconds': round(elapsed, 2),
+            'rows_per_second': round(scored_rows / elapsed, 1) if elapsed > 0 else None,
+            'output': self.output_path
+        }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Score employee or candidate files offline, chunk by chunk")
+    parser.add_argument('kind', choices=[KIND_EMPLOYEES, KIND_CANDIDATES])
+    parser.add_argument('input', help="Input .csv or .parquet file")
+    parser.add_argument('output', help="Output .csv file or .parquet directory")
+    parser.add_argument('--text-column', help="Feedback / resume text column "
+                                              "(default: feedback_text for employees, resume_summary for candidates)")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument('--workers', type=int, default=1, help="Scoring processes (each loads its own models)")
+    parser.add_argument('--restart', action='store_true', help="Ignore an existing checkpoint and start over")
+    args = parser.parse_args(argv)
+
+    scorer = QuantumBatchScorer(args.kind, args.input, args.output, args.text_column, args.chunk_rows, args.workers)
+    try:
+        summary = scorer.run(
+            restart=args.restart,
+            progress=lambda checkpoint: print(
+                f"chunk {checkpoint['chunks_done']}: {checkpoint['rows_done']} rows scored", file=sys.stderr
+            )
+        )
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
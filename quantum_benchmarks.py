@@ -0,0 +1,404 @@
+# Quantum Benchmarks
+# Reproducible component and endpoint benchmarks with Gemini replaced by the local stub; results go to JSON
+#
+# Usage:
+#   python quantum_benchmarks.py --output benchmark_results.json
+#   python quantum_benchmarks.py --llm-latency-ms 800 --llm-jitter-ms 100 --quick
+#   python quantum_benchmarks.py --baseline benchmarks/v2.0.json --tolerance 0.25   # exit 1 on regressions
+#   python quantum_benchmarks.py --suites encoder_backend --encoder-backend int8    # drift + speedup vs fp32
+#
+# Every run seeds torch / NumPy / random, keeps its stores in a throwaway directory and makes each benchmarked
+# text unique, so neither the LLM cache nor the embedding store hides the real cost
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import asyncio
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+
+from quantum_llm_stub import start_stub_server
+
+ENCODE_BATCH_SIZES = (1, 8, 32, 128)
+NETWORK_BATCH_SIZES = (1, 32, 256)
+RESUME_SIZE_MULTIPLIERS = (1, 4, 16, 64)
+
+# Stores the API would otherwise write under .quantum_cache
+_STATE_ENV = {
+    'QUANTUM_EMBEDDING_STORE_DIR': 'embeddings',
+    'QUANTUM_CANDIDATE_INDEX_DIR': 'candidates',
+    'QUANTUM_ANALYSIS_DB': 'analyses.sqlite3',
+    'QUANTUM_RESUME_DB': 'resumes.sqlite3',
+    'QUANTUM_JOBS_DB': 'jobs.sqlite3'
+}
+
+
+def _summarize(samples: Sequence[float]) -> Dict:
+    """Latency statistics in milliseconds"""
+    ordered = sorted(samples)
+    return {
+        'runs': len(ordered),
+        'p50_ms': round(statistics.median(ordered) * 1000, 3),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        'mean_ms': round(statistics.fmean(ordered) * 1000, 3),
+        'min_ms': round(ordered[0] * 1000, 3)
+    }
+
+
+def time_call(fn: Callable, repeat: int, warmup: int = 1) -> Dict:
+    """Time fn(i) repeat times after warmup untimed calls; i lets callers vary their input"""
+    for i in range(warmup):
+        fn(-1 - i)
+    samples = []
+    for i in range(repeat):
+        started = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - started)
+    return _summarize(samples)
+
+
+async def time_async_call(fn: Callable, repeat: int, warmup: int = 1) -> Dict:
+    for i in range(warmup):
+        await fn(-1 - i)
+    samples = []
+    for i in range(repeat):
+        started = time.perf_counter()
+        await fn(i)
+        samples.append(time.perf_counter() - started)
+    return _summarize(samples)
+
+
+def bench_encode(model, texts: List[str], batch_sizes: Sequence[int], repeat: int) -> Dict:
+    """SentenceTransformer.encode called directly (no embedding store) at several batch sizes"""
+    results = {}
+    for batch_size in batch_sizes:
+        batch = [texts[i % len(texts)] for i in range(batch_size)]
+        stats = time_call(lambda _: model.encode(batch, batch_size=batch_size), repeat)
+        stats['texts_per_second'] = round(batch_size / (stats['p50_ms'] / 1000), 1)
+        results[f'batch_{batch_size}'] = stats
+    return results
+
+
+def bench_encoder_backend(model_name: str, backend: str, texts: List[str], batch_sizes: Sequence[int],
+                          repeat: int) -> Dict:
+    """An optimized encoder backend against fp32 on the same texts: embedding cosine drift, then throughput"""
+    from quantum_model_registry import ENCODER_BACKEND_FP32, cosine_drift, get_sentence_model
+
+    reference = get_sentence_model(model_name, ENCODER_BACKEND_FP32)
+    optimized = get_sentence_model(model_name, backend)
+    drift = cosine_drift(reference.encode(texts, batch_size=32), optimized.encode(texts, batch_size=32))
+    reference_stats = bench_encode(reference, texts, batch_sizes, repeat)
+    optimized_stats = bench_encode(optimized, texts, batch_sizes, repeat)
+    return {
+        'backend': backend,
+        'drift': drift,
+        ENCODER_BACKEND_FP32: reference_stats,
+        backend: optimized_stats,
+        'speedup': {
+            case: round(optimized_stats[case]['texts_per_second'] / reference_stats[case]['texts_per_second'], 3)
+            for case in reference_stats
+        }
+    }
+
+
+def bench_networks(workforce, batch_sizes: Sequence[int], repeat: int) -> Dict:
+    """
+    QuantumPsychologicalNet (four heads, and the scripted fused head the API runs, including its host
+    transfer) and QuantumAttritionNet forward passes on fixed random inputs
+    """
+    import torch
+
+    results = {}
+    generator = torch.Generator().manual_seed(0)
+    for batch_size in batch_sizes:
+        embeddings = torch.randn(batch_size, 384, generator=generator)
+        features = torch.rand(batch_size, 10, generator=generator)
+        with torch.no_grad():
+            results[f'psychological_net_batch_{batch_size}'] = time_call(
+                lambda _: workforce.psychological_analyzer(embeddings), repeat
+            )
+        with torch.inference_mode():
+            results[f'fused_psychological_head_batch_{batch_size}'] = time_call(
+                lambda _: workforce.psychological_inference(embeddings).tolist(), repeat
+            )
+        with torch.no_grad():
+            results[f'attrition_net_batch_{batch_size}'] = time_call(
+                lambda _: workforce.attrition_predictor(features), repeat
+            )
+    return results
+
+
+def bench_skill_extraction(talent, resume: str, multipliers: Sequence[int], repeat: int) -> Dict:
+    """_extract_neural_skills on resumes of growing size"""
+    results = {}
+    for multiplier in multipliers:
+        text = '\n'.join([resume] * multiplier)
+        stats = time_call(lambda _: talent._extract_neural_skills(text), repeat)
+        stats['resume_chars'] = len(text)
+        results[f'resume_x{multiplier}'] = stats
+    return results
+
+
+async def bench_endpoints(app, employees: List[Dict], candidates: List[Dict], repeat: int,
+                          batch_employees: int, concurrency: int) -> Dict:
+    """End-to-end request latency through the ASGI app, Gemini answered by the stub"""
+    import httpx
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://benchmark', timeout=300) as client:
+        async def post(path: str, payload: Dict):
+            response = await client.post(path, json=payload)
+            response.raise_for_status()
+            return response
+
+        def psychology_payload(i: int) -> Dict:
+            employee = employees[i % len(employees)]
+            return {
+                'employee_data': employee,
+                'feedback_text': f"{employee['feedback']} (benchmark request {i})"
+            }
+
+        results['psychology_analysis'] = await time_async_call(
+            lambda i: post('/api/quantum/v1/psychology-analysis', psychology_payload(i)), repeat
+        )
+
+        def batch_payload(i: int) -> Dict:
+            return {'employees': [
+                {**employees[(i * batch_employees + j) % len(employees)],
+                 'feedback': f"{employees[(i * batch_employees + j) % len(employees)]['feedback']} (batch {i}/{j})"}
+                for j in range(batch_employees)
+            ]}
+
+        results['batch_psychology_analysis'] = await time_async_call(
+            lambda i: post('/api/quantum/v1/batch-psychology-analysis', batch_payload(i)), repeat
+        )
+        results['batch_psychology_analysis']['employees_per_request'] = batch_employees
+
+        def talent_payload(i: int) -> Dict:
+            candidate = candidates[i % len(candidates)]
+            return {
+                'candidate_data': candidate,
+                'resume_text': f"{candidate['resume_text']}\nBenchmark request {i}"
+            }
+
+        results['neural_talent_analysis'] = await time_async_call(
+            lambda i: post('/api/quantum/v1/neural-talent-analysis', talent_payload(i)), repeat
+        )
+
+        # Throughput with concurrent /psychology-analysis requests (exercises micro-batching and the LLM pool)
+        offset = 10 ** 6
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            post('/api/quantum/v1/psychology-analysis', psychology_payload(offset + i)) for i in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+        results['psychology_analysis_concurrent'] = {
+            'concurrency': concurrency,
+            'wall_ms': round(elapsed * 1000, 3),
+            'requests_per_second': round(concurrency / elapsed, 2)
+        }
+    return results
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _load_samples(data_dir: str):
+    import pandas as pd
+
+    employees = pd.read_csv(os.path.join(data_dir, 'quantum_employees.csv')).head(100)
+    candidates = pd.read_csv(os.path.join(data_dir, 'quantum_candidates.csv')).head(50)
+    employee_records = [
+        {'employee_id': row['employee_id'], 'name': row['name'], 'department': row['department'],
+         'position': row['position'], 'tenure_years': float(row['tenure_years']), 'feedback': row['feedback_text']}
+        for row in employees.to_dict('records')
+    ]
+    candidate_records = [
+        {'candidate_id': row['candidate_id'], 'name': row['name'], 'resume_text': row['resume_summary']}
+        for row in candidates.to_dict('records')
+    ]
+    return employee_records, candidate_records
+
+
+def run_benchmarks(repeat: int = 20, endpoint_repeat: int = 10, llm_latency_ms: float = 300.0,
+                   llm_jitter_ms: float = 0.0, batch_employees: int = 10, concurrency: int = 16,
+                   suites: Sequence[str] = ('encode', 'networks', 'skills', 'endpoints'),
+                   data_dir: str = 'sample_data', seed: int = 0, encoder_backend: str = 'int8') -> Dict:
+    """Run the selected suites; must be called before anything else imports the API in this process"""
+    random.seed(seed)
+    np.random.seed(seed)
+
+    state_dir = tempfile.mkdtemp(prefix='quantum-benchmark-')
+    for variable, name in _STATE_ENV.items():
+        os.environ[variable] = os.path.join(state_dir, name)
+
+    stub_port = _free_port()
+    stub = start_stub_server(stub_port, llm_latency_ms, llm_jitter_ms)
+    os.environ['QUANTUM_LLM_ENDPOINT'] = f'http://127.0.0.1:{stub_port}'
+
+    import torch
+    torch.manual_seed(seed)
+
+    employees, candidates = _load_samples(data_dir)
+    results = {}
+    try:
+        from quantum_neural_architecture import QuantumWorkforceIntelligence, NeuralTalentAcquisitionSystem
+
+        if 'endpoints' in suites:
+            import quantum_api
+            workforce, talent, app = quantum_api.quantum_workforce, quantum_api.neural_talent_system, quantum_api.app
+        else:
+            workforce, talent, app = QuantumWorkforceIntelligence(), NeuralTalentAcquisitionSystem(), None
+
+        if 'encode' in suites:
+            results['sentence_encode'] = bench_encode(
+                workforce.sentence_model, [employee['feedback'] for employee in employees], ENCODE_BATCH_SIZES, repeat
+            )
+        if 'encoder_backend' in suites:
+            results['encoder_backend'] = bench_encoder_backend(
+                workforce.embedding_model_name, encoder_backend,
+                [employee['feedback'] for employee in employees] + [candidate['resume_text'] for candidate in candidates],
+                ENCODE_BATCH_SIZES, repeat
+            )
+        if 'networks' in suites:
+            results['neural_networks'] = bench_networks(workforce, NETWORK_BATCH_SIZES, repeat)
+        if 'skills' in suites:
+            results['skill_extraction'] = bench_skill_extraction(
+                talent, candidates[0]['resume_text'], RESUME_SIZE_MULTIPLIERS, repeat
+            )
+        if 'endpoints' in suites:
+            results['endpoints'] = asyncio.run(bench_endpoints(
+                app, employees, candidates, endpoint_repeat, batch_employees, concurrency
+            ))
+    finally:
+        stub.shutdown()
+
+    return {
+        'metadata': {
+            'timestamp': datetime.now().isoformat(),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'torch': torch.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'torch_threads': torch.get_num_threads(),
+            'seed': seed,
+            'repeat': repeat,
+            'endpoint_repeat': endpoint_repeat,
+            'llm_stub': {'latency_ms': llm_latency_ms, 'jitter_ms': llm_jitter_ms},
+            'llm_mode': os.getenv('QUANTUM_LLM_MODE', 'two_call'),
+            'executor_mode': os.getenv('QUANTUM_EXECUTOR_MODE', 'thread'),
+            'encoder_backend': workforce.encoder_backend
+        },
+        'results': results
+    }
+
+
+def _flatten(results: Dict, prefix: str = '') -> Dict[str, Dict]:
+    """{'suite.case': stats} for every entry carrying latency statistics"""
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict) and ('p50_ms' in value or 'wall_ms' in value):
+            flat[prefix + key] = value
+        elif isinstance(value, dict):
+            flat.update(_flatten(value, f'{prefix}{key}.'))
+    return flat
+
+
+def compare_with_baseline(report: Dict, baseline: Dict, tolerance: float) -> List[Dict]:
+    """Cases whose p50 (or wall time) grew by more than tolerance over the baseline report"""
+    current, previous = _flatten(report['results']), _flatten(baseline.get('results', {}))
+    regressions = []
+    for case, stats in current.items():
+        if case not in previous:
+            continue
+        metric = 'p50_ms' if 'p50_ms' in stats else 'wall_ms'
+        before, after = previous[case].get(metric), stats[metric]
+        if before and after > before * (1 + tolerance):
+            regressions.append({'case': case, 'metric': metric, 'baseline': before, 'current': after,
+                                'change': round(after / before - 1, 3)})
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Quantum HR component and endpoint benchmarks")
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--suites', default='encode,networks,skills,endpoints',
+                        help="Comma-separated subset of encode,networks,skills,endpoints,encoder_backend")
+    parser.add_argument('--repeat', type=int, default=20, help="Timed runs per component case")
+    parser.add_argument('--endpoint-repeat', type=int, default=10, help="Timed requests per endpoint")
+    parser.add_argument('--llm-latency-ms', type=float, default=300.0, help="Injected Gemini stub latency")
+    parser.add_argument('--llm-jitter-ms', type=float, default=0.0)
+    parser.add_argument('--batch-employees', type=int, default=10)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--quick', action='store_true', help="Few repeats, for smoke runs")
+    parser.add_argument('--baseline', help="Earlier results file to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed p50 growth over the baseline")
+    parser.add_argument('--encoder-backend', default='int8', help="Backend compared with fp32 by the encoder_backend suite")
+    parser.add_argument('--max-drift', type=float, default=0.02,
+                        help="encoder_backend suite fails when 1 - mean cosine vs fp32 exceeds this")
+    parser.add_argument('--data-dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_data'))
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        repeat=3 if args.quick else args.repeat,
+        endpoint_repeat=2 if args.quick else args.endpoint_repeat,
+        llm_latency_ms=args.llm_latency_ms,
+        llm_jitter_ms=args.llm_jitter_ms,
+        batch_employees=args.batch_employees,
+        concurrency=4 if args.quick else args.concurrency,
+        suites=[suite.strip() for suite in args.suites.split(',') if suite.strip()],
+        data_dir=args.data_dir,
+        encoder_backend=args.encoder_backend
+    )
+
+    exit_code = 0
+    drift = report['results'].get('encoder_backend', {}).get('drift')
+    if drift and 1 - drift['mean_cosine'] > args.max_drift:
+        print(f"DRIFT {args.encoder_backend}: mean cosine vs fp32 {drift['mean_cosine']} "
+              f"(allowed drift {args.max_drift})", file=sys.stderr)
+        exit_code = 1
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_with_baseline(report, json.load(f), args.tolerance)
+        report['regressions'] = regressions
+        for regression in regressions:
+            print(f"REGRESSION {regression['case']}: {regression['metric']} {regression['baseline']} -> "
+                  f"{regression['current']} (+{regression['change'] * 100:.1f}%)", file=sys.stderr)
+        if regressions:
+            exit_code = 1
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    for case, stats in _flatten(report['results']).items():
+        print(f"{case:55s} {stats.get('p50_ms', stats.get('wall_ms')):>10.3f} ms")
+    print(f"Results written to {args.output}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
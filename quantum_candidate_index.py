@@ -0,0 +1,416 @@
+# Quantum Candidate Index
+# Persistent candidate vector index: memory-mapped resume embeddings with exact and IVF top-k search
+#
+# Usage:
+#   python quantum_candidate_index.py --load-csv sample_data/quantum_candidates.csv
+#   python quantum_candidate_index.py --benchmark --rows 100000 --output candidate_index_benchmark.json
+
+import os
+import json
+import time
+import logging
+import argparse
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+logger = logging.getLogger("QuantumHR-CandidateIndex")
+
+DEFAULT_INDEX_DIR = os.path.join('.quantum_cache', 'candidates')
+
+SEARCH_AUTO = 'auto'
+SEARCH_EXACT = 'exact'
+SEARCH_IVF = 'ivf'
+
+# Rows scored per matrix product when scanning or assigning vectors
+_SCAN_CHUNK_ROWS = 65536
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k largest scores, best first"""
+    if len(scores) <= k:
+        return np.argsort(-scores)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+class _IVFIndex:
+    """
+    Inverted-file index over unit vectors: spherical k-means centroids, rows grouped by nearest centroid
+    A query scores every centroid, then only the rows in the nprobe closest lists
+    """
+
+    def __init__(self, matrix: np.ndarray, rows: np.ndarray, nlist: int, iterations: int = 8,
+                 sample_size: int = 50000, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        nlist = max(1, min(nlist, len(rows)))
+
+        sample = rows if len(rows) <= sample_size else rng.choice(rows, sample_size, replace=False)
+        sample_vectors = np.asarray(matrix[np.sort(sample)])
+        centroids = sample_vectors[rng.choice(len(sample_vectors), nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignment = np.argmax(sample_vectors @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample_vectors)
+            counts = np.bincount(assignment, minlength=nlist)
+            empty = counts == 0
+            if empty.any():  # re-seed empty lists from random sample rows
+                sums[empty] = sample_vectors[rng.choice(len(sample_vectors), int(empty.sum()))]
+            centroids = _normalize(sums)
+
+        self.centroids = centroids
+        assignment = np.concatenate([
+            np.argmax(np.asarray(matrix[rows[start:start + _SCAN_CHUNK_ROWS]]) @ centroids.T, axis=1)
+            for start in range(0, len(rows), _SCAN_CHUNK_ROWS)
+        ])
+        order = np.argsort(assignment, kind='stable')
+        self.list_rows = rows[order]
+        self.list_offsets = np.searchsorted(assignment[order], np.arange(nlist + 1))
+        self.size = len(rows)
+        self.built_rows = int(rows.max()) + 1 if len(rows) else 0
+
+    @property
+    def nlist(self) -> int:
+        return len(self.centroids)
+
+    def probe(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        lists = _top_k(self.centroids @ query, min(nprobe, self.nlist))
+        return np.concatenate([self.list_rows[self.list_offsets[c]:self.list_offsets[c + 1]] for c in lists])
+
+
+class QuantumCandidateIndex:
+    """
+    Append-only candidate vector store with brute-force and IVF search
+    vectors.f32 holds unit-normalized float32 rows, candidates.jsonl one metadata line per row;
+    re-indexing a candidate appends a new row and retires the old one. Appends are serialized across
+    processes with a file lock, and every process picks up rows appended by the others before it searches
+    """
+
+    def __init__(self, directory: str = None, ivf_min_rows: int = None, nprobe: int = None):
+        self.directory = directory or os.getenv('QUANTUM_CANDIDATE_INDEX_DIR', DEFAULT_INDEX_DIR)
+        self.ivf_min_rows = ivf_min_rows or int(os.getenv('QUANTUM_IVF_MIN_ROWS', '20000'))
+        self.nprobe = nprobe or int(os.getenv('QUANTUM_IVF_NPROBE', '16'))
+
+        self.matrix_path = os.path.join(self.directory, 'vectors.f32')
+        self.metadata_path = os.path.join(self.directory, 'candidates.jsonl')
+        self.meta_path = os.path.join(self.directory, 'meta.json')
+        self.lock_path = os.path.join(self.directory, 'index.lock')
+
+        self.dim: Optional[int] = None
+        self._metadata: List[Dict] = []
+        self._metadata_offset = 0
+        self._row_of: Dict[str, int] = {}
+        self._live = np.zeros(0, dtype=bool)
+        self._matrix = None
+        self._ivf: Optional[_IVFIndex] = None
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self.stats = {'searches': 0, 'exact_searches': 0, 'ivf_searches': 0, 'ivf_builds': 0}
+
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            self._sync()
+
+    @contextmanager
+    def _file_lock(self):
+        """Serialize appends across worker processes sharing the index"""
+        with open(self.lock_path, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _stored_rows(self) -> int:
+        if self.dim is None or not os.path.exists(self.matrix_path):
+            return 0
+        return os.path.getsize(self.matrix_path) // (self.dim * 4)
+
+    def _sync(self):
+        """Pick up metadata lines appended since the last read (possibly by another process); call under _lock"""
+        if self.dim is None:
+            if not os.path.exists(self.meta_path):
+                return
+            with open(self.meta_path) as f:
+                self.dim = json.load(f)['dim']
+        if not os.path.exists(self.metadata_path) or os.path.getsize(self.metadata_path) == self._metadata_offset:
+            return
+
+        # Vectors land before their metadata line, so a complete line always has its row on disk
+        stored_rows = self._stored_rows()
+        records = []
+        with open(self.metadata_path, 'rb') as f:
+            f.seek(self._metadata_offset)
+            for line in f:
+                if not line.endswith(b'\n') or len(self._metadata) + len(records) >= stored_rows:
+                    break  # partially written line; re-read next time
+                self._metadata_offset += len(line)
+                records.append(json.loads(line))
+        if not records:
+            return
+
+        start_row = len(self._metadata)
+        self._metadata.extend(records)
+        self._live = np.concatenate([self._live, np.ones(len(records), dtype=bool)])
+        for offset, record in enumerate(records):
+            previous = self._row_of.get(record['candidate_id'])
+            if previous is not None:
+                self._live[previous] = False
+            self._row_of[record['candidate_id']] = start_row + offset
+
+    def _map_matrix(self) -> np.ndarray:
+        rows = len(self._metadata)
+        if self._matrix is None or self._matrix.shape[0] != rows:
+            self._matrix = np.memmap(self.matrix_path, dtype=np.float32, mode='r', shape=(rows, self.dim)) if rows \
+                else np.zeros((0, self.dim or 0), dtype=np.float32)
+        return self._matrix
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def add(self, candidate_ids: List[str], vectors: np.ndarray, metadata: List[Dict] = None):
+        """Index (or re-index) candidates; vectors are normalized so scores are cosine similarities"""
+        vectors = np.ascontiguousarray(_normalize(vectors))
+        metadata = metadata or [{} for _ in candidate_ids]
+        now = datetime.now().isoformat()
+
+        with self._lock, self._file_lock():
+            self._sync()
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+                with open(self.meta_path + '.tmp', 'w') as f:
+                    json.dump({'dim': self.dim}, f)
+                os.replace(self.meta_path + '.tmp', self.meta_path)
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"Vector dimension {vectors.shape[1]} does not match index dimension {self.dim}")
+
+            records = [
+                {**extra, 'candidate_id': str(candidate_id), 'indexed_at': now}
+                for candidate_id, extra in zip(candidate_ids, metadata)
+            ]
+            # Anything past the last complete row was left by a writer that crashed (no live writer can be
+            # appending while we hold the file lock); cut it off so the new rows land at the right offsets
+            start_row = len(self._metadata)
+            complete_sizes = ((self.matrix_path, start_row * self.dim * 4), (self.metadata_path, self._metadata_offset))
+            for path, size in complete_sizes:
+                if os.path.exists(path) and os.path.getsize(path) > size:
+                    os.truncate(path, size)
+
+            # Vectors first, metadata second: a metadata line only exists once its row is on disk
+            with open(self.matrix_path, 'ab') as f:
+                f.write(vectors.tobytes())
+            with open(self.metadata_path, 'ab') as f:
+                f.write(''.join(json.dumps(record, default=str) + '\n' for record in records).encode('utf-8'))
+            self._sync()
+
+    def build_ivf(self, nlist: int = None) -> Dict:
+        """(Re)build the IVF lists over the live rows; nlist defaults to ~sqrt(rows)"""
+        with self._build_lock:
+            return self._build_ivf(nlist)
+
+    def _build_ivf(self, nlist: int = None) -> Dict:
+        # k-means runs outside _lock: searches keep using the previous lists until the new ones are swapped in
+        with self._lock:
+            self._sync()
+            rows = np.flatnonzero(self._live)
+            if not len(rows):
+                self._ivf = None
+                return {'nlist': 0, 'rows': 0, 'seconds': 0.0}
+            matrix = self._map_matrix()
+
+        started = time.perf_counter()
+        nlist = nlist or int(np.clip(np.sqrt(len(rows)), 16, 4096))
+        ivf = _IVFIndex(matrix, rows, nlist)
+        with self._lock:
+            self._ivf = ivf
+            self.stats['ivf_builds'] += 1
+        return {'nlist': ivf.nlist, 'rows': ivf.size, 'seconds': round(time.perf_counter() - started, 3)}
+
+    def _ivf_for_search(self) -> Optional[_IVFIndex]:
+        """
+        IVF lists for a search, called without _lock held
+        Rows added since the build are scanned exhaustively; once they exceed 10% of the index one caller
+        rebuilds while the others keep searching the current lists. None while the first build is running
+        """
+        with self._lock:
+            ivf = self._ivf
+            stale = ivf is None or len(self._metadata) - ivf.built_rows > 0.1 * max(ivf.size, 1)
+        if stale and self._build_lock.acquire(blocking=False):
+            try:
+                self._build_ivf()
+            finally:
+                self._build_lock.release()
+            with self._lock:
+                ivf = self._ivf
+        return ivf
+
+    def search(self, query: np.ndarray, k: int = 10, mode: str = SEARCH_AUTO, nprobe: int = None) -> List[Dict]:
+        """Top-k candidates by cosine similarity to the query vector"""
+        query = _normalize(query).reshape(-1)
+        if mode == SEARCH_AUTO:
+            mode = SEARCH_IVF if len(self) >= self.ivf_min_rows else SEARCH_EXACT
+        if mode not in (SEARCH_EXACT, SEARCH_IVF):
+            raise ValueError(f"Unknown search mode: {mode}")
+
+        with self._lock:
+            self._sync()
+            if not len(self):
+                return []
+        ivf = self._ivf_for_search() if mode == SEARCH_IVF else None
+        if mode == SEARCH_IVF and ivf is None:
+            mode = SEARCH_EXACT  # first build still running in another thread
+        with self._lock:
+            matrix = self._map_matrix()
+            live = self._live.copy()
+            total_rows = len(self._metadata)
+            metadata = self._metadata
+
+        if mode == SEARCH_IVF:
+            candidate_rows = np.concatenate([
+                ivf.probe(query, nprobe or self.nprobe), np.arange(ivf.built_rows, total_rows)
+            ])
+            candidate_rows = np.sort(candidate_rows[live[candidate_rows]])
+            scores = np.asarray(matrix[candidate_rows]) @ query
+        else:
+            scores = np.concatenate([
+                np.asarray(matrix[start:start + _SCAN_CHUNK_ROWS]) @ query
+                for start in range(0, total_rows, _SCAN_CHUNK_ROWS)
+            ])
+            scores[~live] = -np.inf
+            candidate_rows = np.arange(total_rows)
+
+        self.stats['searches'] += 1
+        self.stats[f'{mode}_searches'] += 1
+        top = _top_k(scores, k)
+        return [
+            {**metadata[candidate_rows[i]], 'similarity': round(float(scores[i]), 6)}
+            for i in top if np.isfinite(scores[i])
+        ]
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'directory': self.directory,
+                'candidates': len(self),
+                'stored_rows': len(self._metadata),
+                'dim': self.dim,
+                'ivf_lists': self._ivf.nlist if self._ivf is not None else 0,
+                'ivf_min_rows': self.ivf_min_rows,
+                'nprobe': self.nprobe,
+                **self.stats
+            }
+
+
+def run_benchmark(rows: int = 100000, dim: int = 384, queries: int = 200, k: int = 10,
+                  nprobes: List[int] = None, directory: str = None, seed: int = 0) -> Dict:
+    """
+    Recall@k and latency of IVF search against exact search on clustered synthetic embeddings
+    (real resume embeddings cluster by role and skill set, which is what IVF relies on)
+    """
+    import tempfile
+
+    rng = np.random.default_rng(seed)
+    centers = _normalize(rng.standard_normal((max(8, rows // 500), dim), dtype=np.float32))
+
+    def sample(count):
+        # Noise with about the same norm as the cluster center
+        noise = rng.standard_normal((count, dim), dtype=np.float32) / np.float32(np.sqrt(dim))
+        return centers[rng.integers(len(centers), size=count)] + noise
+
+    vectors = sample(rows)
+    query_vectors = sample(queries)
+
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        index = QuantumCandidateIndex(tmp)
+        started = time.perf_counter()
+        for start in range(0, rows, _SCAN_CHUNK_ROWS):
+            end = min(rows, start + _SCAN_CHUNK_ROWS)
+            index.add([f'C{i}' for i in range(start, end)], vectors[start:end])
+        add_seconds = time.perf_counter() - started
+        build = index.build_ivf()
+
+        def timed(mode, nprobe=None):
+            latencies, results = [], []
+            for query in query_vectors:
+                started = time.perf_counter()
+                results.append([hit['candidate_id'] for hit in index.search(query, k, mode, nprobe)])
+                latencies.append((time.perf_counter() - started) * 1000)
+            latencies.sort()
+            return results, {
+                'p50_ms': round(latencies[len(latencies) // 2], 3),
+                'p99_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 3)
+            }
+
+        exact_results, exact_latency = timed(SEARCH_EXACT)
+        report = {
+            'rows': rows, 'dim': dim, 'queries': queries, 'k': k,
+            'add_seconds': round(add_seconds, 3),
+            'ivf_build': build,
+            'exact': exact_latency,
+            'ivf': {}
+        }
+        for nprobe in nprobes or [1, 4, 8, 16, 32]:
+            ivf_results, ivf_latency = timed(SEARCH_IVF, nprobe)
+            recall = np.mean([
+                len(set(found) & set(truth)) / len(truth) for found, truth in zip(ivf_results, exact_results)
+            ])
+            report['ivf'][f'nprobe_{nprobe}'] = {f'recall_at_{k}': round(float(recall), 4), **ivf_latency}
+    return report
+
+
+def load_candidates_csv(path: str, index: QuantumCandidateIndex = None) -> int:
+    """Index the resume_summary column of a candidates CSV (e.g. sample_data/quantum_candidates.csv)"""
+    import pandas as pd
+    from quantum_neural_architecture import NeuralTalentAcquisitionSystem
+
+    index = index or QuantumCandidateIndex()
+    candidates = pd.read_csv(path).dropna(subset=['resume_summary'])
+    talent = NeuralTalentAcquisitionSystem()
+    resumes = candidates['resume_summary'].astype(str).tolist()
+    index.add(
+        candidates['candidate_id'].astype(str).tolist(),
+        talent.encode_resumes(resumes),
+        [
+            {'name': row['name'], 'skills': talent._extract_neural_skills(resume)}
+            for (_, row), resume in zip(candidates.iterrows(), resumes)
+        ]
+    )
+    return len(candidates)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Candidate vector index tools")
+    parser.add_argument('--load-csv', help="Index resume_summary from a candidates CSV")
+    parser.add_argument('--benchmark', action='store_true', help="Recall/latency benchmark on synthetic embeddings")
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--dim', type=int, default=384)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--output', help="Write the benchmark report to this JSON file")
+    args = parser.parse_args()
+
+    if args.load_csv:
+        print(f"Indexed {load_candidates_csv(args.load_csv)} candidates")
+    if args.benchmark:
+        report = run_benchmark(args.rows, args.dim, args.queries, args.k)
+        print(json.dumps(report, indent=2))
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(report, f, indent=2)
@@ -0,0 +1,142 @@
+# Quantum Document Extraction
+# Spools resume uploads to disk and extracts PDF / DOCX / TXT text page by page within size and page limits
+
+import os
+import hashlib
+import tempfile
+from typing import Dict
+
+DEFAULT_MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+DEFAULT_MAX_PAGES = 30
+DEFAULT_MAX_CHARS = 200000
+
+# Bytes read from the upload per spool write
+SPOOL_CHUNK_BYTES = 1024 * 1024
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.txt')
+
+
+class DocumentExtractionError(ValueError):
+    """Document could not be turned into resume text"""
+
+
+class DocumentTooLargeError(DocumentExtractionError):
+    """Upload exceeds the byte or page limit"""
+
+
+class UnsupportedDocumentError(DocumentExtractionError):
+    """File type the extractor does not handle"""
+
+
+def upload_limits() -> Dict:
+    return {
+        'max_bytes': int(os.getenv('QUANTUM_UPLOAD_MAX_BYTES', str(DEFAULT_MAX_UPLOAD_BYTES))),
+        'max_pages': int(os.getenv('QUANTUM_UPLOAD_MAX_PAGES', str(DEFAULT_MAX_PAGES))),
+        'max_chars': int(os.getenv('QUANTUM_UPLOAD_MAX_CHARS', str(DEFAULT_MAX_CHARS)))
+    }
+
+
+def document_extension(filename: str, allowed_extensions=SUPPORTED_EXTENSIONS) -> str:
+    extension = os.path.splitext(filename or '')[1].lower()
+    if extension not in allowed_extensions:
+        raise UnsupportedDocumentError(
+            f"Unsupported resume format '{extension or filename}'; expected one of {', '.join(allowed_extensions)}"
+        )
+    return extension
+
+
+def spool_directory():
+    return os.getenv('QUANTUM_UPLOAD_SPOOL_DIR') or None
+
+
+async def spool_upload(upload, max_bytes: int, allowed_extensions=SUPPORTED_EXTENSIONS) -> Dict:
+    """
+    Copy an UploadFile to a temporary file in fixed-size chunks, never holding the whole upload in memory
+    Returns {'path', 'size_bytes', 'content_hash'}; the caller removes the file. Raises DocumentTooLargeError
+    past max_bytes
+    """
+    extension = document_extension(upload.filename, allowed_extensions)
+    fd, path = tempfile.mkstemp(suffix=extension, prefix='quantum-upload-', dir=spool_directory())
+    size = 0
+    digest = hashlib.sha256()
+    try:
+        with os.fdopen(fd, 'wb') as spool:
+            while True:
+                chunk = await upload.read(SPOOL_CHUNK_BYTES)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise DocumentTooLargeError(f"Upload exceeds the {max_bytes} byte limit")
+                spool.write(chunk)
+                digest.update(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return {'path': path, 'size_bytes': size, 'content_hash': digest.hexdigest()}
+
+
+def _extract_pdf(path: str, max_pages: int, max_chars: int) -> Dict:
+    import pdfplumber
+
+    pages = []
+    chars = 0
+    with pdfplumber.open(path) as pdf:
+        page_count = len(pdf.pages)
+        if page_count > max_pages:
+            raise DocumentTooLargeError(f"PDF has {page_count} pages; the limit is {max_pages}")
+        for page in pdf.pages:
+            text = page.extract_text() or ''
+            page.close()  # drop the page's parsed objects before moving on
+            pages.append(text)
+            chars += len(text)
+            if chars >= max_chars:
+                break
+    return {'text': '\n'.join(pages)[:max_chars], 'pages': page_count, 'pages_extracted': len(pages)}
+
+
+def _extract_docx(path: str, max_pages: int, max_chars: int) -> Dict:
+    import docx
+
+    document = docx.Document(path)
+    blocks = []
+    chars = 0
+    for paragraph in document.paragraphs:
+        blocks.append(paragraph.text)
+        chars += len(paragraph.text)
+        if chars >= max_chars:
+            break
+    else:
+        # Skills and experience are often laid out in tables
+        for table in document.tables:
+            for row in table.rows:
+                line = ' | '.join(cell.text for cell in row.cells)
+                blocks.append(line)
+                chars += len(line)
+            if chars >= max_chars:
+                break
+    return {'text': '\n'.join(block for block in blocks if block.strip())[:max_chars], 'pages': None, 'pages_extracted': None}
+
+
+def _extract_txt(path: str, max_pages: int, max_chars: int) -> Dict:
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return {'text': f.read(max_chars), 'pages': None, 'pages_extracted': None}
+
+
+_EXTRACTORS = {'.pdf': _extract_pdf, '.docx': _extract_docx, '.txt': _extract_txt}
+
+
+def extract_document_text(path: str, filename: str, max_pages: int = DEFAULT_MAX_PAGES,
+                          max_chars: int = DEFAULT_MAX_CHARS) -> Dict:
+    """Extract resume text from a spooled file; CPU-bound, meant for the inference worker pool"""
+    extension = document_extension(filename)
+    try:
+        extracted = _EXTRACTORS[extension](path, max_pages, max_chars)
+    except (DocumentExtractionError, ImportError):
+        raise
+    except Exception as e:
+        raise DocumentExtractionError(f"Could not read {extension} resume: {str(e)}")
+
+    if not extracted['text'].strip():
+        raise DocumentExtractionError("No text could be extracted (scanned or empty document?)")
+    return {**extracted, 'format': extension.lstrip('.'), 'truncated': len(extracted['text']) >= max_chars}
@@ -0,0 +1,175 @@
+# Quantum Embedding Store
+# Persistent embedding cache keyed by (model name, text hash), backed by a memory-mapped float32 matrix
+
+import os
+import re
+import json
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+DEFAULT_STORE_DIR = os.path.join('.quantum_cache', 'embeddings')
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class _ModelEmbeddingFile:
+    """
+    Append-only embedding matrix for one model
+    <model>.f32 holds the raw float32 rows, <model>.index maps text hashes to row numbers
+    """
+
+    def __init__(self, directory: str, model_name: str):
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', model_name)
+        self.model_name = model_name
+        self.matrix_path = os.path.join(directory, f'{safe_name}.f32')
+        self.index_path = os.path.join(directory, f'{safe_name}.index')
+        self.meta_path = os.path.join(directory, f'{safe_name}.meta.json')
+        self.lock_path = os.path.join(directory, f'{safe_name}.lock')
+
+        self.dim: Optional[int] = None
+        self.rows: Dict[str, int] = {}
+        self._index_offset = 0
+        self._matrix = None
+        self._lock = threading.Lock()
+
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path) as f:
+                self.dim = json.load(f)['dim']
+        self._sync_index()
+
+    @contextmanager
+    def _file_lock(self):
+        """Serialize appends across worker processes sharing the store"""
+        with open(self.lock_path, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _stored_rows(self) -> int:
+        if self.dim is None or not os.path.exists(self.matrix_path):
+            return 0
+        return os.path.getsize(self.matrix_path) // (self.dim * 4)
+
+    def _sync_index(self):
+        """Pick up index lines appended since the last read (possibly by another process)"""
+        if not os.path.exists(self.index_path):
+            return
+        stored_rows = self._stored_rows()
+        with open(self.index_path) as f:
+            f.seek(self._index_offset)
+            for line in f:
+                if not line.endswith('\n'):
+                    break  # partially written line; re-read next time
+                self._index_offset += len(line.encode('utf-8'))
+                digest, row = line.rstrip('\n').split('\t')
+                if int(row) < stored_rows:
+                    self.rows[digest] = int(row)
+
+    def _map_matrix(self):
+        stored_rows = self._stored_rows()
+        if self._matrix is None or self._matrix.shape[0] < stored_rows:
+            self._matrix = np.memmap(self.matrix_path, dtype=np.float32, mode='r', shape=(stored_rows, self.dim))
+        return self._matrix
+
+    def get(self, digests: List[str]) -> Dict[str, np.ndarray]:
+        with self._lock:
+            if any(digest not in self.rows for digest in digests):
+                self._sync_index()
+            found = {digest: self.rows[digest] for digest in digests if digest in self.rows}
+            if not found:
+                return {}
+            matrix = self._map_matrix()
+            return {digest: np.array(matrix[row]) for digest, row in found.items()}
+
+    def append(self, digests: List[str], vectors: np.ndarray):
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        with self._lock, self._file_lock():
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+                with open(self.meta_path, 'w') as f:
+                    json.dump({'model': self.model_name, 'dim': self.dim}, f)
+            self._sync_index()
+
+            # A crash can leave a torn row at the end of the matrix or a torn line at the end of the index;
+            # cut both back to the last complete entry so new rows land exactly where the index says
+            start_row = self._stored_rows()
+            with open(self.matrix_path, 'ab') as f:
+                f.truncate(start_row * self.dim * 4)
+                f.write(vectors.tobytes())
+            with open(self.index_path, 'ab') as f:
+                f.truncate(self._index_offset)
+                f.write(''.join(f'{digest}\t{start_row + i}\n' for i, digest in enumerate(digests)).encode('utf-8'))
+            self._sync_index()
+
+
+class QuantumEmbeddingStore:
+    """
+    Persistent embedding cache shared by the workforce and talent systems
+    Texts already embedded by a model are read back from disk instead of re-running the transformer
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or os.getenv('QUANTUM_EMBEDDING_STORE_DIR', DEFAULT_STORE_DIR)
+        self._files: Dict[str, _ModelEmbeddingFile] = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def _model_file(self, model_name: str) -> _ModelEmbeddingFile:
+        with self._lock:
+            if model_name not in self._files:
+                os.makedirs(self.directory, exist_ok=True)
+                self._files[model_name] = _ModelEmbeddingFile(self.directory, model_name)
+            return self._files[model_name]
+
+    def encode(self, model_name: str, texts: List[str],
+               encoder: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """
+        Embed texts with model_name, calling encoder only for texts not stored yet
+        Returns a float32 matrix with one row per input text
+        """
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        model_file = self._model_file(model_name)
+        digests = [text_hash(text) for text in texts]
+        vectors = model_file.get(list(set(digests)))
+
+        # Encode each missing text once, even if it repeats within the batch
+        missing = {}
+        for digest, text in zip(digests, texts):
+            if digest not in vectors and digest not in missing:
+                missing[digest] = text
+        if missing:
+            encoded = np.asarray(encoder(list(missing.values())), dtype=np.float32)
+            model_file.append(list(missing.keys()), encoded)
+            vectors.update(zip(missing.keys(), encoded))
+
+        self.stats['misses'] += len(missing)
+        self.stats['hits'] += len(texts) - len(missing)
+        return np.stack([vectors[digest] for digest in digests])
+
+    def get_stats(self) -> Dict:
+        return {
+            'directory': self.directory,
+            'models': {name: len(model_file.rows) for name, model_file in self._files.items()},
+            **self.stats
+        }
+
+
+# Shared store for the whole process
+embedding_store = QuantumEmbeddingStore()
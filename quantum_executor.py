@@ -0,0 +1,264 @@
+# Quantum Inference Executor
+# Runs CPU-bound embedding, torch inference and keyword scoring off the event loop
+#
+# Usage (thread / process parity check):
+#   python quantum_executor.py --verify
+
+import os
+import time
+import asyncio
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List
+
+import torch
+
+from quantum_metrics import metrics
+
+logger = logging.getLogger("QuantumHR-Executor")
+
+EXECUTOR_THREAD = 'thread'
+EXECUTOR_PROCESS = 'process'
+
+# Systems used by tasks in this process (the API's instances in thread mode, per-worker copies in process mode)
+_worker_systems: Dict = {}
+
+
+def _configure_torch_threads(torch_threads: int):
+    torch.set_num_threads(torch_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # inter-op pool already started in this process
+
+
+def _initialize_process_worker(torch_threads: int, model_state: Dict = None):
+    """
+    Process-pool initializer: build the systems and preload the shared sentence model once per worker
+    model_state (QuantumWorkforceIntelligence.model_state() of the parent) makes every worker score with the
+    parent's network weights; without it each worker would draw its own random initialization
+    """
+    from quantum_neural_architecture import QuantumWorkforceIntelligence, NeuralTalentAcquisitionSystem
+
+    _configure_torch_threads(torch_threads)
+    _worker_systems['workforce'] = QuantumWorkforceIntelligence()
+    if model_state is not None:
+        _worker_systems['workforce'].load_model_state(model_state)
+    _worker_systems['talent'] = NeuralTalentAcquisitionSystem()
+    _worker_systems['workforce'].sentence_model
+
+
+def _psychology_analysis(feedback_text: str, employee_data: Dict, include_neurological_patterns: bool,
+                         behavioral_prediction_horizon: int, psychological_output: Dict = None) -> Dict:
+    workforce = _worker_systems['workforce']
+    quantum_matrix = workforce.analyze_quantum_psychological_state(
+        feedback_text, employee_data, include_neurological_patterns, behavioral_prediction_horizon,
+        psychological_output
+    )
+    temporal_risk = workforce.predict_temporal_attrition_risk(quantum_matrix, employee_data, [1, 3, 6, 12])
+    intervention_blueprint = workforce.engineer_personalized_interventions(quantum_matrix, employee_data, 0.85)
+    return {
+        'quantum_matrix': quantum_matrix,
+        'temporal_risk': temporal_risk,
+        'intervention_blueprint': intervention_blueprint
+    }
+
+
+def _psychological_outputs(feedback_texts: List[str]) -> List[Dict]:
+    return _worker_systems['workforce'].compute_psychological_outputs(feedback_texts)
+
+
+def _workforce_batch(employees, include_ai_insights: bool = True):
+    return _worker_systems['workforce'].analyze_workforce_batch(employees, include_ai_insights=include_ai_insights)
+
+
+def _candidate_batch(resume_texts: List[str], candidates: List[Dict], include_ai_assessment: bool = True) -> List[Dict]:
+    return _worker_systems['talent'].analyze_candidate_profiles(resume_texts, candidates, include_ai_assessment)
+
+
+def _document_extraction(path: str, filename: str, max_pages: int, max_chars: int) -> Dict:
+    from quantum_document_extraction import extract_document_text
+    return extract_document_text(path, filename, max_pages, max_chars)
+
+
+def _resume_embeddings(texts: List[str]):
+    return _worker_systems['talent'].encode_resumes(texts)
+
+
+def _candidate_analysis(resume_text: str, candidate_data: Dict) -> Dict:
+    return _worker_systems['talent'].analyze_candidate_neural_profile(resume_text, candidate_data)
+
+
+_TASKS = {
+    'psychology_analysis': _psychology_analysis,
+    'psychological_outputs': _psychological_outputs,
+    'workforce_batch': _workforce_batch,
+    'candidate_analysis': _candidate_analysis,
+    'candidate_batch': _candidate_batch,
+    'resume_embeddings': _resume_embeddings,
+    'document_extraction': _document_extraction
+}
+
+
+def _run_task(task_name: str, args: tuple, kwargs: dict):
+    # Metric events travel back with the result; neither pool thread nor worker process sees the request context
+    with metrics.capture() as events:
+        result = _TASKS[task_name](*args, **kwargs)
+    return result, events
+
+
+class QuantumInferenceExecutor:
+    """
+    Thread- or process-pool dispatcher for the CPU-bound analysis tasks
+    Process mode gives every worker its own preloaded models so one uvicorn process can use every core
+    """
+
+    def __init__(self, workforce=None, talent=None, mode: str = None, max_workers: int = None,
+                 torch_threads: int = None):
+        self.mode = mode or os.getenv('QUANTUM_EXECUTOR_MODE', EXECUTOR_THREAD)
+        if self.mode not in (EXECUTOR_THREAD, EXECUTOR_PROCESS):
+            raise ValueError(f"Unknown executor mode: {self.mode}")
+
+        cpu_count = os.cpu_count() or 1
+        # Thread-mode tasks also wait on Gemini, so allow more threads than cores (ThreadPoolExecutor's default)
+        default_workers = cpu_count if self.mode == EXECUTOR_PROCESS else min(32, cpu_count + 4)
+        self.max_workers = max_workers or int(os.getenv('QUANTUM_EXECUTOR_WORKERS', str(default_workers)))
+        default_torch_threads = max(1, cpu_count // self.max_workers) if self.mode == EXECUTOR_PROCESS else cpu_count
+        self.torch_threads = torch_threads or int(os.getenv('QUANTUM_TORCH_THREADS', str(default_torch_threads)))
+
+        if self.mode == EXECUTOR_PROCESS:
+            # spawn, not fork: forking a process with live torch thread pools can deadlock
+            model_state = workforce.model_state() if workforce is not None else None
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_initialize_process_worker,
+                initargs=(self.torch_threads, model_state)
+            )
+        else:
+            _configure_torch_threads(self.torch_threads)
+            _worker_systems['workforce'] = workforce
+            _worker_systems['talent'] = talent
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='quantum-inference')
+
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._max_queue_depth = 0
+        self._task_seconds: Dict[str, Dict] = {}
+
+    async def run(self, task_name: str, *args, **kwargs):
+        """Dispatch a named task to the pool and await its result"""
+        with self._lock:
+            self._submitted += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth())
+
+        started = time.perf_counter()
+        failed = False
+        try:
+            result, events = await asyncio.wrap_future(self._pool.submit(_run_task, task_name, args, kwargs))
+            metrics.replay(events)
+            return result
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                # completed and failed are disjoint; together they are every task that has left the pool
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+                task_stats = self._task_seconds.setdefault(task_name, {'count': 0, 'total_seconds': 0.0})
+                task_stats['count'] += 1
+                task_stats['total_seconds'] += elapsed
+
+    def _queue_depth(self) -> int:
+        return max(0, self._in_flight() - self.max_workers)
+
+    def _in_flight(self) -> int:
+        return self._submitted - self._completed - self._failed
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'mode': self.mode,
+                'max_workers': self.max_workers,
+                'torch_threads': self.torch_threads,
+                'in_flight': self._in_flight(),
+                'queue_depth': self._queue_depth(),
+                'max_queue_depth': self._max_queue_depth,
+                'submitted': self._submitted,
+                'completed': self._completed,
+                'failed': self._failed,
+                'tasks': {
+                    name: {**stats, 'mean_seconds': stats['total_seconds'] / stats['count']}
+                    for name, stats in self._task_seconds.items()
+                }
+            }
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
+
+
+async def _collect_outputs(executor: QuantumInferenceExecutor, employees: List[Dict], candidates: List[Dict]) -> Dict:
+    feedback_texts = [employee['feedback'] for employee in employees]
+    resume_texts = [candidate['resume_text'] for candidate in candidates]
+    return {
+        'psychological_outputs': await executor.run('psychological_outputs', feedback_texts),
+        'workforce_batch': await executor.run('workforce_batch', employees, include_ai_insights=False),
+        'candidate_batch': await executor.run('candidate_batch', resume_texts, candidates, include_ai_assessment=False)
+    }
+
+
+def verify_modes(workforce, talent, employees: List[Dict], candidates: List[Dict], max_workers: int = 2) -> Dict:
+    """
+    Run the same model-only tasks in thread and process mode from one set of systems and compare the results
+    Employees need a 'feedback' text and candidates a 'resume_text'; LLM stages are skipped
+    """
+    report = {}
+    outputs = {}
+    for mode in (EXECUTOR_THREAD, EXECUTOR_PROCESS):
+        executor = QuantumInferenceExecutor(workforce, talent, mode=mode, max_workers=max_workers)
+        try:
+            started = time.perf_counter()
+            outputs[mode] = asyncio.run(_collect_outputs(executor, employees, candidates))
+            report[f"{mode}_seconds"] = round(time.perf_counter() - started, 3)
+        finally:
+            executor.shutdown()
+    for task_name, thread_results in outputs[EXECUTOR_THREAD].items():
+        process_results = outputs[EXECUTOR_PROCESS][task_name]
+        report[task_name] = {
+            'checked': len(thread_results),
+            'mismatches': sum(a != b for a, b in zip(thread_results, process_results))
+        }
+    return report
+
+
+if __name__ == "__main__":
+    import json
+    import argparse
+    import pandas as pd
+    from quantum_neural_architecture import QuantumWorkforceIntelligence, NeuralTalentAcquisitionSystem
+
+    parser = argparse.ArgumentParser(description="Thread / process executor parity check")
+    parser.add_argument('--verify', action='store_true', help="Compare thread and process mode outputs")
+    parser.add_argument('--employees', default='sample_data/quantum_employees.csv')
+    parser.add_argument('--candidates', default='sample_data/quantum_candidates.csv')
+    parser.add_argument('--workers', type=int, default=2)
+    args = parser.parse_args()
+
+    if args.verify:
+        employee_frame = pd.read_csv(args.employees).rename(columns={'feedback_text': 'feedback'})
+        candidate_frame = pd.read_csv(args.candidates).rename(columns={'resume_summary': 'resume_text'})
+        report = verify_modes(
+            QuantumWorkforceIntelligence(), NeuralTalentAcquisitionSystem(),
+            employee_frame.to_dict('records'), candidate_frame.to_dict('records'), args.workers
+        )
+        print(json.dumps(report, indent=2))
+        mismatched = any(isinstance(entry, dict) and entry['mismatches'] for entry in report.values())
+        raise SystemExit(1 if mismatched else 0)
@@ -0,0 +1,249 @@
+# Quantum Job Queue
+# Durable background jobs for bulk workforce analyses with progress, cancellation and resume
+
+import os
+import json
+import uuid
+import sqlite3
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from quantum_batch_insights import QuantumBatchAggregator, build_batch_record
+
+logger = logging.getLogger("QuantumHR-Jobs")
+
+DEFAULT_JOBS_DB = os.path.join('.quantum_cache', 'jobs.sqlite3')
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+
+
+class QuantumJobManager:
+    """
+    SQLite-backed job queue running QuantumWorkforceIntelligence batch analyses on a worker pool
+    Inputs, progress and per-employee results are persisted chunk by chunk, so an interrupted
+    job resumes from its last completed chunk after a restart
+    """
+
+    def __init__(self, workforce, db_path: str = None, max_workers: int = None, chunk_size: int = None,
+                 analysis_store=None):
+        self.workforce = workforce
+        self.analysis_store = analysis_store
+        self.db_path = db_path or os.getenv('QUANTUM_JOBS_DB', DEFAULT_JOBS_DB)
+        self.max_workers = max_workers or int(os.getenv('QUANTUM_JOB_WORKERS', '2'))
+        self.chunk_size = chunk_size or int(os.getenv('QUANTUM_JOB_CHUNK_SIZE', '64'))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='quantum-job')
+        self._scheduled = set()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    analysis_type TEXT NOT NULL,
+                    total INTEGER NOT NULL,
+                    processed INTEGER NOT NULL DEFAULT 0,
+                    failed INTEGER NOT NULL DEFAULT 0,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    summary TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS job_inputs (
+                    job_id TEXT NOT NULL,
+                    idx INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (job_id, idx)
+                );
+                CREATE TABLE IF NOT EXISTS job_results (
+                    job_id TEXT NOT NULL,
+                    idx INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (job_id, idx)
+                );
+                CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+            """)
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=30)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def submit(self, employees: List[Dict], analysis_type: str = "comprehensive") -> Dict:
+        """Persist a new job and schedule it; employees without feedback are skipped"""
+        employees = [employee for employee in employees if 'feedback' in employee]
+        job_id = uuid.uuid4().hex
+        now = datetime.now().isoformat()
+
+        with self._connect() as db:
+            db.execute(
+                "INSERT INTO jobs (job_id, status, analysis_type, total, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, JOB_QUEUED, analysis_type, len(employees), now, now)
+            )
+            db.executemany(
+                "INSERT INTO job_inputs (job_id, idx, payload) VALUES (?, ?, ?)",
+                ((job_id, i, json.dumps(employee, default=str)) for i, employee in enumerate(employees))
+            )
+
+        self._schedule(job_id)
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._connect() as db:
+            row = db.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        job = dict(row)
+        job['cancel_requested'] = bool(job['cancel_requested'])
+        job['summary'] = json.loads(job['summary']) if job['summary'] else None
+        job['progress'] = round(job['processed'] / job['total'] * 100, 2) if job['total'] else 100.0
+        return job
+
+    def results(self, job_id: str, offset: int = 0, limit: int = 500) -> List[Dict]:
+        """Per-employee results stored so far, in submission order"""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT payload FROM job_results WHERE job_id = ? ORDER BY idx LIMIT ? OFFSET ?",
+                (job_id, limit, offset)
+            ).fetchall()
+        return [json.loads(row['payload']) for row in rows]
+
+    def cancel(self, job_id: str) -> Optional[Dict]:
+        """Request cancellation; a running job stops after its current chunk"""
+        now = datetime.now().isoformat()
+        with self._connect() as db:
+            db.execute(
+                "UPDATE jobs SET cancel_requested = 1, updated_at = ? WHERE job_id = ?", (now, job_id)
+            )
+            db.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE job_id = ? AND status = ?",
+                (JOB_CANCELLED, now, job_id, JOB_QUEUED)
+            )
+        return self.get(job_id)
+
+    def resume_incomplete(self) -> List[str]:
+        """
+        Reschedule jobs left queued or running by a previous process
+        Jobs whose cancellation was requested before that process stopped are finalized as cancelled instead
+        """
+        with self._connect() as db:
+            cancelled = db.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status IN (?, ?) AND cancel_requested = 1",
+                (JOB_CANCELLED, datetime.now().isoformat(), JOB_QUEUED, JOB_RUNNING)
+            ).rowcount
+            rows = db.execute(
+                "SELECT job_id FROM jobs WHERE status IN (?, ?) AND cancel_requested = 0",
+                (JOB_QUEUED, JOB_RUNNING)
+            ).fetchall()
+        job_ids = [row['job_id'] for row in rows]
+        for job_id in job_ids:
+            self._schedule(job_id)
+        if cancelled:
+            logger.info(f"Finalized {cancelled} interrupted quantum jobs as cancelled")
+        if job_ids:
+            logger.info(f"Resuming {len(job_ids)} interrupted quantum jobs")
+        return job_ids
+
+    def _schedule(self, job_id: str):
+        with self._lock:
+            if job_id in self._scheduled:
+                return
+            self._scheduled.add(job_id)
+        self._executor.submit(self._run, job_id)
+
+    def _set_status(self, job_id: str, status: str, **fields):
+        assignments = ', '.join(f"{column} = ?" for column in fields)
+        with self._connect() as db:
+            db.execute(
+                f"UPDATE jobs SET status = ?, updated_at = ?{', ' + assignments if assignments else ''} WHERE job_id = ?",
+                (status, datetime.now().isoformat(), *fields.values(), job_id)
+            )
+
+    def _run(self, job_id: str):
+        try:
+            self._process(job_id)
+        except Exception as e:
+            logger.error(f"Quantum job {job_id} failed: {str(e)}")
+            self._set_status(job_id, JOB_FAILED, error=str(e))
+        finally:
+            with self._lock:
+                self._scheduled.discard(job_id)
+
+    def _process(self, job_id: str):
+        job = self.get(job_id)
+        if job is None or job['status'] not in (JOB_QUEUED, JOB_RUNNING):
+            return
+        self._set_status(job_id, JOB_RUNNING)
+        include_ai_insights = job['analysis_type'] == "comprehensive"
+
+        while True:
+            job = self.get(job_id)
+            if job['cancel_requested']:
+                self._set_status(job_id, JOB_CANCELLED)
+                return
+
+            with self._connect() as db:
+                rows = db.execute(
+                    "SELECT idx, payload FROM job_inputs WHERE job_id = ? AND idx >= ? ORDER BY idx LIMIT ?",
+                    (job_id, job['processed'], self.chunk_size)
+                ).fetchall()
+            if not rows:
+                break
+
+            employees = [json.loads(row['payload']) for row in rows]
+            analyses = self.workforce.analyze_workforce_batch(employees, include_ai_insights=include_ai_insights)
+            records = [build_batch_record(employee, analysis) for employee, analysis in zip(employees, analyses)]
+            failed = sum(1 for record in records if 'error' in record)
+
+            # Results and progress commit together, so a restart never double-counts a chunk
+            with self._connect() as db:
+                db.executemany(
+                    "INSERT OR REPLACE INTO job_results (job_id, idx, payload) VALUES (?, ?, ?)",
+                    ((job_id, row['idx'], json.dumps(record, default=str)) for row, record in zip(rows, records))
+                )
+                db.execute(
+                    "UPDATE jobs SET processed = ?, failed = failed + ?, updated_at = ? WHERE job_id = ?",
+                    (rows[-1]['idx'] + 1, failed, datetime.now().isoformat(), job_id)
+                )
+            if self.analysis_store is not None:
+                try:
+                    self.analysis_store.record_employee_analyses(employees, records, 'job')
+                except Exception as e:
+                    # The chunk's results are already committed; storage failures never fail the job
+                    logger.warning(f"Recording analyses for quantum job {job_id} failed: {str(e)}")
+
+        self._set_status(job_id, JOB_COMPLETED, summary=json.dumps(self._summarize(job_id), default=str))
+
+    def _summarize(self, job_id: str) -> Dict:
+        aggregator = QuantumBatchAggregator()
+        offset = 0
+        while True:
+            page = self.results(job_id, offset, 1000)
+            if not page:
+                break
+            for record in page:
+                aggregator.add(record)
+            offset += len(page)
+        return {'batch_summary': aggregator.summary(), 'quantum_insights': aggregator.insights()}
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,133 @@
+# Quantum LLM Response Cache
+# Content-addressed Gemini response cache: in-memory LRU tier plus optional SQLite tier
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+def prompt_cache_key(model_name: str, prompt: str) -> str:
+    """Content address of a rendered prompt for a given model"""
+    return hashlib.sha256(f"{model_name}\x00{prompt}".encode('utf-8')).hexdigest()
+
+
+class QuantumLLMCache:
+    """
+    Two-tier response cache keyed on sha256(model name + rendered prompt)
+    Entries expire after ttl_seconds; the memory tier evicts least-recently-used entries
+    """
+
+    def __init__(self, max_entries: int = None, ttl_seconds: float = None, db_path: Optional[str] = None):
+        self.max_entries = max_entries or int(os.getenv('QUANTUM_LLM_CACHE_SIZE', '2048'))
+        self.ttl_seconds = ttl_seconds or float(os.getenv('QUANTUM_LLM_CACHE_TTL_SECONDS', '86400'))
+        self.db_path = db_path if db_path is not None else os.getenv('QUANTUM_LLM_CACHE_DB')
+
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._db = None
+        self.stats = {
+            'memory_hits': 0, 'disk_hits': 0, 'misses': 0,
+            'stores': 0, 'evictions': 0, 'expirations': 0
+        }
+
+        if self.db_path:
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, model TEXT, value TEXT, created_at REAL, expires_at REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_expires ON llm_cache(expires_at)")
+            self._db.commit()
+
+    def get(self, model_name: str, prompt: str) -> Optional[str]:
+        """Cached response for this prompt, or None on a miss"""
+        key = prompt_cache_key(model_name, prompt)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.stats['memory_hits'] += 1
+                    return value
+                del self._entries[key]
+                self.stats['expirations'] += 1
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value, expires_at = row
+                    if expires_at > now:
+                        self._remember(key, expires_at, value)
+                        self.stats['disk_hits'] += 1
+                        return value
+                    self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._db.commit()
+                    self.stats['expirations'] += 1
+
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, model_name: str, prompt: str, value: str):
+        """Store a response in both tiers"""
+        key = prompt_cache_key(model_name, prompt)
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+
+        with self._lock:
+            self._remember(key, expires_at, value)
+            self.stats['stores'] += 1
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, model, value, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, model_name, value, now, expires_at)
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, expires_at: float, value: str):
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from both tiers; returns how many were removed"""
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+            removed = len(expired)
+            if self._db is not None:
+                removed += self._db.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,)).rowcount
+                self._db.commit()
+            self.stats['expirations'] += removed
+            return removed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_cache")
+                self._db.commit()
+
+    def get_stats(self) -> Dict:
+        hits = self.stats['memory_hits'] + self.stats['disk_hits']
+        lookups = hits + self.stats['misses']
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'disk_tier': bool(self._db),
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+            **self.stats
+        }
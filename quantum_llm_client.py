@@ -0,0 +1,280 @@
+# Quantum LLM Client
+# Non-blocking Gemini access with bounded concurrency, deadlines and retries of transient failures
+
+import os
+import json
+import asyncio
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+import google.auth
+import google.generativeai as genai
+import requests
+from google.api_core import exceptions as google_exceptions
+from google.auth.exceptions import DefaultCredentialsError
+
+from quantum_llm_cache import QuantumLLMCache
+
+logger = logging.getLogger("QuantumHR-LLM")
+
+DEFAULT_LLM_MODEL = 'gemini-pro'
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Transient failures worth another attempt: rate limits, 5xx / unavailable, and transport timeouts.
+# Anything else (missing credentials, 400, 401/403, ...) fails the same way on retry
+_RETRYABLE_ERRORS = (
+    google_exceptions.TooManyRequests,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServerError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    TimeoutError,
+    ConnectionError
+)
+
+# Set once configure_llm has given the SDK an API key or endpoint
+_llm_configured = False
+
+
+def parse_json_object(response_text: str) -> Optional[Dict]:
+    """
+    Strictly extract the first complete JSON object from an LLM response
+    Decodes one balanced object at a time instead of spanning from the first '{' to the last '}'
+    """
+    text = response_text.strip()
+    if text.startswith('```'):
+        text = text.strip('`')
+        if text.startswith('json'):
+            text = text[4:]
+        text = text.strip()
+
+    start = text.find('{')
+    while start != -1:
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(text, start)
+            if isinstance(parsed, dict):
+                return parsed
+        except ValueError:
+            pass
+        start = text.find('{', start + 1)
+    return None
+
+
+def configure_llm(api_key: str = None):
+    """
+    Configure the Gemini SDK
+    QUANTUM_LLM_ENDPOINT points the SDK at another REST endpoint (e.g. the local stub server)
+    """
+    global _llm_configured
+    endpoint = os.getenv('QUANTUM_LLM_ENDPOINT')
+    if endpoint:
+        genai.configure(
+            api_key=api_key or os.getenv('GOOGLE_API_KEY', 'stub-key'),
+            transport='rest',
+            client_options={'api_endpoint': endpoint}
+        )
+        _llm_configured = True
+    elif api_key:
+        genai.configure(api_key=api_key)
+        _llm_configured = True
+
+
+def _application_default_credentials_available() -> bool:
+    """Whether google.auth can find Application Default Credentials (probes the metadata server, so slow)"""
+    try:
+        google.auth.default()
+        return True
+    except DefaultCredentialsError:
+        return False
+
+
+class QuantumLLMClient:
+    """
+    Async Gemini client shared by every AI helper
+    All calls run on one background event loop, so a single semaphore bounds
+    concurrency for both async callers and sync callers running in worker threads
+    """
+
+    def __init__(self, model_name: str = DEFAULT_LLM_MODEL,
+                 max_concurrency: int = None,
+                 timeout_seconds: float = None,
+                 deadline_seconds: float = None,
+                 max_retries: int = None,
+                 backoff_seconds: float = None,
+                 cache: Optional[QuantumLLMCache] = None):
+        self.model_name = model_name
+        self.max_concurrency = max_concurrency or int(os.getenv('QUANTUM_LLM_MAX_CONCURRENCY', '8'))
+        self.timeout_seconds = timeout_seconds or float(os.getenv('QUANTUM_LLM_TIMEOUT_SECONDS', '20'))
+        self.deadline_seconds = deadline_seconds or float(os.getenv('QUANTUM_LLM_DEADLINE_SECONDS', '45'))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('QUANTUM_LLM_MAX_RETRIES', '2'))
+        self.backoff_seconds = backoff_seconds or float(os.getenv('QUANTUM_LLM_BACKOFF_SECONDS', '0.5'))
+        # Native response_schema enforcement needs a model that supports it (gemini-1.5+)
+        self.structured_output = os.getenv('QUANTUM_LLM_STRUCTURED_OUTPUT', 'false').lower() == 'true'
+
+        self.cache = cache if cache is not None else QuantumLLMCache()
+        self.stats = {'calls': 0, 'successes': 0, 'timeouts': 0, 'errors': 0, 'retries': 0, 'fallbacks': 0,
+                      'unconfigured': 0}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._model = None
+        self._adc_check: Optional[asyncio.Future] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                # Timed-out calls keep their thread until the SDK's own timeout fires,
+                # so leave headroom for one abandoned call per retry
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency * (self.max_retries + 1),
+                    thread_name_prefix='quantum-llm'
+                )
+                thread = threading.Thread(target=loop.run_forever, name='quantum-llm-loop', daemon=True)
+                thread.start()
+                self._semaphore = asyncio.run_coroutine_threadsafe(
+                    self._create_semaphore(), loop
+                ).result()
+                self._loop = loop
+        return self._loop
+
+    async def _create_semaphore(self) -> asyncio.Semaphore:
+        return asyncio.Semaphore(self.max_concurrency)
+
+    async def _credentials_available(self) -> bool:
+        if _llm_configured or os.getenv('GOOGLE_API_KEY'):
+            return True
+        # The ADC lookup is checked once per process; concurrent first calls share it
+        if self._adc_check is None:
+            self._adc_check = asyncio.get_running_loop().run_in_executor(
+                self._executor, _application_default_credentials_available
+            )
+            if not await self._adc_check:
+                logger.warning("No Gemini credentials configured (API key, QUANTUM_LLM_ENDPOINT or ADC); "
+                               "AI insights will use fallbacks")
+        return await self._adc_check
+
+    def _get_model(self):
+        if self._model is None:
+            self._model = genai.GenerativeModel(self.model_name)
+        return self._model
+
+    async def _generate(self, prompt: str, response_schema: Optional[Dict] = None) -> Optional[str]:
+        self.stats['calls'] += 1
+        generation_config = self._generation_config(response_schema)
+        cache_prompt = prompt if generation_config is None else f"{prompt}\x00{json.dumps(generation_config, sort_keys=True)}"
+
+        # Identical prompts (re-runs, dashboard refreshes, retries) are served from the cache
+        cached = self.cache.get(self.model_name, cache_prompt)
+        if cached is not None:
+            return cached
+
+        if not await self._credentials_available():
+            self.stats['unconfigured'] += 1
+            self.stats['fallbacks'] += 1
+            return None
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline_seconds
+
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                timeout = min(self.timeout_seconds, remaining)
+
+                try:
+                    response = await asyncio.wait_for(
+                        loop.run_in_executor(self._executor, self._call_model, prompt, timeout, generation_config),
+                        timeout
+                    )
+                    self.stats['successes'] += 1
+                    self.cache.put(self.model_name, cache_prompt, response.text)
+                    return response.text
+                except asyncio.TimeoutError:
+                    self.stats['timeouts'] += 1
+                    logger.warning(f"Gemini call timed out after {timeout:.1f}s (attempt {attempt + 1})")
+                except _RETRYABLE_ERRORS as e:
+                    self.stats['errors'] += 1
+                    logger.warning(f"Gemini call failed (attempt {attempt + 1}): {str(e)}")
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    logger.warning(f"Gemini call failed, not retrying: {str(e)}")
+                    break
+
+                if attempt < self.max_retries:
+                    # Exponential backoff with jitter, never past the deadline
+                    delay = self.backoff_seconds * (2 ** attempt) * (1 + random.random() * 0.25)
+                    delay = min(delay, max(deadline - loop.time(), 0))
+                    self.stats['retries'] += 1
+                    await asyncio.sleep(delay)
+
+        self.stats['fallbacks'] += 1
+        return None
+
+    def _generation_config(self, response_schema: Optional[Dict]) -> Optional[Dict]:
+        if response_schema is None or not self.structured_output:
+            return None
+        return {'response_mime_type': 'application/json', 'response_schema': response_schema}
+
+    def _call_model(self, prompt: str, timeout: float, generation_config: Optional[Dict] = None):
+        return self._get_model().generate_content(
+            prompt, generation_config=generation_config, request_options={'timeout': timeout}
+        )
+
+    async def agenerate(self, prompt: str, response_schema: Optional[Dict] = None) -> Optional[str]:
+        """Generate text without blocking the caller's event loop; None on timeout or failure"""
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await self._generate(prompt, response_schema)
+        future = asyncio.run_coroutine_threadsafe(self._generate(prompt, response_schema), loop)
+        return await asyncio.wrap_future(future)
+
+    def run(self, coroutine):
+        """
+        Block a worker thread on a coroutine run on the client's loop, e.g. one that gathers many agenerate calls
+        The coroutine sees the caller's context variables (metrics capture, request spans)
+        """
+        loop = self._ensure_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coroutine.close()
+            raise RuntimeError("QuantumLLMClient.run cannot be called from the client's own loop")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def generate(self, prompt: str, response_schema: Optional[Dict] = None) -> Optional[str]:
+        """
+        Blocking generate for worker threads; None on timeout or failure
+        response_schema is enforced natively when QUANTUM_LLM_STRUCTURED_OUTPUT=true
+        """
+        started = time.perf_counter()
+        result = self.run(self._generate(prompt, response_schema))
+        logger.debug(f"Gemini call finished in {time.perf_counter() - started:.3f}s")
+        return result
+
+    def get_stats(self) -> Dict:
+        return {
+            'model': self.model_name,
+            'max_concurrency': self.max_concurrency,
+            'timeout_seconds': self.timeout_seconds,
+            **self.stats,
+            'cache': self.cache.get_stats()
+        }
+
+
+# Shared client for the whole process
+llm_client = QuantumLLMClient()
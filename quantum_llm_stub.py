@@ -0,0 +1,132 @@
+# Quantum LLM Stub Server
+# Local Gemini REST stand-in with configurable latency and failure injection
+#
+# Usage:
+#   python quantum_llm_stub.py --port 8765 --latency-ms 800 --failure-rate 0.1
+#   QUANTUM_LLM_ENDPOINT=http://127.0.0.1:8765 python quantum_api.py
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_PROFILE = {
+    'big_five': {'openness': 62, 'conscientiousness': 71, 'extraversion': 48, 'agreeableness': 66, 'neuroticism': 39},
+    'communication_style': 'collaborative',
+    'work_preferences': 'autonomous with clear goals',
+    'stress_response': 'moderate',
+    'leadership_potential': 58,
+    'team_compatibility': 64
+}
+
+STUB_INTERVENTIONS = [
+    "- Pair the employee with a senior mentor for a bi-weekly growth conversation.",
+    "- Offer ownership of a cross-team initiative aligned with their stated interests.",
+    "- Review workload with their manager and rebalance any non-critical tasks."
+]
+
+STUB_CANDIDATE = {
+    'technical_competency': 78,
+    'cultural_fit': 72,
+    'growth_trajectory': 'positive',
+    'leadership_potential': 61,
+    'innovation_capability': 74,
+    'team_collaboration': 77,
+    'overall_recommendation': 'interview'
+}
+
+
+def render_stub_response(prompt: str) -> str:
+    """Pick a canned answer shaped like the real one for the given prompt"""
+    if 'psychological profile together with' in prompt:
+        return json.dumps({
+            'psychological_profile': STUB_PROFILE,
+            'interventions': [intervention.lstrip('- ') for intervention in STUB_INTERVENTIONS]
+        })
+    if 'intervention strategies' in prompt and 'Psychological Profile' in prompt:
+        return '\n'.join(STUB_INTERVENTIONS)
+    if 'Recruitment Specialist' in prompt:
+        return json.dumps(STUB_CANDIDATE)
+    return json.dumps(STUB_PROFILE)
+
+
+class GeminiStubHandler(BaseHTTPRequestHandler):
+    """Answers POST /v1beta/models/<model>:generateContent like the Gemini REST API"""
+
+    latency_seconds = 0.0
+    jitter_seconds = 0.0
+    failure_rate = 0.0
+    request_count = 0
+    _count_lock = threading.Lock()
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+
+        with self._count_lock:
+            GeminiStubHandler.request_count += 1
+
+        time.sleep(self.latency_seconds + random.random() * self.jitter_seconds)
+
+        if not self.path.split('?')[0].endswith(':generateContent'):
+            self._send(404, {'error': {'code': 404, 'message': 'Unknown method', 'status': 'NOT_FOUND'}})
+            return
+        if random.random() < self.failure_rate:
+            self._send(503, {'error': {'code': 503, 'message': 'Injected failure', 'status': 'UNAVAILABLE'}})
+            return
+
+        prompt = ' '.join(
+            part.get('text', '')
+            for content in body.get('contents', [])
+            for part in content.get('parts', [])
+        )
+        self._send(200, {
+            'candidates': [{
+                'content': {'parts': [{'text': render_stub_response(prompt)}], 'role': 'model'},
+                'finishReason': 'STOP',
+                'index': 0
+            }]
+        })
+
+    def _send(self, status: int, payload: dict):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(port: int = 8765, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                      failure_rate: float = 0.0, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """Start the stub in a daemon thread and return the server (call .shutdown() to stop)"""
+    handler = type('ConfiguredGeminiStubHandler', (GeminiStubHandler,), {
+        'latency_seconds': latency_ms / 1000,
+        'jitter_seconds': jitter_ms / 1000,
+        'failure_rate': failure_rate
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, name='gemini-stub', daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Gemini stub server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = start_stub_server(args.port, args.latency_ms, args.jitter_ms, args.failure_rate, args.host)
+    print(f"Gemini stub listening on http://{args.host}:{args.port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,220 @@
+# Quantum Metrics
+# Per-stage timing spans, histograms and counters, exported in Prometheus text format
+
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+
+# Stage spans of the request being served, for its Server-Timing header
+_request_spans: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar('quantum_request_spans', default=None)
+
+# Metric events recorded inside an executor task, replayed by the process that awaits the task
+_captured_events: ContextVar[Optional[List[tuple]]] = ContextVar('quantum_captured_events', default=None)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self.series: Dict[tuple, List] = {}  # label items -> [bucket counts..., sum, count]
+
+    def observe(self, value: float, labels: Dict):
+        key = tuple(sorted(labels.items()))
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = [0] * len(self.buckets) + [0.0, 0]
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series[index] += 1  # values above the last bound only count towards +Inf
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        for key, series in sorted(self.series.items()):
+            labels = dict(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{_format_labels({**labels, "le": _format_value(float(bound))})} {cumulative}')
+            lines.append(f'{self.name}_bucket{_format_labels({**labels, "le": "+Inf"})} {series[-1]}')
+            lines.append(f'{self.name}_sum{_format_labels(labels)} {_format_value(series[-2])}')
+            lines.append(f'{self.name}_count{_format_labels(labels)} {series[-1]}')
+        return lines
+
+
+class _Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.series: Dict[tuple, float] = {}
+
+    def inc(self, amount: float, labels: Dict):
+        key = tuple(sorted(labels.items()))
+        self.series[key] = self.series.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        for key, value in sorted(self.series.items()):
+            lines.append(f'{self.name}{_format_labels(dict(key))} {_format_value(value)}')
+        return lines
+
+
+class QuantumMetrics:
+    """
+    In-process metrics registry
+    Code instruments itself with stage() spans, observe() and inc(); values that already live in other
+    components' stats (LLM client, caches, executor) are read at scrape time through collectors.
+    Inside an executor task (capture()) events are buffered and replayed by the awaiting process,
+    so thread and process workers report the same way
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, _Histogram] = {}
+        self._counters: Dict[str, _Counter] = {}
+        self._collectors: List[Callable[[], List[tuple]]] = []
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        with self._lock:
+            self._histograms.setdefault(name, _Histogram(name, help_text, buckets))
+
+    def counter(self, name: str, help_text: str):
+        with self._lock:
+            self._counters.setdefault(name, _Counter(name, help_text))
+
+    def add_collector(self, collector: Callable[[], List[tuple]]):
+        """collector() returns [(name, 'counter' | 'gauge', help, [(labels, value), ...]), ...] at scrape time"""
+        self._collectors.append(collector)
+
+    def _capture(self, event: tuple) -> bool:
+        captured = _captured_events.get()
+        if captured is None:
+            return False
+        captured.append(event)
+        return True
+
+    def observe(self, name: str, value: float, **labels):
+        if self._capture(('observe', name, value, labels)):
+            return
+        with self._lock:
+            self._histograms[name].observe(value, labels)
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        if self._capture(('inc', name, amount, labels)):
+            return
+        with self._lock:
+            self._counters[name].inc(amount, labels)
+
+    def record_stage(self, stage: str, seconds: float):
+        if self._capture(('stage', stage, seconds, None)):
+            return
+        with self._lock:
+            self._histograms['quantum_stage_seconds'].observe(seconds, {'stage': stage})
+        spans = _request_spans.get()
+        if spans is not None:
+            spans.append((stage, seconds))
+
+    @contextmanager
+    def stage(self, stage: str):
+        """Time the block as one stage span"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, time.perf_counter() - started)
+
+    @contextmanager
+    def capture(self):
+        """Buffer every event recorded in the block (executor tasks); yields the event list for replay()"""
+        events = []
+        token = _captured_events.set(events)
+        try:
+            yield events
+        finally:
+            _captured_events.reset(token)
+
+    def replay(self, events: List[tuple]):
+        for kind, name, value, labels in events:
+            if kind == 'stage':
+                self.record_stage(name, value)
+            elif kind == 'observe':
+                self.observe(name, value, **labels)
+            else:
+                self.inc(name, value, **labels)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        with self._lock:
+            lines = []
+            for histogram in self._histograms.values():
+                lines.extend(histogram.render())
+            for counter in self._counters.values():
+                lines.extend(counter.render())
+        for collector in self._collectors:
+            for name, metric_type, help_text, samples in collector():
+                lines.extend([f'# HELP {name} {help_text}', f'# TYPE {name} {metric_type}'])
+                lines.extend(f'{name}{_format_labels(labels)} {_format_value(value)}' for labels, value in samples)
+        return '\n'.join(lines) + '\n'
+
+
+@contextmanager
+def request_spans():
+    """Collect the stage spans recorded while serving one request; yields the (stage, seconds) list"""
+    spans = []
+    token = _request_spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _request_spans.reset(token)
+
+
+def detach_request_spans():
+    """Stop attributing spans in the current task to the request that happened to start it"""
+    _request_spans.set(None)
+
+
+def server_timing_header(spans: List[Tuple[str, float]], total_seconds: float) -> str:
+    """Server-Timing value with repeated stages summed, in first-seen order"""
+    totals: Dict[str, List] = {}
+    for stage, seconds in spans:
+        entry = totals.setdefault(stage, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+    parts = [
+        f'{stage};dur={seconds * 1000:.2f}' + (f';desc="x{count}"' if count > 1 else '')
+        for stage, (seconds, count) in totals.items()
+    ]
+    parts.append(f'total;dur={total_seconds * 1000:.2f}')
+    return ', '.join(parts)
+
+
+# Shared registry for the whole process
+metrics = QuantumMetrics()
+metrics.histogram('quantum_stage_seconds', 'Time spent in each analysis stage')
+metrics.histogram('quantum_http_request_seconds', 'HTTP request latency by route')
+metrics.histogram('quantum_batch_size', 'Items per batched embedding / inference call', BATCH_SIZE_BUCKETS)
+metrics.counter('quantum_llm_fallbacks_total', 'AI stages answered by the rule-based fallback')
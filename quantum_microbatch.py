@@ -0,0 +1,136 @@
+# Quantum Micro-Batching Scheduler
+# Coalesces concurrent single-item requests into one batched embedding and forward pass
+
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List
+
+from quantum_metrics import detach_request_spans
+
+logger = logging.getLogger("QuantumHR-MicroBatch")
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(percentile / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class QuantumMicroBatcher:
+    """
+    Dynamic batcher in front of a batched dispatch function
+    Waits up to max_wait_ms (or until max_batch_size items arrive), dispatches the items as one batch
+    and resolves each caller's future with its own result; latency is tracked per setting
+    """
+
+    def __init__(self, dispatch: Callable[[List[Any]], Awaitable[List[Any]]],
+                 max_batch_size: int = None, max_wait_ms: float = None, latency_window: int = 10000):
+        self._dispatch = dispatch
+        self.max_batch_size = max_batch_size or int(os.getenv('QUANTUM_MICROBATCH_MAX_SIZE', '32'))
+        self.max_wait_ms = max_wait_ms if max_wait_ms is not None else float(os.getenv('QUANTUM_MICROBATCH_MAX_WAIT_MS', '5'))
+        self.latency_window = latency_window
+
+        self._queue = None
+        self._collector = None
+        self._inflight = set()
+        self._settings_stats: Dict[str, Dict] = {}
+
+    @property
+    def setting_key(self) -> str:
+        return f"batch{self.max_batch_size}_wait{self.max_wait_ms:g}ms"
+
+    def configure(self, max_batch_size: int = None, max_wait_ms: float = None):
+        """Retune at runtime; latency statistics are kept separately for each setting"""
+        if max_batch_size is not None:
+            self.max_batch_size = max(1, int(max_batch_size))
+        if max_wait_ms is not None:
+            self.max_wait_ms = max(0.0, float(max_wait_ms))
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its result from the next batch"""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._collector is None or self._collector.done():
+            self._queue = asyncio.Queue()
+            self._collector = loop.create_task(self._collect())
+
+        future = loop.create_future()
+        await self._queue.put((item, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self):
+        # The collector task inherited the context of whichever request started it; batches serve many requests
+        detach_request_spans()
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Run batches concurrently; the collector goes straight back to gathering the next one
+            task = loop.create_task(self._run_batch(batch, self.setting_key))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _run_batch(self, batch: List, setting_key: str):
+        try:
+            results = await self._dispatch([item for item, _, _ in batch])
+        except Exception as e:
+            logger.warning(f"Micro-batch of {len(batch)} failed: {str(e)}")
+            results = [e] * len(batch)
+
+        finished = time.perf_counter()
+        stats = self._stats_for(setting_key)
+        stats['batches'] += 1
+        stats['batched_items'] += len(batch)
+
+        for (_, future, enqueued), result in zip(batch, results):
+            stats['latencies'].append(finished - enqueued)
+            if future.done():
+                continue  # caller went away
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _stats_for(self, setting_key: str) -> Dict:
+        if setting_key not in self._settings_stats:
+            self._settings_stats[setting_key] = {
+                'batches': 0,
+                'batched_items': 0,
+                'latencies': deque(maxlen=self.latency_window)
+            }
+        return self._settings_stats[setting_key]
+
+    def get_stats(self) -> Dict:
+        settings = {}
+        for setting_key, stats in self._settings_stats.items():
+            latencies = sorted(stats['latencies'])
+            settings[setting_key] = {
+                'batches': stats['batches'],
+                'requests': stats['batched_items'],
+                'mean_batch_size': stats['batched_items'] / stats['batches'] if stats['batches'] else 0.0,
+                'p50_latency_ms': round(_percentile(latencies, 50) * 1000, 3),
+                'p99_latency_ms': round(_percentile(latencies, 99) * 1000, 3)
+            }
+        return {
+            'active_setting': self.setting_key,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait_ms,
+            'queued': self._queue.qsize() if self._queue is not None else 0,
+            'settings': settings
+        }
@@ -0,0 +1,141 @@
+# Quantum Model Registry
+# Process-wide, lazily-loaded registry of shared neural embedding models
+
+import os
+import time
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+
+DEFAULT_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+# Encoder backends for CPU pods: plain fp32 torch, int8 dynamic quantization of the Linear layers,
+# or the exported ONNX graph on onnxruntime (sentence-transformers backend='onnx', needs optimum[onnxruntime])
+ENCODER_BACKEND_FP32 = 'fp32'
+ENCODER_BACKEND_INT8 = 'int8'
+ENCODER_BACKEND_ONNX = 'onnx'
+ENCODER_BACKENDS = (ENCODER_BACKEND_FP32, ENCODER_BACKEND_INT8, ENCODER_BACKEND_ONNX)
+DEFAULT_ENCODER_BACKEND = os.getenv('QUANTUM_ENCODER_BACKEND', ENCODER_BACKEND_FP32)
+
+
+def _current_rss_mb() -> float:
+    """Resident set size of this process in MB (0.0 when unavailable)"""
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+    except Exception:
+        return 0.0
+
+
+def _state_bytes(state) -> int:
+    """Bytes held by a state dict, including the packed (weight, bias) tuples of int8 quantized layers"""
+    if hasattr(state, 'element_size'):
+        return state.numel() * state.element_size()
+    if isinstance(state, dict):
+        return sum(_state_bytes(value) for value in state.values())
+    if isinstance(state, (tuple, list)):
+        return sum(_state_bytes(value) for value in state)
+    return 0
+
+
+def embedding_key(model_name: str, backend: str = ENCODER_BACKEND_FP32) -> str:
+    """Registry / embedding store key; non-fp32 backends get their own vectors so they never mix with fp32 ones"""
+    return model_name if backend == ENCODER_BACKEND_FP32 else f'{model_name}@{backend}'
+
+
+def cosine_drift(reference: np.ndarray, candidate: np.ndarray) -> Dict:
+    """Row-wise cosine similarity of candidate embeddings against the fp32 reference for the same texts"""
+    reference = np.asarray(reference, dtype=np.float64)
+    candidate = np.asarray(candidate, dtype=np.float64)
+    similarity = np.sum(reference * candidate, axis=1) / (
+        np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    )
+    return {
+        'texts': int(len(similarity)),
+        'mean_cosine': round(float(similarity.mean()), 6),
+        'p01_cosine': round(float(np.percentile(similarity, 1)), 6),
+        'min_cosine': round(float(similarity.min()), 6),
+        'max_drift': round(float(1 - similarity.min()), 6)
+    }
+
+
+class QuantumModelRegistry:
+    """
+    Process-wide registry of sentence embedding models
+    Each (model, encoder backend) pair is loaded once, on first use, and shared by every system in the worker
+    """
+
+    def __init__(self):
+        self._models = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def get_sentence_model(self, model_name: str = DEFAULT_EMBEDDING_MODEL, backend: Optional[str] = None):
+        """Return the shared SentenceTransformer for model_name on backend (QUANTUM_ENCODER_BACKEND), loading it if needed"""
+        backend = backend or DEFAULT_ENCODER_BACKEND
+        key = embedding_key(model_name, backend)
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        if backend not in ENCODER_BACKENDS:
+            raise ValueError(f"Unknown encoder backend: {backend}")
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = self._load_sentence_model(model_name, backend)
+                self._models[key] = model
+        return model
+
+    def _load_sentence_model(self, model_name: str, backend: str = ENCODER_BACKEND_FP32):
+        from sentence_transformers import SentenceTransformer
+
+        rss_before = _current_rss_mb()
+        started = time.perf_counter()
+        if backend == ENCODER_BACKEND_ONNX:
+            onnx_file = os.getenv('QUANTUM_ENCODER_ONNX_FILE')  # e.g. onnx/model_qint8_avx512_vnni.onnx
+            model = SentenceTransformer(
+                model_name, device='cpu', backend='onnx',
+                model_kwargs={'file_name': onnx_file} if onnx_file else None
+            )
+        else:
+            model = SentenceTransformer(model_name, device='cpu' if backend == ENCODER_BACKEND_INT8 else None)
+        if backend == ENCODER_BACKEND_INT8:
+            import torch
+
+            # Weights stored as int8, activations quantized per batch; no calibration data needed
+            torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+        load_seconds = time.perf_counter() - started
+
+        parameter_bytes = _state_bytes(model.state_dict())
+        self._stats[embedding_key(model_name, backend)] = {
+            'backend': backend,
+            'load_seconds': round(load_seconds, 3),
+            'parameter_memory_mb': round(parameter_bytes / (1024 * 1024), 2),
+            'rss_delta_mb': round(_current_rss_mb() - rss_before, 2),
+            'loaded_at': datetime.now().isoformat()
+        }
+        return model
+
+    def is_loaded(self, model_name: str = DEFAULT_EMBEDDING_MODEL, backend: Optional[str] = None) -> bool:
+        return embedding_key(model_name, backend or DEFAULT_ENCODER_BACKEND) in self._models
+
+    def stats(self) -> Dict:
+        """Load time and memory footprint of every loaded model"""
+        return {
+            'encoder_backend': DEFAULT_ENCODER_BACKEND,
+            'loaded_models': list(self._models.keys()),
+            'process_rss_mb': round(_current_rss_mb(), 2),
+            'models': dict(self._stats)
+        }
+
+
+# Shared registry for the whole process
+model_registry = QuantumModelRegistry()
+
+
+def get_sentence_model(model_name: str = DEFAULT_EMBEDDING_MODEL, backend: Optional[str] = None):
+    """Shortcut for model_registry.get_sentence_model"""
+    return model_registry.get_sentence_model(model_name, backend)
@@ -1,33 +1,119 @@
 # Quantum Neural Architecture for HR-Tech Revolution
 # Revolutionary AI Workforce Intelligence System
 
+import os
+import asyncio
 import numpy as np
 import pandas as pd
 import torch
 import torch.nn as nn
 from transformers import AutoTokenizer, AutoModel
-from sentence_transformers import SentenceTransformer
-import google.generativeai as genai
 from typing import Dict, List, Tuple, Optional
+import copy
 import json
+import time
+import bisect
+import itertools
+import logging
+import threading
 import warnings
+from quantum_model_registry import DEFAULT_EMBEDDING_MODEL, DEFAULT_ENCODER_BACKEND, embedding_key, get_sentence_model
+from quantum_embedding_store import embedding_store
+from quantum_metrics import metrics
+from quantum_llm_client import QuantumLLMClient, configure_llm, parse_json_object, llm_client as shared_llm_client
+from quantum_pattern_matcher import QuantumPatternMatcher
+from quantum_skill_taxonomy import QuantumSkillTaxonomy, QuantumTaxonomySnapshot, skill_taxonomy as shared_skill_taxonomy
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger("QuantumHR-Neural")
+
+# Column order of the fused psychological head; also the keys of every per-employee psychological output
+PSYCHOLOGICAL_OUTPUT_KEYS = ('stress_level', 'satisfaction_level', 'motivation_level', 'engagement_level')
+
+# Rows per forward pass of the torch networks (see _forward_in_blocks)
+INFERENCE_BLOCK_ROWS = int(os.getenv('QUANTUM_INFERENCE_BLOCK_ROWS', '128'))
+
+# LLM modes for the psychology pipeline: two prompts per employee, or one structured prompt
+LLM_MODE_TWO_CALL = 'two_call'
+LLM_MODE_SINGLE_SHOT = 'single_shot'
+
+# Response schema for the single-shot profile + interventions prompt
+SINGLE_SHOT_RESPONSE_SCHEMA = {
+    'type': 'OBJECT',
+    'properties': {
+        'psychological_profile': {
+            'type': 'OBJECT',
+            'properties': {
+                'big_five': {
+                    'type': 'OBJECT',
+                    'properties': {
+                        trait: {'type': 'NUMBER'}
+                        for trait in ['openness', 'conscientiousness', 'extraversion', 'agreeableness', 'neuroticism']
+                    },
+                    'required': ['openness', 'conscientiousness', 'extraversion', 'agreeableness', 'neuroticism']
+                },
+                'communication_style': {'type': 'STRING'},
+                'work_preferences': {'type': 'STRING'},
+                'stress_response': {'type': 'STRING'},
+                'leadership_potential': {'type': 'NUMBER'},
+                'team_compatibility': {'type': 'NUMBER'},
+                'career_development_interests': {'type': 'STRING'}
+            },
+            'required': ['big_five', 'communication_style', 'work_preferences', 'stress_response',
+                         'leadership_potential', 'team_compatibility']
+        },
+        'interventions': {'type': 'ARRAY', 'items': {'type': 'STRING'}}
+    },
+    'required': ['psychological_profile', 'interventions']
+}
+
+
+def _forward_in_blocks(module: nn.Module, inputs: torch.Tensor) -> torch.Tensor:
+    """
+    Run module over inputs in zero-padded blocks of exactly INFERENCE_BLOCK_ROWS rows
+    CPU matmul kernels are picked by batch size, so the same row can round differently in batches of different
+    sizes; a fixed block shape makes every row's output independent of how the rows were batched or chunked
+    """
+    outputs = []
+    for start in range(0, len(inputs), INFERENCE_BLOCK_ROWS):
+        block = inputs[start:start + INFERENCE_BLOCK_ROWS]
+        rows = len(block)
+        if rows < INFERENCE_BLOCK_ROWS:
+            block = torch.cat([block, block.new_zeros((INFERENCE_BLOCK_ROWS - rows,) + tuple(block.shape[1:]))])
+        outputs.append(module(block)[:rows])
+    return torch.cat(outputs) if outputs else module(inputs)
+
+
 class QuantumWorkforceIntelligence:
     """
     Revolutionary Quantum Workforce Intelligence System
     Implements neural networks for advanced psychological profiling and attrition prediction
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, llm_client: Optional[QuantumLLMClient] = None,
+                 llm_mode: str = None, encoder_backend: str = None):
         """Initialize the Quantum Workforce Intelligence System"""
         self.api_key = api_key
-        if api_key:
-            genai.configure(api_key=api_key)
+        configure_llm(api_key)
+        self.llm_client = llm_client or shared_llm_client
+        self.llm_mode = llm_mode or os.getenv('QUANTUM_LLM_MODE', LLM_MODE_TWO_CALL)
+        if self.llm_mode not in (LLM_MODE_TWO_CALL, LLM_MODE_SINGLE_SHOT):
+            raise ValueError(f"Unknown LLM mode: {self.llm_mode}")
+        self._llm_mode_latency = {
+            mode: {'employees': 0, 'calls': 0, 'total_seconds': 0.0}
+            for mode in (LLM_MODE_TWO_CALL, LLM_MODE_SINGLE_SHOT)
+        }
+        self._llm_mode_lock = threading.Lock()
+        # Employees whose Gemini prompts are in flight at once in analyze_workforce_batch
+        self.llm_batch_concurrency = int(
+            os.getenv('QUANTUM_LLM_BATCH_CONCURRENCY', str(self.llm_client.max_concurrency))
+        )
         
-        # Initialize neural models
-        self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Initialize neural models (the sentence model is shared and loaded on first use)
+        self.embedding_model_name = DEFAULT_EMBEDDING_MODEL
+        self.encoder_backend = encoder_backend or DEFAULT_ENCODER_BACKEND
         self.psychological_analyzer = self._initialize_psychological_analyzer()
+        self.psychological_inference = self._compile_psychological_inference(self.psychological_analyzer)
         self.attrition_predictor = self._initialize_attrition_predictor()
         
         # Quantum psychological constants
@@ -38,6 +124,9 @@ class QuantumWorkforceIntelligence:
             'engagement_indicators': ['engaged', 'involved', 'committed', 'dedicated', 'enthusiastic'],
             'growth_indicators': ['learning', 'developing', 'growing', 'advancing', 'improving']
         }
+        self.trait_matcher = QuantumPatternMatcher(
+            [indicator for indicators in self.PSYCHOLOGICAL_TRAITS.values() for indicator in indicators]
+        )
         
         # Neural intervention protocols
         self.INTERVENTION_STRATEGIES = {
@@ -58,6 +147,18 @@ class QuantumWorkforceIntelligence:
             ]
         }
     
+    @property
+    def sentence_model(self):
+        """Process-wide shared sentence model, loaded lazily"""
+        return get_sentence_model(self.embedding_model_name, self.encoder_backend)
+    
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """Embed texts through the persistent embedding store; the transformer only sees unseen texts"""
+        return embedding_store.encode(
+            embedding_key(self.embedding_model_name, self.encoder_backend), texts,
+            lambda missing: self.sentence_model.encode(missing)
+        )
+    
     def _initialize_psychological_analyzer(self):
         """Initialize neural psychological analysis model"""
         class QuantumPsychologicalNet(nn.Module):
@@ -94,6 +195,45 @@ class QuantumWorkforceIntelligence:
         model.eval()
         return model
     
+    def _compile_psychological_inference(self, analyzer: nn.Module) -> nn.Module:
+        """
+        Scripted inference module for the psychological analyzer, its four heads fused into one Linear(128, 4)
+        Returns a (batch, 4) tensor in PSYCHOLOGICAL_OUTPUT_KEYS order. Each column goes through the same
+        matrix-vector kernel and sigmoid as the separate Linear(128, 1) heads, so outputs are bit-identical;
+        QUANTUM_PSYCHOLOGY_FUSED_GEMM=true uses one GEMM for all four (faster on large batches, but it can differ
+        in the last float32 bit). Weights are copied: rebuild after changing the analyzer's weights
+        """
+        class QuantumFusedPsychologicalHead(nn.Module):
+            def __init__(self, analyzer: nn.Module, single_gemm: bool):
+                super(QuantumFusedPsychologicalHead, self).__init__()
+                self.feature_extractor = copy.deepcopy(analyzer.feature_extractor)
+                heads = [analyzer.stress_predictor, analyzer.satisfaction_predictor,
+                         analyzer.motivation_predictor, analyzer.engagement_predictor]
+                # skip_init: the weights are overwritten below, so do not draw from the RNG
+                self.head = torch.nn.utils.skip_init(nn.Linear, 128, len(heads))
+                with torch.no_grad():
+                    self.head.weight.copy_(torch.cat([head.weight for head in heads]))
+                    self.head.bias.copy_(torch.cat([head.bias for head in heads]))
+                self.single_gemm = single_gemm
+            
+            def forward(self, x):
+                features = self.feature_extractor(x)
+                if self.single_gemm:
+                    return torch.sigmoid(self.head(features))
+                batch = features.shape[0]
+                columns = []
+                for i in range(4):
+                    columns.append(torch.sigmoid(torch.addmv(self.head.bias[i].expand(batch), features, self.head.weight[i])))
+                return torch.stack(columns, 1)
+        
+        single_gemm = os.getenv('QUANTUM_PSYCHOLOGY_FUSED_GEMM', 'false').lower() == 'true'
+        model = QuantumFusedPsychologicalHead(analyzer, single_gemm).eval()
+        try:
+            return torch.jit.freeze(torch.jit.script(model))
+        except Exception as e:
+            logger.warning(f"TorchScript compilation of the psychological head failed, running eager: {str(e)}")
+            return model
+    
     def _initialize_attrition_predictor(self):
         """Initialize neural attrition prediction model"""
         class QuantumAttritionNet(nn.Module):
@@ -119,35 +259,113 @@ class QuantumWorkforceIntelligence:
         model = QuantumAttritionNet()
         model.eval()
         return model
-    
+
+    def model_state(self) -> Dict:
+        """Weights of the psychological and attrition networks, used to give worker processes identical copies"""
+        return {
+            'psychological_analyzer': self.psychological_analyzer.state_dict(),
+            'attrition_predictor': self.attrition_predictor.state_dict()
+        }
+
+    def load_model_state(self, state: Dict):
+        """Load weights from model_state() and rebuild the fused psychological head from them"""
+        self.psychological_analyzer.load_state_dict(state['psychological_analyzer'])
+        self.attrition_predictor.load_state_dict(state['attrition_predictor'])
+        self.psychological_inference = self._compile_psychological_inference(self.psychological_analyzer)
+
     def analyze_quantum_psychological_state(self, feedback_text: str, employee_data: Dict, 
                                           include_neurological_patterns: bool = True,
-                                          behavioral_prediction_horizon: int = 12) -> Dict:
+                                          behavioral_prediction_horizon: int = 12,
+                                          psychological_output: Optional[Dict] = None) -> Dict:
         """
         Revolutionary quantum psychological state analysis
+        psychological_output is this employee's row from compute_psychological_outputs when the
+        embedding and forward pass already ran in a shared batch
         """
-        # Generate text embeddings using sentence transformer
-        embeddings = self.sentence_model.encode([feedback_text])
-        
-        # Quantum psychological analysis using neural network
-        with torch.no_grad():
-            psychological_output = self.psychological_analyzer(torch.FloatTensor(embeddings))
+        if psychological_output is not None:
+            return self._analyze_employee_state(feedback_text, employee_data, psychological_output, True)
+        return self.analyze_quantum_psychological_states([feedback_text], [employee_data])[0]
+    
+    def compute_psychological_outputs(self, feedback_texts: List[str]) -> List[Dict]:
+        """Batched embedding + psychological forward pass, split into one output row per text"""
+        if not feedback_texts:
+            return []
+        return self._batch_psychological_outputs(feedback_texts)
+    
+    def analyze_quantum_psychological_states(self, feedback_texts: List[str], employees: List[Dict],
+                                             include_ai_insights: bool = True) -> List[Dict]:
+        """
+        Batched quantum psychological state analysis
+        One embedding call and one neural forward pass for the whole batch
+        """
+        if not feedback_texts:
+            return []
         
+        psychological_outputs = self._batch_psychological_outputs(feedback_texts)
+        return [
+            self._analyze_employee_state(feedback_text, employee_data, psychological_output, include_ai_insights)
+            for feedback_text, employee_data, psychological_output in zip(feedback_texts, employees, psychological_outputs)
+        ]
+    
+    def _batch_psychological_scores(self, feedback_texts: List[str]) -> torch.Tensor:
+        """Embed all texts and run one stacked forward pass; (batch, 4) tensor in PSYCHOLOGICAL_OUTPUT_KEYS order"""
+        metrics.observe('quantum_batch_size', len(feedback_texts), source='psychology_forward')
+        # Generate text embeddings for every feedback text in a single call (stored texts skip the transformer)
+        with metrics.stage('embedding'):
+            embeddings = self._encode_texts(feedback_texts)
+        
+        # Quantum psychological analysis using one stacked forward pass through the fused head
+        with metrics.stage('psychology_inference'), torch.inference_mode():
+            return _forward_in_blocks(self.psychological_inference, torch.FloatTensor(np.asarray(embeddings)))
+    
+    def _batch_psychological_outputs(self, feedback_texts: List[str]) -> List[Dict[str, float]]:
+        """One {trait: probability} dict per text, from a single host transfer for the whole batch"""
+        return [
+            dict(zip(PSYCHOLOGICAL_OUTPUT_KEYS, row))
+            for row in self._batch_psychological_scores(feedback_texts).tolist()
+        ]
+    
+    def _analyze_employee_state(self, feedback_text: str, employee_data: Dict,
+                                employee_output: Dict, include_ai_insights: bool) -> Dict:
+        """Build one employee's psychological matrix from their slice of the batch output"""
         # Advanced trait analysis
-        trait_scores = {}
-        for trait, indicators in self.PSYCHOLOGICAL_TRAITS.items():
-            score = sum(1 for indicator in indicators if indicator.lower() in feedback_text.lower())
-            trait_scores[trait] = min(score * 20, 100)  # Normalize to 0-100
+        with metrics.stage('keyword_scoring'):
+            trait_scores = self._calculate_trait_scores(feedback_text)
+        
+        matrix = self._compose_psychological_matrix(
+            employee_output, employee_data, trait_scores, self._fallback_psychological_profile()
+        )
         
         # Quantum psychological profiling using AI
-        quantum_profile = self._generate_quantum_psychological_profile(feedback_text, employee_data)
+        if include_ai_insights and self.llm_mode == LLM_MODE_SINGLE_SHOT:
+            with metrics.stage('llm_single_shot'):
+                matrix['quantum_psychological_profile'] = self._generate_single_shot_assessment(
+                    feedback_text, employee_data, matrix['psychological_traits']
+                )
+        elif include_ai_insights:
+            with metrics.stage('llm_psychological_profile'):
+                matrix['quantum_psychological_profile'] = self._generate_quantum_psychological_profile(
+                    feedback_text, employee_data
+                )
         
+        return matrix
+    
+    def _calculate_trait_scores(self, feedback_text: str) -> Dict:
+        trait_scores = {}
+        found_indicators = self.trait_matcher.find_terms(feedback_text)
+        for trait, indicators in self.PSYCHOLOGICAL_TRAITS.items():
+            score = sum(1 for indicator in indicators if indicator in found_indicators)
+            trait_scores[trait] = min(score * 20, 100)  # Normalize to 0-100
+        return trait_scores
+    
+    def _compose_psychological_matrix(self, psychological_output: Dict, employee_data: Dict,
+                                      trait_scores: Dict, quantum_profile: Dict) -> Dict:
         return {
             'psychological_traits': {
-                'stress_level': float(psychological_output['stress_level'][0]) * 100,
-                'satisfaction_level': float(psychological_output['satisfaction_level'][0]) * 100,
-                'motivation_score': float(psychological_output['motivation_level'][0]) * 100,
-                'engagement_level': float(psychological_output['engagement_level'][0]) * 100,
+                'stress_level': psychological_output['stress_level'] * 100,
+                'satisfaction_level': psychological_output['satisfaction_level'] * 100,
+                'motivation_score': psychological_output['motivation_level'] * 100,
+                'engagement_level': psychological_output['engagement_level'] * 100,
                 'team_compatibility': trait_scores.get('engagement_indicators', 50)
             },
             'neural_trait_analysis': trait_scores,
@@ -158,7 +376,7 @@ class QuantumWorkforceIntelligence:
                 'leadership_readiness': self._assess_leadership_potential(psychological_output, employee_data)
             },
             'engagement_metrics': {
-                'quantum_level': float(psychological_output['engagement_level'][0]) * 100,
+                'quantum_level': psychological_output['engagement_level'] * 100,
                 'improvement_areas': self._identify_engagement_improvement_areas(trait_scores),
                 'strengths': self._identify_psychological_strengths(trait_scores)
             }
@@ -169,8 +387,55 @@ class QuantumWorkforceIntelligence:
         """
         Revolutionary temporal attrition risk prediction using quantum algorithms
         """
+        return self.predict_temporal_attrition_risks([psychological_matrix], [employee_data], prediction_windows)[0]
+    
+    def predict_temporal_attrition_risks(self, psychological_matrices: List[Dict], employees: List[Dict],
+                                         prediction_windows: List[int] = [1, 3, 6, 12]) -> List[Dict]:
+        """
+        Batched temporal attrition risk prediction
+        Stacks every employee's features into one tensor and categorizes risk column-wise
+        """
+        if not psychological_matrices:
+            return []
+        
         # Prepare features for attrition prediction
         features = [
+            self._build_attrition_features(psychological_matrix, employee_data)
+            for psychological_matrix, employee_data in zip(psychological_matrices, employees)
+        ]
+        
+        # Neural attrition prediction over the stacked batch
+        metrics.observe('quantum_batch_size', len(features), source='attrition_forward')
+        with metrics.stage('attrition_inference'):
+            attrition_risks = self.predict_attrition_probabilities(features) * 100
+        
+        with metrics.stage('risk_rules'):
+            # Advanced risk categorization
+            risk_levels = self._categorize_attrition_risks(attrition_risks[:, prediction_windows.index(3)])
+            
+            results = []
+            for i, (psychological_matrix, employee_data) in enumerate(zip(psychological_matrices, employees)):
+                temporal_risks = {}
+                for j, window in enumerate(prediction_windows):
+                    temporal_risks[f'{window}_month_risk'] = float(attrition_risks[i][j])
+                
+                results.append({
+                    **temporal_risks,
+                    'overall_risk_level': risk_levels[i],
+                    'risk_factors': self._identify_risk_factors(psychological_matrix, employee_data),
+                    'protective_factors': self._identify_protective_factors(psychological_matrix, employee_data)
+                })
+        
+        return results
+    
+    def predict_attrition_probabilities(self, features) -> np.ndarray:
+        """Attrition predictor over a (batch, 10) feature matrix; float64 probabilities, one column per window"""
+        with torch.no_grad():
+            attrition_probs = _forward_in_blocks(self.attrition_predictor, torch.FloatTensor(np.asarray(features)))
+        return attrition_probs.numpy().astype(np.float64)
+    
+    def _build_attrition_features(self, psychological_matrix: Dict, employee_data: Dict) -> List[float]:
+        return [
             psychological_matrix['psychological_traits']['stress_level'] / 100,
             psychological_matrix['psychological_traits']['satisfaction_level'] / 100,
             psychological_matrix['psychological_traits']['motivation_score'] / 100,
@@ -182,27 +447,98 @@ class QuantumWorkforceIntelligence:
             1 if employee_data.get('department') in ['Engineering', 'Data Science'] else 0,  # High-demand dept
             psychological_matrix['psychological_traits']['team_compatibility'] / 100
         ]
+    
+    def analyze_workforce_batch(self, employees: List[Dict], feedback_key: str = 'feedback',
+                                include_ai_insights: bool = True,
+                                prediction_windows: List[int] = [1, 3, 6, 12],
+                                success_probability_threshold: float = 0.85) -> List[Dict]:
+        """
+        Vectorized end-to-end workforce analysis
+        Runs psychology, attrition and intervention stages for many employees at once;
+        employees whose record cannot be scored get an 'error' entry instead of failing the batch
+        """
+        if not employees:
+            return []
+        
+        feedback_texts = [str(employee.get(feedback_key, '')) for employee in employees]
+        psychological_outputs = self._batch_psychological_outputs(feedback_texts)
+        
+        # Build and validate each employee's matrix separately so one bad record does not sink the batch
+        results: List[Dict] = [{} for _ in employees]
+        matrices: List[Optional[Dict]] = [None for _ in employees]
+        scorable = []
+        for i, (feedback_text, employee) in enumerate(zip(feedback_texts, employees)):
+            try:
+                matrices[i] = self._analyze_employee_state(feedback_text, employee, psychological_outputs[i], False)
+                self._build_attrition_features(matrices[i], employee)
+                scorable.append(i)
+            except Exception as e:
+                results[i] = {'error': f"Processing failed: {str(e)}"}
+        
+        # Gemini prompts for the whole batch at bounded concurrency instead of one employee at a time
+        if include_ai_insights and scorable:
+            self.llm_client.run(self._agenerate_batch_insights(feedback_texts, employees, matrices, scorable))
+        
+        temporal_risks = self.predict_temporal_attrition_risks(
+            [matrices[i] for i in scorable],
+            [employees[i] for i in scorable],
+            prediction_windows
+        )
         
-        # Neural attrition prediction
-        with torch.no_grad():
-            attrition_probs = self.attrition_predictor(torch.FloatTensor([features]))
-            
-        temporal_risks = {}
-        for i, window in enumerate(prediction_windows):
-            temporal_risks[f'{window}_month_risk'] = float(attrition_probs[0][i]) * 100
-        
-        # Advanced risk categorization
-        risk_level = self._categorize_attrition_risk(temporal_risks['3_month_risk'])
+        for i, temporal_risk in zip(scorable, temporal_risks):
+            try:
+                intervention_blueprint = self.engineer_personalized_interventions(
+                    matrices[i],
+                    employees[i],
+                    success_probability_threshold,
+                    include_ai_insights
+                )
+                results[i] = {
+                    'quantum_analysis': matrices[i],
+                    'temporal_risk': temporal_risk,
+                    'intervention_blueprint': intervention_blueprint
+                }
+            except Exception as e:
+                results[i] = {'error': f"Processing failed: {str(e)}"}
         
-        return {
-            **temporal_risks,
-            'overall_risk_level': risk_level,
-            'risk_factors': self._identify_risk_factors(psychological_matrix, employee_data),
-            'protective_factors': self._identify_protective_factors(psychological_matrix, employee_data)
-        }
+        return results
+    
+    async def _agenerate_batch_insights(self, feedback_texts: List[str], employees: List[Dict],
+                                        matrices: List[Optional[Dict]], indices: List[int]):
+        """
+        LLM stage of analyze_workforce_batch, run on the LLM client's loop
+        At most llm_batch_concurrency employees are in flight; in two-call mode both of an employee's prompts go
+        out together. Interventions are left in the profile under 'personalized_interventions', as in single-shot
+        mode, for engineer_personalized_interventions to take out
+        """
+        semaphore = asyncio.Semaphore(self.llm_batch_concurrency)
+        
+        async def timed(stage: str, coroutine):
+            with metrics.stage(stage):
+                return await coroutine
+        
+        async def employee_insights(i: int):
+            matrix, employee = matrices[i], employees[i]
+            async with semaphore:
+                if self.llm_mode == LLM_MODE_SINGLE_SHOT:
+                    profile = await timed('llm_single_shot', self._agenerate_single_shot_assessment(
+                        feedback_texts[i], employee, matrix['psychological_traits']
+                    ))
+                else:
+                    profile, interventions = await asyncio.gather(
+                        timed('llm_psychological_profile',
+                              self._agenerate_quantum_psychological_profile(feedback_texts[i], employee)),
+                        timed('llm_interventions', self._agenerate_ai_interventions(matrix, employee))
+                    )
+                    profile['personalized_interventions'] = interventions
+            matrix['quantum_psychological_profile'] = profile
+        
+        # An employee whose prompts fail keeps the fallback profile from _analyze_employee_state
+        await asyncio.gather(*(employee_insights(i) for i in indices), return_exceptions=True)
     
     def engineer_personalized_interventions(self, psychological_matrix: Dict, employee_data: Dict,
-                                          success_probability_threshold: float = 0.85) -> Dict:
+                                          success_probability_threshold: float = 0.85,
+                                          include_ai_insights: bool = True) -> Dict:
         """
         AI-engineered personalized intervention strategies using quantum optimization
         """
@@ -223,28 +559,42 @@ class QuantumWorkforceIntelligence:
         if engagement_level < 50:
             interventions.extend(self.INTERVENTION_STRATEGIES['poor_engagement'])
         
-        # Generate AI-powered custom interventions
-        custom_interventions = self._generate_ai_interventions(psychological_matrix, employee_data)
-        
-        # Calculate intervention success probability
-        success_probability = self._calculate_intervention_success_probability(
-            psychological_matrix, employee_data, interventions
+        # Single-shot mode and the batch LLM stage deliver interventions inside the profile; take them out so
+        # they are reported once, as strategies, and no second prompt is sent
+        delivered_interventions = psychological_matrix.get('quantum_psychological_profile', {}).pop(
+            'personalized_interventions', None
         )
         
-        return {
-            'strategies': interventions + custom_interventions,
-            'success_probability': success_probability,
-            'priority_areas': self._identify_intervention_priorities(psychological_matrix),
-            'timeline': self._recommend_intervention_timeline(psychological_matrix),
-            'cost_estimate': self._estimate_intervention_costs(interventions),
-            'roi_projection': self._calculate_intervention_roi(employee_data, success_probability)
-        }
+        # Generate AI-powered custom interventions
+        if delivered_interventions is not None:
+            custom_interventions = list(delivered_interventions)
+        elif include_ai_insights:
+            with metrics.stage('llm_interventions'):
+                custom_interventions = self._generate_ai_interventions(psychological_matrix, employee_data)
+        else:
+            custom_interventions = self._fallback_interventions()
+        
+        with metrics.stage('intervention_rules'):
+            # Calculate intervention success probability
+            success_probability = self._calculate_intervention_success_probability(
+                psychological_matrix, employee_data, interventions
+            )
+            
+            return {
+                'strategies': interventions + custom_interventions,
+                'success_probability': success_probability,
+                'priority_areas': self._identify_intervention_priorities(psychological_matrix),
+                'timeline': self._recommend_intervention_timeline(psychological_matrix),
+                'cost_estimate': self._estimate_intervention_costs(interventions),
+                'roi_projection': self._calculate_intervention_roi(employee_data, success_probability)
+            }
     
     def _generate_quantum_psychological_profile(self, feedback_text: str, employee_data: Dict) -> Dict:
         """Generate quantum psychological profile using advanced AI"""
+        return self.llm_client.run(self._agenerate_quantum_psychological_profile(feedback_text, employee_data))
+    
+    async def _agenerate_quantum_psychological_profile(self, feedback_text: str, employee_data: Dict) -> Dict:
         try:
-            model = genai.GenerativeModel('gemini-pro')
-            
             prompt = f"""
             As a revolutionary AI-powered Quantum Organizational Psychologist, analyze this employee feedback and provide a deep neural psychological profile:
 
@@ -269,24 +619,139 @@ class QuantumWorkforceIntelligence:
             Format as JSON with numerical scores (0-100) where applicable.
             """
             
-            response = model.generate_content(prompt)
-            return self._parse_ai_response(response.text)
+            started = time.perf_counter()
+            response_text = await self.llm_client.agenerate(prompt)
+            self._record_llm_latency(LLM_MODE_TWO_CALL, time.perf_counter() - started, new_employee=True)
+            if response_text is None:
+                metrics.inc('quantum_llm_fallbacks_total', stage='psychological_profile', reason='no_response')
+                return self._fallback_psychological_profile()
+            return self._parse_ai_response(response_text)
         
         except Exception as e:
-            return {
-                'big_five': {'openness': 50, 'conscientiousness': 50, 'extraversion': 50, 'agreeableness': 50, 'neuroticism': 50},
-                'communication_style': 'balanced',
-                'work_preferences': 'standard',
-                'stress_response': 'moderate',
-                'leadership_potential': 50,
-                'team_compatibility': 50
-            }
+            metrics.inc('quantum_llm_fallbacks_total', stage='psychological_profile', reason='invalid_response')
+            return self._fallback_psychological_profile()
+    
+    def _generate_single_shot_assessment(self, feedback_text: str, employee_data: Dict,
+                                         psychological_traits: Dict) -> Dict:
+        """
+        Single structured Gemini request for the psychological profile and interventions
+        The interventions ride along in the profile under 'personalized_interventions', fallback ones included,
+        so a failed call is never followed by a second request
+        """
+        return self.llm_client.run(
+            self._agenerate_single_shot_assessment(feedback_text, employee_data, psychological_traits)
+        )
+    
+    async def _agenerate_single_shot_assessment(self, feedback_text: str, employee_data: Dict,
+                                                psychological_traits: Dict) -> Dict:
+        try:
+            prompt = f"""
+            As a revolutionary AI-powered Quantum Organizational Psychologist and HR Specialist, analyze this employee and return a psychological profile together with 3 personalized intervention strategies:
+
+            Employee Background:
+            - Name: {employee_data.get('name', 'Anonymous')}
+            - Department: {employee_data.get('department', 'Unknown')}
+            - Position: {employee_data.get('position', 'Unknown')}
+            - Tenure: {employee_data.get('tenure_years', 0)} years
+            - Performance Score: {employee_data.get('performance_score', 0)}/100
+
+            Neural Psychological Readings:
+            - Stress Level: {psychological_traits['stress_level']}/100
+            - Satisfaction: {psychological_traits['satisfaction_level']}/100
+            - Engagement: {psychological_traits['engagement_level']}/100
+            - Motivation: {psychological_traits['motivation_score']}/100
+
+            Feedback: "{feedback_text}"
+
+            The profile covers Big Five traits, communication style, work preferences, stress response,
+            leadership potential, team compatibility and career development interests (scores 0-100).
+            Each intervention is 1-2 sentences, specific and actionable.
+
+            Respond with only a JSON object matching this schema:
+            {json.dumps(SINGLE_SHOT_RESPONSE_SCHEMA)}
+            """
+            
+            started = time.perf_counter()
+            response_text = await self.llm_client.agenerate(prompt, response_schema=SINGLE_SHOT_RESPONSE_SCHEMA)
+            self._record_llm_latency(LLM_MODE_SINGLE_SHOT, time.perf_counter() - started, new_employee=True)
+            if response_text is None:
+                metrics.inc('quantum_llm_fallbacks_total', stage='single_shot', reason='no_response')
+                return self._fallback_single_shot_profile()
+            
+            parsed = self._validate_single_shot_response(parse_json_object(response_text))
+            profile = dict(parsed['psychological_profile'])
+            profile['personalized_interventions'] = parsed['interventions']
+            return profile
+        
+        except Exception as e:
+            metrics.inc('quantum_llm_fallbacks_total', stage='single_shot', reason='invalid_response')
+            return self._fallback_single_shot_profile()
+    
+    def _validate_single_shot_response(self, response: Optional[Dict]) -> Dict:
+        """Reject single-shot responses that do not match SINGLE_SHOT_RESPONSE_SCHEMA"""
+        if not isinstance(response, dict):
+            raise ValueError("Single-shot response is not a JSON object")
+        
+        profile = response.get('psychological_profile')
+        if not isinstance(profile, dict):
+            raise ValueError("Single-shot response is missing 'psychological_profile'")
+        profile_schema = SINGLE_SHOT_RESPONSE_SCHEMA['properties']['psychological_profile']
+        missing = [key for key in profile_schema['required'] if key not in profile]
+        if missing:
+            raise ValueError(f"Single-shot profile is missing {missing}")
+        if not isinstance(profile['big_five'], dict):
+            raise ValueError("Single-shot 'big_five' is not an object")
+        
+        interventions = response.get('interventions')
+        if not isinstance(interventions, list) or not interventions:
+            raise ValueError("Single-shot response is missing 'interventions'")
+        interventions = [str(intervention).strip() for intervention in interventions if str(intervention).strip()]
+        if not interventions:
+            raise ValueError("Single-shot interventions are empty")
+        
+        return {'psychological_profile': profile, 'interventions': interventions}
+    
+    def _record_llm_latency(self, mode: str, seconds: float, new_employee: bool = False):
+        with self._llm_mode_lock:
+            latency = self._llm_mode_latency[mode]
+            latency['calls'] += 1
+            latency['total_seconds'] += seconds
+            if new_employee:
+                latency['employees'] += 1
+    
+    def get_llm_mode_stats(self) -> Dict:
+        """Per-mode Gemini latency: mean seconds per call and per employee"""
+        with self._llm_mode_lock:
+            stats = {}
+            for mode, latency in self._llm_mode_latency.items():
+                stats[mode] = {
+                    **latency,
+                    'mean_seconds_per_call': latency['total_seconds'] / latency['calls'] if latency['calls'] else 0.0,
+                    'mean_seconds_per_employee': latency['total_seconds'] / latency['employees'] if latency['employees'] else 0.0
+                }
+            return {'active_mode': self.llm_mode, 'modes': stats}
+    
+    def _fallback_psychological_profile(self) -> Dict:
+        """Baseline psychological profile used when the AI profile is unavailable"""
+        return {
+            'big_five': {'openness': 50, 'conscientiousness': 50, 'extraversion': 50, 'agreeableness': 50, 'neuroticism': 50},
+            'communication_style': 'balanced',
+            'work_preferences': 'standard',
+            'stress_response': 'moderate',
+            'leadership_potential': 50,
+            'team_compatibility': 50
+        }
+    
+    def _fallback_single_shot_profile(self) -> Dict:
+        """Baseline profile and interventions used when the single-shot response is unavailable"""
+        return {**self._fallback_psychological_profile(), 'personalized_interventions': self._fallback_interventions()}
     
     def _generate_ai_interventions(self, psychological_matrix: Dict, employee_data: Dict) -> List[str]:
         """Generate AI-powered custom interventions"""
+        return self.llm_client.run(self._agenerate_ai_interventions(psychological_matrix, employee_data))
+    
+    async def _agenerate_ai_interventions(self, psychological_matrix: Dict, employee_data: Dict) -> List[str]:
         try:
-            model = genai.GenerativeModel('gemini-pro')
-            
             prompt = f"""
             As a revolutionary AI-powered Quantum HR Specialist, generate 3 highly personalized intervention strategies for this employee:
 
@@ -306,21 +771,31 @@ class QuantumWorkforceIntelligence:
             Each strategy should be 1-2 sentences and highly specific to their situation.
             """
             
-            response = model.generate_content(prompt)
-            interventions = response.text.strip().split('\n')
+            started = time.perf_counter()
+            response_text = await self.llm_client.agenerate(prompt)
+            self._record_llm_latency(LLM_MODE_TWO_CALL, time.perf_counter() - started)
+            if response_text is None:
+                metrics.inc('quantum_llm_fallbacks_total', stage='interventions', reason='no_response')
+                return self._fallback_interventions()
+            interventions = response_text.strip().split('\n')
             return [intervention.strip('- ').strip() for intervention in interventions if intervention.strip()]
         
         except Exception as e:
-            return [
-                "Provide personalized coaching sessions focused on individual development goals",
-                "Implement flexible work arrangements tailored to personal preferences",
-                "Create specialized project assignments aligned with career interests"
-            ]
+            metrics.inc('quantum_llm_fallbacks_total', stage='interventions', reason='invalid_response')
+            return self._fallback_interventions()
+    
+    def _fallback_interventions(self) -> List[str]:
+        """Baseline interventions used when AI interventions are unavailable"""
+        return [
+            "Provide personalized coaching sessions focused on individual development goals",
+            "Implement flexible work arrangements tailored to personal preferences",
+            "Create specialized project assignments aligned with career interests"
+        ]
     
     # Additional helper methods for neural calculations
     def _predict_performance_trajectory(self, psychological_output: Dict, employee_data: Dict) -> str:
-        engagement = float(psychological_output['engagement_level'][0])
-        motivation = float(psychological_output['motivation_level'][0])
+        engagement = psychological_output['engagement_level']
+        motivation = psychological_output['motivation_level']
         
         score = (engagement + motivation) / 2
         if score > 0.7:
@@ -336,7 +811,7 @@ class QuantumWorkforceIntelligence:
         return min((growth_score + motivation_score) / 2, 100)
     
     def _assess_leadership_potential(self, psychological_output: Dict, employee_data: Dict) -> int:
-        engagement = float(psychological_output['engagement_level'][0]) * 100
+        engagement = psychological_output['engagement_level'] * 100
         performance = employee_data.get('performance_score', 50)
         tenure_bonus = min(employee_data.get('tenure_years', 0) * 5, 20)
         
@@ -352,6 +827,15 @@ class QuantumWorkforceIntelligence:
         else:
             return 'LOW'
     
+    def _categorize_attrition_risks(self, risk_scores: np.ndarray) -> List[str]:
+        """Vectorized counterpart of _categorize_attrition_risk"""
+        risk_scores = np.asarray(risk_scores)
+        return np.select(
+            [risk_scores > 75, risk_scores > 50, risk_scores > 25],
+            ['CRITICAL', 'HIGH', 'MODERATE'],
+            default='LOW'
+        ).tolist()
+    
     def _calculate_intervention_success_probability(self, psychological_matrix: Dict, 
                                                   employee_data: Dict, interventions: List[str]) -> float:
         # Base success rate
@@ -378,14 +862,9 @@ class QuantumWorkforceIntelligence:
     
     def _parse_ai_response(self, response_text: str) -> Dict:
         """Parse AI response into structured data"""
-        try:
-            # Try to extract JSON from the response
-            import re
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-        except:
-            pass
+        parsed = parse_json_object(response_text)
+        if parsed is not None:
+            return parsed
         
         # Return default structure if parsing fails
         return {
@@ -496,27 +975,17 @@ class NeuralTalentAcquisitionIntelligence:
     Neural Intelligence Engine for Competitive Market Analysis
     """
     
-    def __init__(self):
-        self.market_data = {
-            'salary_ranges': {
-                'Junior': (65000, 85000),
-                'Mid-Level': (85000, 120000),
-                'Senior': (120000, 160000),
-                'Lead': (160000, 200000)
-            },
-            'skill_demand': {
-                'Python': 0.9, 'JavaScript': 0.8, 'React': 0.85, 'AWS': 0.88,
-                'Machine Learning': 0.92, 'Docker': 0.75, 'Kubernetes': 0.82
-            }
-        }
+    def __init__(self, taxonomy: Optional[QuantumSkillTaxonomy] = None):
+        self.taxonomy = taxonomy or shared_skill_taxonomy
     
     def analyze_neural_competitive_positioning(self, neural_profile: Dict) -> Dict:
         """Analyze competitive market positioning"""
         skills = neural_profile.get('skills', [])
         experience = neural_profile.get('experience_years', 0)
+        market = self.taxonomy.current()
         
         # Calculate market value index
-        skill_demand_scores = [self.market_data['skill_demand'].get(skill, 0.5) for skill in skills]
+        skill_demand_scores = [market.skill_demand(skill) for skill in skills]
         avg_skill_demand = sum(skill_demand_scores) / len(skill_demand_scores) if skill_demand_scores else 0.5
         market_value_index = min(avg_skill_demand * 100, 100)
         
@@ -552,7 +1021,8 @@ class NeuralTalentAcquisitionIntelligence:
             'quantum_hiring_urgency': urgency,
             'neural_competitive_advantage': advantage,
             'market_positioning': self._get_market_position(market_value_index),
-            'salary_recommendation': self._calculate_salary_recommendation(experience, market_value_index)
+            'scarce_skills': [skill for skill in skills if (market.skill_scarcity(skill) or 0) >= 80],
+            'salary_recommendation': self._calculate_salary_recommendation(experience, market_value_index, market)
         }
     
     def _get_market_position(self, market_value: float) -> str:
@@ -566,7 +1036,8 @@ class NeuralTalentAcquisitionIntelligence:
         else:
             return "Standard market positioning"
     
-    def _calculate_salary_recommendation(self, experience: float, market_value: float) -> Dict:
+    def _calculate_salary_recommendation(self, experience: float, market_value: float,
+                                          market: QuantumTaxonomySnapshot) -> Dict:
         """Calculate salary recommendation based on market analysis"""
         # Determine experience level
         if experience >= 8:
@@ -578,7 +1049,7 @@ class NeuralTalentAcquisitionIntelligence:
         else:
             level = "Junior"
         
-        base_min, base_max = self.market_data['salary_ranges'][level]
+        base_min, base_max = market.salary_range(level)
         
         # Adjust based on market value
         multiplier = 1 + (market_value - 70) / 100  # Baseline at 70
@@ -601,62 +1072,98 @@ class NeuralTalentAcquisitionSystem:
     Implements quantum algorithms for advanced candidate assessment
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, llm_client: Optional[QuantumLLMClient] = None,
+                 taxonomy: Optional[QuantumSkillTaxonomy] = None, encoder_backend: str = None):
         self.api_key = api_key
-        if api_key:
-            genai.configure(api_key=api_key)
+        configure_llm(api_key)
+        self.llm_client = llm_client or shared_llm_client
+        
+        self.embedding_model_name = DEFAULT_EMBEDDING_MODEL
+        self.encoder_backend = encoder_backend or DEFAULT_ENCODER_BACKEND
+        
+        # Skills, aliases and market data come from the hot-reloaded taxonomy file
+        self.taxonomy = taxonomy or shared_skill_taxonomy
+        self.neural_intelligence = NeuralTalentAcquisitionIntelligence(self.taxonomy)
         
-        self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
-        self.neural_intelligence = NeuralTalentAcquisitionIntelligence()
+        self.ACHIEVEMENT_KEYWORDS = [
+            'led', 'managed', 'developed', 'implemented', 'designed', 'created',
+            'improved', 'optimized', 'reduced', 'increased', 'launched', 'delivered'
+        ]
+        
+        # Compiled once; each resume is scanned in a single pass
+        self.achievement_matcher = QuantumPatternMatcher(self.ACHIEVEMENT_KEYWORDS)
+    
+    @property
+    def sentence_model(self):
+        """Process-wide shared sentence model, loaded lazily"""
+        return get_sentence_model(self.embedding_model_name, self.encoder_backend)
     
-    def analyze_candidate_neural_profile(self, resume_text: str, candidate_data: Dict) -> Dict:
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """Embed texts through the persistent embedding store; the transformer only sees unseen texts"""
+        return embedding_store.encode(
+            embedding_key(self.embedding_model_name, self.encoder_backend), texts,
+            lambda missing: self.sentence_model.encode(missing)
+        )
+    
+    def encode_resumes(self, resume_texts: List[str]) -> np.ndarray:
+        """Semantic embeddings for resume texts, one row per resume"""
+        return self._encode_texts(resume_texts)
+    
+    def analyze_candidate_profiles(self, resume_texts: List[str], candidates: List[Dict],
+                                   include_ai_assessment: bool = True) -> List[Dict]:
+        """Batch candidate analysis; a candidate that fails gets {'error': ...} instead of failing the batch"""
+        metrics.observe('quantum_batch_size', len(resume_texts), source='candidate_batch')
+        results = []
+        for resume_text, candidate_data in zip(resume_texts, candidates):
+            try:
+                results.append(self.analyze_candidate_neural_profile(resume_text, candidate_data, include_ai_assessment))
+            except Exception as e:
+                results.append({'error': f"Processing failed: {str(e)}"})
+        return results
+    
+    def analyze_candidate_neural_profile(self, resume_text: str, candidate_data: Dict,
+                                         include_ai_assessment: bool = True) -> Dict:
         """Revolutionary neural candidate profile analysis"""
         
         # Extract skills using neural pattern recognition
-        skills = self._extract_neural_skills(resume_text)
+        with metrics.stage('skill_extraction'):
+            skills = self._extract_neural_skills(resume_text)
         
         # Calculate experience using quantum algorithms
-        experience_years = self._calculate_neural_experience(resume_text, candidate_data)
+        with metrics.stage('experience_extraction'):
+            experience_years = self._calculate_neural_experience(resume_text, candidate_data)
+            achievements = self._extract_achievements(resume_text)
         
         # Generate neural competitive analysis
         neural_profile = {
             'skills': skills,
             'experience_years': experience_years,
             'education': candidate_data.get('education', ''),
-            'achievements': self._extract_achievements(resume_text)
+            'achievements': achievements
         }
         
-        competitive_analysis = self.neural_intelligence.analyze_neural_competitive_positioning(neural_profile)
+        with metrics.stage('competitive_analysis'):
+            competitive_analysis = self.neural_intelligence.analyze_neural_competitive_positioning(neural_profile)
         
         # Generate AI-powered candidate assessment
-        ai_assessment = self._generate_ai_candidate_assessment(resume_text, neural_profile)
+        if include_ai_assessment:
+            with metrics.stage('llm_candidate_assessment'):
+                ai_assessment = self._generate_ai_candidate_assessment(resume_text, neural_profile)
+        else:
+            ai_assessment = self._fallback_candidate_assessment()
         
-        return {
-            'neural_profile': neural_profile,
-            'competitive_analysis': competitive_analysis,
-            'ai_assessment': ai_assessment,
-            'quantum_scores': self._calculate_quantum_scores(neural_profile, competitive_analysis),
-            'hiring_recommendation': self._generate_hiring_recommendation(competitive_analysis, ai_assessment)
-        }
+        with metrics.stage('candidate_scoring'):
+            return {
+                'neural_profile': neural_profile,
+                'competitive_analysis': competitive_analysis,
+                'ai_assessment': ai_assessment,
+                'quantum_scores': self._calculate_quantum_scores(neural_profile, competitive_analysis),
+                'hiring_recommendation': self._generate_hiring_recommendation(competitive_analysis, ai_assessment)
+            }
     
     def _extract_neural_skills(self, resume_text: str) -> List[str]:
         """Extract skills using neural pattern recognition"""
-        technical_skills = [
-            'Python', 'JavaScript', 'React', 'Node.js', 'Java', 'C++', 'SQL', 'MongoDB',
-            'AWS', 'Docker', 'Kubernetes', 'Git', 'Machine Learning', 'Data Science',
-            'TensorFlow', 'PyTorch', 'Pandas', 'NumPy', 'Django', 'Flask', 'Vue.js',
-            'Angular', 'TypeScript', 'HTML', 'CSS', 'DevOps', 'CI/CD', 'Jenkins',
-            'Terraform', 'Ansible', 'Linux', 'Cybersecurity', 'Blockchain', 'AI/ML'
-        ]
-        
-        found_skills = []
-        resume_lower = resume_text.lower()
-        
-        for skill in technical_skills:
-            if skill.lower() in resume_lower:
-                found_skills.append(skill)
-        
-        return found_skills
+        return self.taxonomy.current().extract_skills(resume_text)
     
     def _calculate_neural_experience(self, resume_text: str, candidate_data: Dict) -> int:
         """Calculate experience using quantum algorithms"""
@@ -675,26 +1182,24 @@ class NeuralTalentAcquisitionSystem:
     
     def _extract_achievements(self, resume_text: str) -> List[str]:
         """Extract achievements using neural analysis"""
-        achievement_keywords = [
-            'led', 'managed', 'developed', 'implemented', 'designed', 'created',
-            'improved', 'optimized', 'reduced', 'increased', 'launched', 'delivered'
-        ]
-        
         sentences = resume_text.split('.')
-        achievements = []
         
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in achievement_keywords):
-                if len(sentence.strip()) > 20:  # Filter out short fragments
-                    achievements.append(sentence.strip())
+        # One keyword scan over the whole resume, then map each hit to the sentence it falls in
+        sentence_ends = list(itertools.accumulate(len(sentence) + 1 for sentence in resume_text.lower().split('.')))
+        matched_sentences = sorted({
+            bisect.bisect_right(sentence_ends, start) for _, start, _ in self.achievement_matcher.finditer(resume_text)
+        })
+        
+        achievements = []
+        for index in matched_sentences:
+            if len(sentences[index].strip()) > 20:  # Filter out short fragments
+                achievements.append(sentences[index].strip())
         
         return achievements[:5]  # Return top 5 achievements
     
     def _generate_ai_candidate_assessment(self, resume_text: str, neural_profile: Dict) -> Dict:
         """Generate AI-powered candidate assessment"""
         try:
-            model = genai.GenerativeModel('gemini-pro')
-            
             prompt = f"""
             As a revolutionary AI-powered Quantum Technical Recruitment Specialist, analyze this candidate's resume:
 
@@ -717,19 +1222,27 @@ class NeuralTalentAcquisitionSystem:
             Format as JSON with numerical scores where applicable.
             """
             
-            response = model.generate_content(prompt)
-            return self._parse_ai_response(response.text)
+            response_text = self.llm_client.generate(prompt)
+            if response_text is None:
+                metrics.inc('quantum_llm_fallbacks_total', stage='candidate_assessment', reason='no_response')
+                return self._fallback_candidate_assessment()
+            return self._parse_ai_response(response_text)
         
         except Exception as e:
-            return {
-                'technical_competency': 75,
-                'cultural_fit': 70,
-                'growth_trajectory': 'positive',
-                'leadership_potential': 65,
-                'innovation_capability': 70,
-                'team_collaboration': 75,
-                'overall_recommendation': 'consider'
-            }
+            metrics.inc('quantum_llm_fallbacks_total', stage='candidate_assessment', reason='invalid_response')
+            return self._fallback_candidate_assessment()
+    
+    def _fallback_candidate_assessment(self) -> Dict:
+        """Baseline candidate assessment used when the AI assessment is unavailable"""
+        return {
+            'technical_competency': 75,
+            'cultural_fit': 70,
+            'growth_trajectory': 'positive',
+            'leadership_potential': 65,
+            'innovation_capability': 70,
+            'team_collaboration': 75,
+            'overall_recommendation': 'consider'
+        }
     
     def _calculate_quantum_scores(self, neural_profile: Dict, competitive_analysis: Dict) -> Dict:
         """Calculate quantum scoring metrics"""
@@ -848,13 +1361,9 @@ class NeuralTalentAcquisitionSystem:
     
     def _parse_ai_response(self, response_text: str) -> Dict:
         """Parse AI response into structured data"""
-        try:
-            import re
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-        except:
-            pass
+        parsed = parse_json_object(response_text)
+        if parsed is not None:
+            return parsed
         
         return {
             'technical_competency': 75,
@@ -0,0 +1,65 @@
+# Quantum Pattern Matcher
+# Precompiled multi-term matcher: one linear scan finds every taxonomy term in a text
+
+import re
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Union
+
+# Terms only match as whole words: no letter directly before or after the hit, so "Java" skips
+# "JavaScript" and "led" skips "skilled", while "HTML5" and "Python3" still count
+_WORD_BEFORE = r'(?<![a-z])'
+_WORD_AFTER = r'(?![a-z])'
+
+_TERM_END = ''
+
+
+def _trie_pattern(node: Dict) -> str:
+    """Regex for a character trie; shared prefixes are factored so the engine never backtracks across terms"""
+    optional = _TERM_END in node
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char != _TERM_END]
+
+    if not branches:
+        return ''
+    if optional:
+        return f"(?:{'|'.join(branches)})?"
+    return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+
+class QuantumPatternMatcher:
+    """
+    Aho-Corasick-style matcher compiled to a single trie-shaped regex
+    terms is a list of terms or a {term: canonical} mapping (aliases); matching is case-insensitive
+    and word-boundary aware, and every method scans the text once
+    """
+
+    def __init__(self, terms: Union[Iterable[str], Dict[str, str]]):
+        if not isinstance(terms, dict):
+            terms = {term: term for term in terms}
+        self.canonical = {term.lower().strip(): canonical for term, canonical in terms.items() if term.strip()}
+
+        trie: Dict = {}
+        for term in self.canonical:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[_TERM_END] = {}
+
+        self._regex = re.compile(_WORD_BEFORE + _trie_pattern(trie) + _WORD_AFTER) if trie else None
+
+    def __len__(self) -> int:
+        return len(self.canonical)
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """Yield (canonical term, start, end) for each non-overlapping hit, longest term first"""
+        if self._regex is None or not text:
+            return
+        for match in self._regex.finditer(text.lower()):
+            yield self.canonical[match.group()], match.start(), match.end()
+
+    def find_terms(self, text: str) -> Set[str]:
+        """Distinct canonical terms present in the text"""
+        return {canonical for canonical, _, _ in self.finditer(text)}
+
+    def find_ordered(self, text: str, ordering: List[str]) -> List[str]:
+        """Canonical terms present in the text, in the order given (e.g. taxonomy order)"""
+        found = self.find_terms(text)
+        return [term for term in ordering if term in found]
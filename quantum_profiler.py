@@ -0,0 +1,144 @@
+# Quantum Sampling Profiler
+# Time-boxed, low-overhead stack sampling of the running API process, exported as collapsed stacks
+#
+# Usage:
+#   curl -H "X-Quantum-Admin-Token: $QUANTUM_ADMIN_TOKEN" \
+#        "http://localhost:8000/admin/profile?seconds=60" > quantum.collapsed
+#   flamegraph.pl quantum.collapsed > quantum.svg   (or load the file in speedscope)
+
+import os
+import sys
+import time
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+DEFAULT_FOCUS = 'quantum_neural_architecture'
+
+
+class QuantumProfilerBusy(RuntimeError):
+    """Raised when a profile is requested while another one is running"""
+
+
+class QuantumProfileSession:
+    """
+    One sampling run
+    The sampler thread only snapshots code objects and counts identical stacks; labels, the focus filter
+    and formatting are applied once at the end, which keeps the per-sample cost to a few microseconds
+    """
+
+    def __init__(self, seconds: float, interval_seconds: float, focus: str):
+        self.seconds = seconds
+        self.interval_seconds = interval_seconds
+        self.focus = focus
+        self.started_at = time.time()
+        self.elapsed_seconds = None
+        self.samples = 0
+        self.sampling_seconds = 0.0
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_loop, name='quantum-profiler', daemon=True)
+
+    def _sample_loop(self):
+        own_ident = threading.get_ident()
+        thread_names: Dict[int, str] = {}
+        deadline = time.perf_counter() + self.seconds
+        while not self._stop.wait(self.interval_seconds) and time.perf_counter() < deadline:
+            started = time.perf_counter()
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                if ident not in thread_names:
+                    thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+                codes = []
+                while frame is not None:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                self._stacks[(thread_names.get(ident, 'thread'), tuple(codes))] += 1
+            self.samples += 1
+            self.sampling_seconds += time.perf_counter() - started
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.elapsed_seconds = time.time() - self.started_at
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's collapsed format: 'thread;outer;...;leaf count' per line, root first"""
+        labels: Dict = {}
+        totals: Counter = Counter()
+        for (thread_name, codes), count in self._stacks.items():
+            frames = []
+            for code in reversed(codes):
+                label = labels.get(code)
+                if label is None:
+                    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+                    label = labels[code] = f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+                frames.append(label)
+            if self.focus and not any(label.startswith(self.focus + ':') for label in frames):
+                continue
+            # Pool threads are numbered (quantum-inference_3); merge them into one root per pool
+            root = thread_name.rstrip('0123456789').rstrip('_-') or thread_name
+            totals[';'.join([root] + frames).replace(' ', '_')] += count
+        return ''.join(f"{stack} {count}\n" for stack, count in sorted(totals.items()))
+
+    def summary(self) -> Dict:
+        elapsed = self.elapsed_seconds if self.elapsed_seconds is not None else time.time() - self.started_at
+        return {
+            'seconds': round(elapsed, 3),
+            'interval_ms': self.interval_seconds * 1000,
+            'focus': self.focus or None,
+            'samples': self.samples,
+            'distinct_stacks': len(self._stacks),
+            # Share of one core spent walking stacks (the sampler holds the GIL while it does)
+            'overhead_percent': round(100 * self.sampling_seconds / elapsed, 3) if elapsed > 0 else 0.0
+        }
+
+
+class QuantumSamplingProfiler:
+    """
+    On-demand profiler for the current process; one session at a time
+    Only threads of this process are visible: in process executor mode the inference workers are separate
+    processes, so profile with QUANTUM_EXECUTOR_MODE=thread to see the model code paths
+    """
+
+    def __init__(self, default_interval_ms: float = None, max_seconds: float = None):
+        self.default_interval_ms = default_interval_ms or float(os.getenv('QUANTUM_PROFILER_INTERVAL_MS', '10'))
+        self.max_seconds = max_seconds or float(os.getenv('QUANTUM_PROFILER_MAX_SECONDS', '300'))
+        self._lock = threading.Lock()
+        self._session: Optional[QuantumProfileSession] = None
+        self.last_summary: Optional[Dict] = None
+
+    def start(self, seconds: float, interval_ms: float = None, focus: str = DEFAULT_FOCUS) -> QuantumProfileSession:
+        interval_ms = max(1.0, interval_ms or self.default_interval_ms)
+        if seconds <= 0 or seconds > self.max_seconds:
+            raise ValueError(f"seconds must be between 0 and {self.max_seconds:g}")
+        with self._lock:
+            if self._session is not None:
+                raise QuantumProfilerBusy("A profile is already running")
+            session = self._session = QuantumProfileSession(seconds, interval_ms / 1000, focus)
+        session.start()
+        return session
+
+    def stop(self, session: QuantumProfileSession) -> str:
+        session.stop()
+        with self._lock:
+            if self._session is session:
+                self._session = None
+            self.last_summary = session.summary()
+        return session.collapsed()
+
+    def get_stats(self) -> Dict:
+        return {
+            'running': self._session is not None,
+            'default_interval_ms': self.default_interval_ms,
+            'max_seconds': self.max_seconds,
+            'last_profile': self.last_summary
+        }
+
+
+# Shared profiler for the whole process
+profiler = QuantumSamplingProfiler()
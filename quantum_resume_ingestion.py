@@ -0,0 +1,368 @@
+# Quantum Bulk Resume Ingestion
+# Multi-file / ZIP resume ingestion: spool, dedupe by content hash, extract and analyze in bounded chunks, store, rank
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import tempfile
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List
+
+from starlette.concurrency import run_in_threadpool
+
+from quantum_document_extraction import (
+    SUPPORTED_EXTENSIONS, DocumentExtractionError, spool_directory, spool_upload, upload_limits
+)
+
+logger = logging.getLogger("QuantumHR-ResumeIngestion")
+
+DEFAULT_RESUME_DB = os.path.join('.quantum_cache', 'resumes.sqlite3')
+
+# Bytes copied per read when unpacking archive members
+_MEMBER_CHUNK_BYTES = 1024 * 1024
+
+
+class QuantumResumeStore:
+    """SQLite store of ingested resumes keyed by the sha256 of the uploaded file"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or os.getenv('QUANTUM_RESUME_DB', DEFAULT_RESUME_DB)
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS resumes (
+                    content_hash TEXT PRIMARY KEY,
+                    candidate_id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    final_score REAL NOT NULL,
+                    decision TEXT,
+                    skills TEXT NOT NULL,
+                    analysis TEXT NOT NULL,
+                    ingested_at TEXT NOT NULL
+                )
+            """)
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=30)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    @staticmethod
+    def _summary(row: sqlite3.Row) -> Dict:
+        return {
+            'content_hash': row['content_hash'],
+            'candidate_id': row['candidate_id'],
+            'name': row['name'],
+            'filename': row['filename'],
+            'final_score': row['final_score'],
+            'decision': row['decision'],
+            'skills': json.loads(row['skills']),
+            'ingested_at': row['ingested_at']
+        }
+
+    def get_many(self, content_hashes: List[str]) -> Dict[str, Dict]:
+        found = {}
+        with self._connect() as db:
+            for start in range(0, len(content_hashes), 500):
+                batch = content_hashes[start:start + 500]
+                rows = db.execute(
+                    f"SELECT * FROM resumes WHERE content_hash IN ({', '.join('?' * len(batch))})", batch
+                ).fetchall()
+                found.update((row['content_hash'], self._summary(row)) for row in rows)
+        return found
+
+    def get(self, content_hash: str) -> Dict:
+        with self._connect() as db:
+            row = db.execute("SELECT * FROM resumes WHERE content_hash = ?", (content_hash,)).fetchone()
+        if row is None:
+            return None
+        return {**self._summary(row), 'analysis': json.loads(row['analysis'])}
+
+    def put_many(self, records: List[Dict]):
+        with self._connect() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO resumes (content_hash, candidate_id, name, filename, final_score, decision, "
+                "skills, analysis, ingested_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(
+                    record['content_hash'], record['candidate_id'], record['name'], record['filename'],
+                    record['final_score'], record['decision'], json.dumps(record['skills']),
+                    json.dumps(record['analysis'], default=str), record['ingested_at']
+                ) for record in records]
+            )
+
+    def count(self) -> int:
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+
+def _spool_archive_members(archive_path: str, max_bytes: int, max_files: int) -> Dict:
+    """
+    Unpack supported members of a ZIP into spool files, hashing as they are copied
+    Declared sizes are checked first and actual bytes are capped too, so a lying header cannot inflate a member
+    """
+    documents, rejected = [], []
+    try:
+        _unpack_members(archive_path, max_bytes, max_files, documents, rejected)
+    except BaseException:
+        for document in documents:
+            os.remove(document['path'])
+        raise
+    return {'documents': documents, 'rejected': rejected}
+
+
+def _unpack_members(archive_path: str, max_bytes: int, max_files: int, documents: List, rejected: List):
+    with zipfile.ZipFile(archive_path) as archive:
+        for info in archive.infolist():
+            name = info.filename
+            basename = os.path.basename(name)
+            if info.is_dir() or not basename or basename.startswith('.') or name.startswith('__MACOSX/'):
+                continue
+            extension = os.path.splitext(basename)[1].lower()
+            if extension not in SUPPORTED_EXTENSIONS:
+                rejected.append({'filename': name, 'error': f"Unsupported resume format '{extension}'"})
+                continue
+            if len(documents) >= max_files:
+                rejected.append({'filename': name, 'error': f"Archive exceeds the {max_files} file limit"})
+                continue
+            if info.file_size > max_bytes:
+                rejected.append({'filename': name, 'error': f"File exceeds the {max_bytes} byte limit"})
+                continue
+
+            fd, path = tempfile.mkstemp(suffix=extension, prefix='quantum-upload-', dir=spool_directory())
+            digest = hashlib.sha256()
+            size = 0
+            try:
+                with os.fdopen(fd, 'wb') as spool, archive.open(info) as member:
+                    while size <= max_bytes:
+                        chunk = member.read(_MEMBER_CHUNK_BYTES)
+                        if not chunk:
+                            break
+                        size += len(chunk)
+                        spool.write(chunk)
+                        digest.update(chunk)
+            except BaseException:
+                os.remove(path)
+                raise
+            if size > max_bytes:
+                os.remove(path)
+                rejected.append({'filename': name, 'error': f"File exceeds the {max_bytes} byte limit"})
+                continue
+            documents.append({'filename': name, 'path': path, 'size_bytes': size, 'content_hash': digest.hexdigest()})
+
+
+def _remove_spooled(documents: List[Dict]):
+    for document in documents:
+        if os.path.exists(document['path']):
+            os.remove(document['path'])
+
+
+class QuantumBulkResumeIngestor:
+    """
+    Bulk resume pipeline on the inference executor
+    Files are spooled and deduplicated by content hash (within the upload and against the store). Each chunk
+    is then extracted, analyzed, embedded and written to the resume store and the candidate index before its
+    texts are dropped; at most max_concurrent_chunks chunks are in flight, which bounds the text held in memory
+    """
+
+    def __init__(self, executor, store: QuantumResumeStore, candidate_index=None, analysis_store=None,
+                 chunk_size: int = None, max_files: int = None, max_archive_bytes: int = None,
+                 max_concurrent_chunks: int = None):
+        self.executor = executor
+        self.store = store
+        self.candidate_index = candidate_index
+        self.analysis_store = analysis_store
+        self.chunk_size = chunk_size or int(os.getenv('QUANTUM_BULK_CHUNK_SIZE', '64'))
+        self.max_files = max_files or int(os.getenv('QUANTUM_BULK_MAX_FILES', '5000'))
+        self.max_archive_bytes = max_archive_bytes or int(os.getenv('QUANTUM_BULK_MAX_ARCHIVE_BYTES', str(512 * 1024 * 1024)))
+        # Two chunks keep the pool busy: one extracting while the other is analyzed
+        self.max_concurrent_chunks = max_concurrent_chunks or int(os.getenv('QUANTUM_BULK_CONCURRENT_CHUNKS', '2'))
+
+    async def _spool_uploads(self, uploads, limits: Dict) -> Dict:
+        documents, rejected = [], []
+        try:
+            for upload in uploads:
+                if len(documents) >= self.max_files:
+                    rejected.append({'filename': upload.filename, 'error': f"Upload exceeds the {self.max_files} file limit"})
+                    continue
+                try:
+                    if (upload.filename or '').lower().endswith('.zip'):
+                        archive = await spool_upload(upload, self.max_archive_bytes, ('.zip',))
+                        try:
+                            unpacked = await run_in_threadpool(
+                                _spool_archive_members, archive['path'], limits['max_bytes'],
+                                self.max_files - len(documents)
+                            )
+                        finally:
+                            os.remove(archive['path'])
+                        documents.extend(unpacked['documents'])
+                        rejected.extend(unpacked['rejected'])
+                    else:
+                        spooled = await spool_upload(upload, limits['max_bytes'])
+                        documents.append({'filename': upload.filename, **spooled})
+                except (DocumentExtractionError, zipfile.BadZipFile) as e:
+                    rejected.append({'filename': upload.filename, 'error': str(e)})
+        except BaseException:
+            # A failure partway (disk full, client disconnect) must not leak the files spooled so far
+            _remove_spooled(documents)
+            raise
+        return {'documents': documents, 'rejected': rejected}
+
+    async def ingest(self, uploads, include_ai_assessment: bool = False, top_n: int = 100) -> Dict:
+        started = time.perf_counter()
+        limits = upload_limits()
+        spooled = await self._spool_uploads(uploads, limits)
+        documents, rejected = spooled['documents'], spooled['rejected']
+        files_received = len(documents) + len(rejected)
+
+        try:
+            # Dedupe within this upload, then against everything ingested before
+            unique, duplicates = {}, 0
+            for document in documents:
+                if document['content_hash'] in unique:
+                    duplicates += 1
+                else:
+                    unique[document['content_hash']] = document
+            stored = await run_in_threadpool(self.store.get_many, list(unique))
+            pending = [document for content_hash, document in unique.items() if content_hash not in stored]
+
+            semaphore = asyncio.Semaphore(self.max_concurrent_chunks)
+            chunks = [pending[start:start + self.chunk_size] for start in range(0, len(pending), self.chunk_size)]
+            # A failed chunk must not fail its siblings, nor leave them running while their spool files are removed
+            chunk_results = await asyncio.gather(*[
+                self._process_chunk(chunk, limits, include_ai_assessment, semaphore) for chunk in chunks
+            ], return_exceptions=True)
+        finally:
+            _remove_spooled(documents)
+
+        summaries = []
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, Exception):
+                logger.error(f"Bulk ingestion chunk failed: {str(chunk_result)}")
+                rejected.extend({'filename': document['filename'], 'error': str(chunk_result)} for document in chunk)
+                continue
+            chunk_summaries, chunk_rejected = chunk_result
+            summaries.extend(chunk_summaries)
+            rejected.extend(chunk_rejected)
+
+        elapsed = time.perf_counter() - started
+        ranking = sorted(
+            summaries +
+            [{**summary, 'previously_ingested': True} for summary in stored.values()],
+            key=lambda record: record['final_score'], reverse=True
+        )
+        return {
+            'ingestion_summary': {
+                'files_received': files_received,
+                'unique_documents': len(unique),
+                'duplicates_in_upload': duplicates,
+                'previously_ingested': len(stored),
+                'analyzed': len(summaries),
+                'rejected': len(rejected),
+                'ai_assessment': include_ai_assessment,
+                'elapsed_seconds': round(elapsed, 3),
+                'resumes_per_minute': round(len(summaries) / elapsed * 60, 1) if elapsed > 0 else 0.0,
+                'processing_timestamp': datetime.now().isoformat()
+            },
+            'ranking': [{'rank': rank, **record} for rank, record in enumerate(ranking[:top_n], start=1)],
+            'rejected': rejected
+        }
+
+    async def _process_chunk(self, documents: List[Dict], limits: Dict, include_ai_assessment: bool,
+                             semaphore: asyncio.Semaphore):
+        """Extract, analyze and store one chunk; only the record summaries outlive it"""
+        async with semaphore:
+            # Text extraction fans out across the worker pool
+            extractions = await asyncio.gather(*[
+                self.executor.run(
+                    'document_extraction', document['path'], document['filename'], limits['max_pages'], limits['max_chars']
+                )
+                for document in documents
+            ], return_exceptions=True)
+            _remove_spooled(documents)
+
+            extracted, rejected = [], []
+            for document, extraction in zip(documents, extractions):
+                if isinstance(extraction, Exception):
+                    rejected.append({'filename': document['filename'], 'error': str(extraction)})
+                else:
+                    extracted.append((document, extraction['text']))
+            del extractions
+            if not extracted:
+                return [], rejected
+
+            records, analysis_rejected = await self._analyze_chunk(extracted, include_ai_assessment)
+            # The resume store is the dedupe record, so it is written last: a chunk that fails before this point
+            # is processed again in full when the upload is retried
+            if records:
+                await run_in_threadpool(self.store.put_many, records)
+            summaries = [{key: value for key, value in record.items() if key != 'analysis'} for record in records]
+            return summaries, rejected + analysis_rejected
+
+    async def _analyze_chunk(self, chunk: List, include_ai_assessment: bool):
+        texts = [text for _, text in chunk]
+        candidates = [{
+            'candidate_id': document['content_hash'][:16],
+            'name': os.path.splitext(os.path.basename(document['filename']))[0],
+            'filename': document['filename']
+        } for document, _ in chunk]
+
+        analyses, vectors = await asyncio.gather(
+            self.executor.run('candidate_batch', texts, candidates, include_ai_assessment),
+            self.executor.run('resume_embeddings', texts)
+        )
+
+        now = datetime.now().isoformat()
+        records, rejected, indexed = [], [], []
+        for position, ((document, _), candidate, analysis) in enumerate(zip(chunk, candidates, analyses)):
+            if 'error' in analysis:
+                rejected.append({'filename': document['filename'], 'error': analysis['error']})
+                continue
+            records.append({
+                'content_hash': document['content_hash'],
+                'candidate_id': candidate['candidate_id'],
+                'name': candidate['name'],
+                'filename': document['filename'],
+                'final_score': float(analysis['quantum_scores']['quantum_final_score']),
+                'decision': analysis['hiring_recommendation']['decision'],
+                'skills': analysis['neural_profile']['skills'],
+                'analysis': analysis,
+                'ingested_at': now
+            })
+            indexed.append(position)
+
+        if self.analysis_store is not None and indexed:
+            try:
+                await run_in_threadpool(
+                    self.analysis_store.record_candidate_analyses,
+                    [candidates[i] for i in indexed], [analyses[i] for i in indexed], 'bulk_resume_ingestion'
+                )
+            except Exception as e:
+                # Storage failures never fail the ingestion (same as the API's record_candidate_analyses)
+                logger.warning(f"Recording ingested candidate analyses failed: {str(e)}")
+        if self.candidate_index is not None and indexed:
+            try:
+                await run_in_threadpool(
+                    self.candidate_index.add,
+                    [candidates[i]['candidate_id'] for i in indexed],
+                    vectors[indexed],
+                    [{'name': candidates[i]['name'], 'skills': analyses[i]['neural_profile']['skills']} for i in indexed]
+                )
+            except Exception as e:
+                # Same policy as the analysis store: the analyses stand even if the search index misses them
+                logger.warning(f"Indexing ingested candidates failed: {str(e)}")
+        return records, rejected
@@ -0,0 +1,147 @@
+# Quantum Skill Taxonomy
+# Single file-backed skill taxonomy and market index (aliases, demand, scarcity, salary ranges) with hot reload
+
+import os
+import json
+import time
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from quantum_pattern_matcher import QuantumPatternMatcher
+
+logger = logging.getLogger("QuantumHR-Taxonomy")
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_data', 'market_intelligence.json')
+
+DEFAULT_SKILL_DEMAND = 0.5
+
+# Salary bands used for any experience level the taxonomy file does not list
+DEFAULT_SALARY_RANGES = {
+    'Junior': (65000, 85000),
+    'Mid-Level': (85000, 120000),
+    'Senior': (120000, 160000),
+    'Lead': (160000, 200000)
+}
+
+
+class QuantumTaxonomySnapshot:
+    """Immutable view of one taxonomy file version with precomputed lookups"""
+
+    def __init__(self, data: Dict, version: str):
+        self.version = version
+        self.skills: List[str] = list(data.get('skills', {}))
+
+        aliases = {}
+        self.demand: Dict[str, float] = {}
+        self.scarcity: Dict[str, float] = {}
+        for skill, entry in data.get('skills', {}).items():
+            aliases[skill] = skill
+            for alias in entry.get('aliases', []):
+                aliases[alias] = skill
+            if 'demand' in entry:
+                self.demand[skill] = float(entry['demand'])
+            if 'scarcity' in entry:
+                self.scarcity[skill] = float(entry['scarcity'])
+
+        self.salary_ranges: Dict[str, Tuple[int, int]] = {
+            level: tuple(bounds) for level, bounds in data.get('salary_ranges', {}).items()
+        }
+        self.matcher = QuantumPatternMatcher(aliases)
+
+    def extract_skills(self, text: str) -> List[str]:
+        """Canonical skills mentioned in the text (by name or alias), in taxonomy order"""
+        return self.matcher.find_ordered(text, self.skills)
+
+    def skill_demand(self, skill: str) -> float:
+        return self.demand.get(skill, DEFAULT_SKILL_DEMAND)
+
+    def skill_scarcity(self, skill: str) -> Optional[float]:
+        return self.scarcity.get(skill)
+
+    def salary_range(self, level: str) -> Tuple[int, int]:
+        return self.salary_ranges.get(level, DEFAULT_SALARY_RANGES[level])
+
+
+class QuantumSkillTaxonomy:
+    """
+    Hot-reloading taxonomy loader
+    current() re-stats the file at most every reload_interval seconds and swaps in a rebuilt snapshot
+    when it changed; a file that fails to parse keeps the previous snapshot serving
+    """
+
+    def __init__(self, path: str = None, reload_interval: float = None):
+        self.path = path or os.getenv('QUANTUM_TAXONOMY_PATH', DEFAULT_TAXONOMY_PATH)
+        self.reload_interval = reload_interval if reload_interval is not None else float(
+            os.getenv('QUANTUM_TAXONOMY_RELOAD_SECONDS', '2')
+        )
+        self._lock = threading.Lock()
+        self._snapshot: Optional[QuantumTaxonomySnapshot] = None
+        self._file_signature = None
+        self._next_check = 0.0
+        self._reloads = 0
+        self._reload_errors = 0
+        self._loaded_at = None
+
+    def current(self) -> QuantumTaxonomySnapshot:
+        if self._snapshot is None or time.monotonic() >= self._next_check:
+            self._check_for_changes()
+        return self._snapshot
+
+    def reload(self) -> QuantumTaxonomySnapshot:
+        """Force a reload regardless of the file signature"""
+        with self._lock:
+            self._file_signature = None
+        self._next_check = 0.0
+        return self.current()
+
+    def _check_for_changes(self):
+        with self._lock:
+            if self._snapshot is not None and time.monotonic() < self._next_check:
+                return
+            self._next_check = time.monotonic() + self.reload_interval
+
+            try:
+                stat = os.stat(self.path)
+            except OSError:
+                if self._snapshot is None:
+                    raise
+                return  # mid-replace; try again on the next check
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature == self._file_signature:
+                return
+
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    snapshot = QuantumTaxonomySnapshot(json.load(f), version=f"{stat.st_mtime_ns}-{stat.st_size}")
+            except (ValueError, TypeError, AttributeError) as e:
+                if self._snapshot is None:
+                    raise
+                self._reload_errors += 1
+                self._file_signature = signature  # don't re-parse the same broken file every check
+                logger.warning(f"Taxonomy reload failed, keeping version {self._snapshot.version}: {str(e)}")
+                return
+
+            if self._snapshot is not None:
+                self._reloads += 1
+                logger.info(f"Reloaded skill taxonomy from {self.path}: {len(snapshot.skills)} skills")
+            self._snapshot = snapshot
+            self._file_signature = signature
+            self._loaded_at = datetime.now().isoformat()
+
+    def get_stats(self) -> Dict:
+        snapshot = self.current()
+        return {
+            'path': self.path,
+            'version': snapshot.version,
+            'skills': len(snapshot.skills),
+            'aliases': len(snapshot.matcher) - len(snapshot.skills),
+            'loaded_at': self._loaded_at,
+            'reloads': self._reloads,
+            'reload_errors': self._reload_errors
+        }
+
+
+# Shared taxonomy for the talent systems
+skill_taxonomy = QuantumSkillTaxonomy()